@@ -4,6 +4,7 @@ KERI
 keri.app.agenting module
 
 """
+import datetime
 import random
 from urllib.parse import urlparse, urljoin
 
@@ -20,12 +21,30 @@ from .. import kering
 from ..core import eventing, parsing, coring, serdering
 from ..core.coring import CtrDex
 from ..db import dbing
+from ..help import helping
 from ..kering import Roles
 
 logger = help.ogler.getLogger()
 
 
 class Receiptor(doing.DoDoer):
+    """
+    Gathers receipts for own events from witnesses using the synchronous
+    witness API. Submits to all witnesses concurrently and returns as soon as
+    the witness threshold (toad) of receipts is gathered and propagated.
+    Receipts from the remaining witnesses are gathered and propagated in the
+    background so callers that stop the Receiptor once done must first wait
+    on .settle. Idle witness clients are reused across events.
+
+    Class Attributes:
+        Timeout (float): seconds to wait on a witness response before giving up
+
+    Attributes:
+        clients (dict): idle (client, clientDoer) keyed by witness prefix
+        straggling (int): number of events with witnesses still being
+            finished in the background
+    """
+    Timeout = 10.0
 
     def __init__(self, hby, msgs=None, gets=None, cues=None):
 
@@ -33,6 +52,8 @@ class Receiptor(doing.DoDoer):
         self.gets = gets if gets is not None else decking.Deck()
         self.cues = cues if cues is not None else decking.Deck()
         self.clienter = httping.Clienter()
+        self.clients = dict()
+        self.straggling = 0
 
         doers = [self.clienter, doing.doify(self.witDo), doing.doify(self.gitDo)]
         self.hby = hby
@@ -42,8 +63,11 @@ class Receiptor(doing.DoDoer):
     def receipt(self, pre, sn=None):
         """ Returns a generator for witness receipting
 
-        The returns a generator that will submit the designated event to witnesses for receipts using
-        the synchronous witness API, the propogate the receipts to each of the other witnesses.
+        The returns a generator that will submit the designated event to all
+        witnesses concurrently for receipts using the synchronous witness API,
+        then propogate the receipts to each of the other witnesses. Completes
+        once toad receipts are gathered and propagated. Any remaining
+        witnesses are finished in the background. Use .settle to wait on them.
 
 
         Parameters:
@@ -60,6 +84,7 @@ class Receiptor(doing.DoDoer):
         hab = self.hby.habs[pre]
         sn = sn if sn is not None else hab.kever.sner.num
         wits = hab.kever.wits
+        toad = hab.kever.toader.num or len(wits)  # no threshold so wait on all
 
         if len(wits) == 0:
             return
@@ -74,38 +99,90 @@ class Receiptor(doing.DoDoer):
                 yield from self.catchup(ser.pre, wit)
 
         clients = dict()
-        doers = []
         for wit in wits:
             try:
-                client, clientDoer = httpClient(hab, wit)
-                clients[wit] = client
-                doers.append(clientDoer)
-                self.extend([clientDoer])
+                clients[wit] = self.acquire(hab, wit)
             except (kering.MissingEntryError, gaierror) as e:
                 logger.error(f"unable to create http client for witness {wit}: {e}")
 
+        pending = dict()
+        for wit, (client, _) in clients.items():
+            pending[wit] = (httping.streamCESRRequests(client=client, dest=wit,
+                                                       ims=bytearray(msg),
+                                                       path="/receipts"),
+                            helping.nowUTC())
+
         rcts = dict()
-        for wit, client in clients.items():
-            httping.streamCESRRequests(client=client, dest=wit, ims=bytearray(msg), path="/receipts")
-            while not client.responses:
-                yield self.tock
+        while pending and len(rcts) < toad:
+            yield from self.gather(hab, clients, pending, rcts)
 
-            rep = client.respond()
-            if rep.status == 200:
-                rct = bytearray(rep.body)
-                hab.psr.parseOne(bytearray(rct))
-                rserder = serdering.SerderKERI(raw=rct)
-                del rct[:rserder.size]
+        yield from self.propagate(hab, ser, clients, rcts, list(rcts))
 
-                # pull off the count code
-                coring.Counter(qb64b=rct, strip=True)
-                rcts[wit] = rct
-            else:
-                logger.error(f"invalid response {rep.status} from witnesses {wit}")
+        if pending:  # finish rest in background
+            self.straggling += 1
+            self.extend([doing.doify(self.straggle, hab=hab, ser=ser,
+                                     clients=clients, pending=pending, rcts=rcts)])
+        else:
+            for wit in clients:
+                self.release(wit, *clients[wit])
+
+        return rcts.keys()
+
+    def gather(self, hab, clients, pending, rcts):
+        """ Generator that services one pass of pending witness receipt responses
+
+        Parameters:
+            hab (Hab): environment of controller of receipted event
+            clients (dict): (client, clientDoer) keyed by witness prefix
+            pending (dict): (requests sent, datetime sent) keyed by witness
+                prefix awaiting response. Updated in place.
+            rcts (dict): receipt couple bytes keyed by witness prefix.
+                Updated in place.
+        """
+        now = helping.nowUTC()
+        for wit in list(pending):
+            client, clientDoer = clients[wit]
+            sent, dt = pending[wit]
+            if len(client.responses) >= sent:
+                del pending[wit]
+                rep = client.respond()
+                if rep.status == 200:
+                    rct = bytearray(rep.body)
+                    hab.psr.parseOne(bytearray(rct))
+                    rserder = serdering.SerderKERI(raw=rct)
+                    del rct[:rserder.size]
+
+                    # pull off the count code
+                    coring.Counter(qb64b=rct, strip=True)
+                    rcts[wit] = rct
+                else:
+                    logger.error(f"invalid response {rep.status} from witnesses {wit}")
+
+            elif (now - dt) > datetime.timedelta(seconds=self.Timeout):
+                del pending[wit]
+                del clients[wit]
+                self.remove([clientDoer])  # late response unusable so close
+                logger.error(f"timed out waiting on witness {wit}")
+
+        yield self.tock
 
-        for wit in rcts:
+    def propagate(self, hab, ser, clients, rcts, wits):
+        """ Generator that sends receipts of other witnesses to each witness in
+        wits concurrently and waits for their responses or timeout
+
+        Parameters:
+            hab (Hab): environment of controller of receipted event
+            ser (SerderKERI): receipted event
+            clients (dict): (client, clientDoer) keyed by witness prefix
+            rcts (dict): receipt couple bytes keyed by witness prefix
+            wits (list): witness prefixes to send to
+        """
+        pending = dict()
+        for wit in wits:
             ewits = [w for w in rcts if w != wit]
             wigs = [sig for w, sig in rcts.items() if w != wit]
+            if not wigs or wit not in clients:
+                continue
 
             msg = bytearray()
             if ser.ked['t'] in (coring.Ilks.icp, coring.Ilks.dip):  # introduce new witnesses
@@ -115,22 +192,103 @@ class Receiptor(doing.DoDoer):
                 msg.extend(schemes(self.hby.db, eids=ewits))
 
             rserder = eventing.receipt(pre=hab.pre,
-                                       sn=sn,
+                                       sn=ser.sn,
                                        said=ser.said)
             msg.extend(rserder.raw)
             msg.extend(coring.Counter(code=CtrDex.NonTransReceiptCouples, count=len(wigs)).qb64b)
             for wig in wigs:
                 msg.extend(wig)
 
-            client = clients[wit]
-
+            client, _ = clients[wit]
             sent = httping.streamCESRRequests(client=client, dest=wit, ims=bytearray(msg))
-            while len(client.responses) < sent:
-                yield self.tock
+            pending[wit] = (sent, helping.nowUTC())
+
+        while pending:
+            now = helping.nowUTC()
+            for wit in list(pending):
+                client, clientDoer = clients[wit]
+                sent, dt = pending[wit]
+                if len(client.responses) >= sent:
+                    del pending[wit]
+                    client.responses.clear()
+                elif (now - dt) > datetime.timedelta(seconds=self.Timeout):
+                    del pending[wit]
+                    del clients[wit]
+                    self.remove([clientDoer])
+                    logger.error(f"timed out propagating receipts to witness {wit}")
+            yield self.tock
 
-        self.remove(doers)
+    def straggle(self, tymth=None, tock=0.0, hab=None, ser=None, clients=None,
+                 pending=None, rcts=None):
+        """ Doifiable generator that finishes gathering receipts from witnesses
+        still pending after receipt returned and propagates them
 
-        return rcts.keys()
+        Parameters:
+            tymth (function): injected function wrapper closure returned by .tymen() of
+                Tymist instance. Calling tymth() returns associated Tymist .tyme.
+            tock (float): injected initial tock value
+            hab (Hab): environment of controller of receipted event
+            ser (SerderKERI): receipted event
+            clients (dict): (client, clientDoer) keyed by witness prefix
+            pending (dict): (requests sent, datetime sent) keyed by witness
+            rcts (dict): receipt couple bytes keyed by witness prefix
+        """
+        _ = (yield tock)
+
+        try:
+            prior = list(rcts)
+            while pending:
+                yield from self.gather(hab, clients, pending, rcts)
+
+            if any(wit not in prior for wit in rcts):  # late receipts to share
+                yield from self.propagate(hab, ser, clients, rcts, list(rcts))
+
+            for wit in clients:
+                self.release(wit, *clients[wit])
+        finally:
+            self.straggling -= 1
+
+        return True
+
+    def settle(self):
+        """ Generator that waits until all witnesses left pending by .receipt
+        are finished in the background. Each is bounded by .Timeout so callers
+        such as the CLI can wait on this before removing the Receiptor.
+        """
+        while self.straggling:
+            yield self.tock
+
+    def acquire(self, hab, wit):
+        """ Returns (client, clientDoer) for witness wit reusing idle client
+        when still connected otherwise creating a new one
+
+        Parameters:
+            hab (Hab): environment used to look up witness urls
+            wit (str): qb64 prefix of witness
+        """
+        if wit in self.clients:
+            client, clientDoer = self.clients.pop(wit)
+            if not client.connector.cutoff:
+                return client, clientDoer
+            self.remove([clientDoer])  # connection lost so replace
+
+        client, clientDoer = httpClient(hab, wit)
+        self.extend([clientDoer])
+        return client, clientDoer
+
+    def release(self, wit, client, clientDoer):
+        """ Returns client for witness wit to idle pool for reuse by later
+        events or closes it when pool already has one for wit
+
+        Parameters:
+            wit (str): qb64 prefix of witness
+            client (Client): http client for witness
+            clientDoer (ClientDoer): doer running client
+        """
+        if wit in self.clients:
+            self.remove([clientDoer])
+        else:
+            self.clients[wit] = (client, clientDoer)
 
     def get(self, pre, sn=None):
         """ Returns a generator for witness querying
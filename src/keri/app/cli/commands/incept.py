@@ -178,6 +178,7 @@ class InceptDoer(doing.DoDoer):
             print("Waiting for witness receipts...")
             if self.endpoint:
                 yield from receiptor.receipt(hab.pre, sn=0)
+                yield from receiptor.settle()  # finish witnesses beyond toad
             else:
                 witDoer.msgs.append(dict(pre=hab.pre))
                 while not witDoer.cues:
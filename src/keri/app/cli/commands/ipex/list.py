@@ -130,9 +130,8 @@ class ListDoer(doing.DoDoer):
         if self.type is not None:
             q = f"/exn/ipex/{self.type}"
 
-        for keys, notice in self.notifier.noter.notes.getItemIter():
-            if notice.pad['a']['r'].startswith(q):
-                self.notes.append(notice)
+        for _, notice, _ in self.notifier.noter.getNoteIter(route=q):
+            self.notes.append(notice)
 
         for note in self.notes:
             attrs = note.attrs
@@ -251,10 +250,10 @@ class ListDoer(doing.DoDoer):
         print(f"    Type: {schemer.sed['title']}")
         print(f"    Status: Accepted {terming.Colors.OKGREEN}{terming.Symbols.CHECKMARK}{terming.Colors.ENDC}")
 
-    def deleteNote(self, keys):
+    def deleteNote(self, rid):
         yn = input(f"\n Delete the notification [Y|n]?")
         if yn in ('', 'y', 'Y'):
-            self.notifier.noter.notes.rem(keys=keys)
+            self.notifier.noter.rem(rid=rid)
 
 
 def humanResponse(route):
@@ -123,7 +123,11 @@ def migrate(tymth, tock=0.0, **opts):
                 saider = coring.Saider(qb64b=bytes(dig))
                 rgy.cancs.pin(keys=said, val=[prefixer, seqner, saider])
 
+            rgy.reindexCreds()
+            rgy.rebuildVcStates()
+
             migrateKeys(hby.db)
+            migrateSeals(hby.db)
 
     except ConfigurationError:
         print(f"identifier prefix for {name} does not exist, incept must be run first", )
@@ -151,3 +155,14 @@ def migrateKeys(db):
         ndigers = serder.ndigers or []
         for diger in ndigers:
             digs.add(keys=(diger.qb64,), val=val)
+
+
+def migrateSeals(db):
+    """ Backfill anchored seal index .seals from every event in every KEL and mark it complete """
+    for pre, fn, dig in db.getFelItemAllPreIter(key=b''):
+        dgkey = dbing.dgKey(pre, dig)  # get message
+        if not (raw := db.getEvt(key=dgkey)):
+            raise kering.MissingEntryError("Missing event for dig={}.".format(dig))
+        serder = serdering.SerderKERI(raw=bytes(raw))
+        db.indexSeals(serder)
+    db.migs.pin(keys="seals", val=coring.Dater())
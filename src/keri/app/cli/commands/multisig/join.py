@@ -132,12 +132,12 @@ class ConfirmDoer(doing.DoDoer):
                         continue
 
                 if done:
-                    self.notifier.noter.notes.rem(keys=keys)
+                    self.notifier.noter.rem(rid=notice.rid)
 
                 else:
                     delete = input(f"\nDelete event [Y|n]? ")
                     if delete in ("Y", "y"):
-                        self.notifier.noter.notes.rem(keys=keys)
+                        self.notifier.noter.rem(rid=notice.rid)
 
                 yield self.tock
             yield self.tock
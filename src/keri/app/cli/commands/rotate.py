@@ -196,6 +196,7 @@ class RotateDoer(doing.DoDoer):
         elif hab.kever.wits:
             if self.endpoint:
                 yield from receiptor.receipt(hab.pre, sn=hab.kever.sn)
+                yield from receiptor.settle()  # finish witnesses beyond toad
             else:
                 for wit in self.adds:
                     self.mbx.addPoller(hab, witness=wit)
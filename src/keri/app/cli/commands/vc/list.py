@@ -109,13 +109,10 @@ class ListDoer(doing.DoDoer):
             print("\n")
 
         if self.issued:
-            saids = self.rgy.reger.issus.get(keys=self.hab.pre)
+            query = dict(issuer=self.hab.pre, schema=self.schema)
         else:
-            saids = self.rgy.reger.subjs.get(keys=self.hab.pre)
-
-        if self.schema is not None:
-            scads = self.rgy.reger.schms.get(keys=self.schema)
-            saids = [saider for saider in saids if saider.qb64 in [saider.qb64 for saider in scads]]
+            query = dict(subject=self.hab.pre, schema=self.schema)
+        saids = [saider for _, saider in self.rgy.reger.getCredSaidIter(**query)]
 
         if self.said:
             for said in saids:
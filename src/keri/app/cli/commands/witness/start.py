@@ -10,6 +10,7 @@ import logging
 
 from keri import __version__
 from keri import help
+from keri.help import ogling
 from keri.app import directing, indirecting, habbing, keeping, configing
 from keri.app.cli.common import existing
 
@@ -47,6 +48,13 @@ parser.add_argument('--config-file',
 parser.add_argument("--keypath", action="store", required=False, default=None)
 parser.add_argument("--certpath", action="store", required=False, default=None)
 parser.add_argument("--cafilepath", action="store", required=False, default=None)
+parser.add_argument("--shards", action="store", type=int, required=False, default=1,
+                    help="Number of processes that HTTP messages are routed to by identifier prefix. "
+                         "TCP is disabled when more than 1. Default is 1.")
+parser.add_argument("--metrics", action="store_true", required=False, default=False,
+                    help="Collect per stage processing metrics served at /metrics. Default is disabled.")
+parser.add_argument("--structured-logs", dest="structured", action="store_true", required=False, default=False,
+                    help="Emit log records as JSON lines. Default is plain text.")
 parser.add_argument("--loglevel", action="store", required=False, default="CRITICAL",
                     help="Set log level to DEBUG | INFO | WARNING | ERROR | CRITICAL. Default is CRITICAL")
 
@@ -54,7 +62,11 @@ parser.add_argument("--loglevel", action="store", required=False, default="CRITI
 def launch(args):
     help.ogler.level = logging.getLevelName(args.loglevel)
     help.ogler.reopen(name=args.name, temp=True, clear=True)  # need to configure for logging persistent file
+    if args.structured:
+        ogling.structure(help.ogler)
     logger = help.ogler.getLogger()
+    if args.metrics:
+        help.meter.enable()
 
     logger.info("\n******* Starting Witness for %s listening: http/%s, tcp/%s "
                 ".******\n\n", args.name, args.http, args.tcp)
@@ -69,14 +81,15 @@ def launch(args):
                configFile=args.configFile,
                keypath=args.keypath,
                certpath=args.certpath,
-               cafilepath=args.cafilepath)
+               cafilepath=args.cafilepath,
+               shards=args.shards)
 
     logger.info("\n******* Ended Witness for %s listening: http/%s, tcp/%s"
                 ".******\n\n", args.name, args.http, args.tcp)
 
 
 def runWitness(name="witness", base="", alias="witness", bran="", tcp=5631, http=5632, expire=0.0,
-               configDir="", configFile="", keypath=None, certpath=None, cafilepath=None):
+               configDir="", configFile="", keypath=None, certpath=None, cafilepath=None, shards=1):
     """
     Setup and run one witness
     """
@@ -106,6 +119,8 @@ def runWitness(name="witness", base="", alias="witness", bran="", tcp=5631, http
                                           httpPort=http,
                                           keypath=keypath,
                                           certpath=certpath,
-                                          cafilepath=cafilepath))
+                                          cafilepath=cafilepath,
+                                          shards=shards,
+                                          bran=bran))
 
     directing.runController(doers=doers, expire=expire)
@@ -9,10 +9,28 @@ import json
 from ordered_set import OrderedSet as oset
 
 from keri import kering
+from keri.core import coring
+
+
+# tokens of contact field values indexed for substring search
+TokenRex = re.compile(r"\w+")
+# regular expression metacharacters in search values that require a field scan
+MetaRex = re.compile(r"[.^$*+?{}\[\]\\|()]")
 
 
 class Organizer:
-    """ Organizes contacts relating contact information to AIDs """
+    """ Organizes contacts relating contact information to AIDs
+
+    Field values are indexed lowercased by whole value and by every suffix of
+    every word token of the value so substring search of a field only visits
+    index keys of that field beginning with the longest word of the search
+    value.
+
+    Class Attributes:
+        IndexSize (int): maximum number of chars of indexed value or token suffix
+
+    """
+    IndexSize = 32
 
     def __init__(self, hby):
         """ Create contact Organizer
@@ -22,6 +40,11 @@ class Organizer:
         """
         self.hby = hby
 
+        db = self.hby.db
+        if (not db.readonly and next(db.cfvs.getItemIter(), None) is None
+                and next(db.cfld.getItemIter(), None) is not None):
+            self.reindex()
+
     def update(self, pre, data):
         """ Add or update contact information in data for the identifier prefix
 
@@ -39,11 +62,15 @@ class Organizer:
         raw = json.dumps(existing).encode("utf-8")
         cigar = self.hby.signator.sign(ser=raw)
 
-        self.hby.db.ccigs.pin(keys=(pre,), val=cigar)
-        self.hby.db.cons.pin(keys=(pre,), val=raw)
+        with self.hby.db.trans():
+            self.hby.db.ccigs.pin(keys=(pre,), val=cigar)
+            self.hby.db.cons.pin(keys=(pre,), val=raw)
 
-        for field, val in data.items():
-            self.hby.db.cfld.pin(keys=(pre, field), val=val)
+            for field, val in data.items():
+                if (old := self.hby.db.cfld.get(keys=(pre, field))) is not None:
+                    self._unindex(pre, field, old)
+                self.hby.db.cfld.pin(keys=(pre, field), val=val)
+                self._index(pre, field, val)
 
     def replace(self, pre, data):
         """ Replace all contact information for identifier prefix with data
@@ -53,8 +80,9 @@ class Organizer:
             data (dict): data to replace contact information with
 
         """
-        self.rem(pre)
-        self.update(pre, data)
+        with self.hby.db.trans():
+            self.rem(pre)
+            self.update(pre, data)
 
     def set(self, pre, field, val):
         """ Add or replace one value in contact information for identifier prefix
@@ -68,7 +96,6 @@ class Organizer:
         data = self.get(pre) or dict()
         data[field] = val
         self.replace(pre, data)
-        self.hby.db.cfld.pin(keys=(pre, field), val=val)
 
     def unset(self, pre, field):
         """ Remove field from contact information for identifier prefix
@@ -81,7 +108,6 @@ class Organizer:
         data = self.get(pre)
         del data[field]
         self.replace(pre, data)
-        self.hby.db.cfld.rem(keys=(pre, field))
 
     def rem(self, pre):
         """ Remove all contact information for identifier prefix
@@ -92,9 +118,13 @@ class Organizer:
         Returns:
 
         """
-        self.hby.db.ccigs.rem(keys=(pre,))
-        self.hby.db.cons.rem(keys=(pre,))
-        return self.hby.db.cfld.trim(keys=(pre,))
+        fields = [(keys[-1], val) for keys, val in self.hby.db.cfld.getItemIter(keys=(pre, ""))]
+        with self.hby.db.trans():
+            for field, val in fields:
+                self._unindex(pre, field, val)
+            self.hby.db.ccigs.rem(keys=(pre,))
+            self.hby.db.cons.rem(keys=(pre,))
+            return self.hby.db.cfld.trim(keys=(pre,))
 
     def get(self, pre, field=None):
         """ Retrieve all contact information for identifier prefix
@@ -112,10 +142,7 @@ class Organizer:
             return None
         cigar = self.hby.db.ccigs.get(keys=(pre,))
 
-        if not self.hby.signator.verify(ser=raw.encode("utf-8"), cigar=cigar):
-            raise kering.ValidationError(f"failed signature on {pre} contact data")
-
-        data = json.loads(raw)
+        data = self._load(pre, raw.encode("utf-8"), cigar)
         if data is None:
             return None
 
@@ -125,6 +152,20 @@ class Organizer:
         data["id"] = pre
         return data
 
+    def _load(self, pre, raw, cigar):
+        """ Returns contact data deserialized from raw after verifying cigar
+
+        Parameters:
+            pre (str): qb64 identifier prefix for contact
+            raw (bytes): serialized contact data
+            cigar (Cigar): signature over raw
+
+        """
+        if not self.hby.signator.verify(ser=raw, cigar=cigar):
+            raise kering.ValidationError(f"failed signature on {pre} contact data")
+
+        return json.loads(raw)
+
     def list(self):
         """ Return list of all contact information for all remote identifiers
 
@@ -149,6 +190,110 @@ class Organizer:
 
         return contacts
 
+    def _suffixes(self, val):
+        """ Returns set of lowercased token suffixes of val to index """
+        return {token[i:i + self.IndexSize]
+                for token in TokenRex.findall(val.lower()) for i in range(len(token))}
+
+    def _index(self, pre, field, val):
+        """ Adds val of field of contact pre to value and token indexes """
+        val = self.hby.db.cfld._des(val)
+        self.hby.db.cfvs.pin(keys=(field, val.lower()[:self.IndexSize], pre), val=val)
+        for suffix in self._suffixes(val):
+            self.hby.db.ctks.pin(keys=(field, suffix, pre), val=pre)
+
+    def _unindex(self, pre, field, val):
+        """ Removes val of field of contact pre from value and token indexes """
+        val = self.hby.db.cfld._des(val)
+        self.hby.db.cfvs.rem(keys=(field, val.lower()[:self.IndexSize], pre))
+        for suffix in self._suffixes(val):
+            self.hby.db.ctks.rem(keys=(field, suffix, pre))
+
+    def reindex(self):
+        """ Rebuilds contact value and token indexes from contact fields. Used
+        to populate indexes of database created before indexes existed.
+
+        """
+        fields = [(keys, val) for keys, val in self.hby.db.cfld.getItemIter()]
+        with self.hby.db.trans():
+            self.hby.db.cfvs.trim()
+            self.hby.db.ctks.trim()
+            for (pre, field), val in fields:
+                self._index(pre, field, val)
+
+    def _match(self, field, val):
+        """ Returns dict of prefix to field value of contacts whose field
+        contains val ignoring case. Search values with regular expression
+        metacharacters are matched as regular expression against the
+        value index of field.
+
+        Parameters:
+            field (str): field name to search
+            val (str): value to search for
+
+        """
+        db = self.hby.db
+        val = f"{val}"
+        tokens = TokenRex.findall(val.lower())
+        matches = dict()
+        if not tokens or MetaRex.search(val):
+            prog = re.compile(f".*{val}.*", re.I)
+            for keys, v in db.cfvs.getItemIter(keys=(field, "")):
+                if prog.match(v):
+                    matches[keys[-1]] = v
+            return matches
+
+        low = val.lower()
+        token = max(tokens, key=len)[:self.IndexSize]
+        top = db.ctks.tokey((field, token))
+        sep = db.ctks.sep.encode("utf-8")
+        with db.readTrans(db=db.ctks.sdb) as txn:
+            cursor = txn.cursor(db=db.ctks.sdb)
+            if not cursor.set_range(top):
+                return matches
+            for key in cursor.iternext(keys=True, values=False):
+                key = bytes(key)
+                if not key.startswith(top):
+                    break
+                pre = key.rsplit(sep, 1)[-1].decode("utf-8")
+                if pre in matches:
+                    continue
+                v = txn.get(db.cfld.tokey((pre, field)), db=db.cfld.sdb)
+                if v is None:
+                    continue
+                v = bytes(v).decode("utf-8")
+                if low in v.lower():
+                    matches[pre] = v
+
+        return matches
+
+    def _hydrate(self, pres):
+        """ Returns list of contact data of prefixes in pres read in one
+        read transaction and verified
+
+        Parameters:
+            pres (Iterable): of str qb64 identifier prefixes of contacts
+
+        """
+        db = self.hby.db
+        loaded = []
+        with db.readTrans(db=db.cons.sdb) as txn:
+            for pre in pres:
+                raw = txn.get(db.cons.tokey((pre,)), db=db.cons.sdb)
+                if raw is None:
+                    continue
+                cig = txn.get(db.ccigs.tokey((pre,)), db=db.ccigs.sdb)
+                cigar = coring.Cigar(qb64b=bytes(cig)) if cig is not None else None
+                loaded.append((pre, bytes(raw), cigar))
+
+        contacts = []
+        for pre, raw, cigar in loaded:
+            data = self._load(pre, raw, cigar)
+            data["id"] = pre
+            contacts.append(data)
+
+        return contacts
+
     def find(self, field, val):
         """ Find all contact information for all contacts that have the val in field
 
@@ -160,13 +305,7 @@ class Organizer:
             list: All contacts that match the val in field
 
         """
-        pres = []
-        prog = re.compile(f".*{val}.*", re.I)
-        for (pre, f), v in self.hby.db.cfld.getItemIter():
-            if f == field and prog.match(v):
-                pres.append(pre)
-
-        return [self.get(pre) for pre in pres]
+        return self._hydrate(sorted(self._match(field, val)))
 
     def values(self, field, val=None):
         """ Find unique values for field in all contacts
@@ -179,13 +318,13 @@ class Organizer:
             list: Unique values from all contacts for field
 
         """
-        prog = re.compile(f".*{val}.*", re.I) if val is not None else None
+        if val is not None:
+            matches = self._match(field, val)
+            return list(oset(sorted(matches.values(), key=lambda v: (v.lower(), v))))
 
         vals = oset()
-        for (pre, f), v in self.hby.db.cfld.getItemIter():
-            if f == field:
-                if prog is None or prog.match(v):
-                    vals.add(v)
+        for _, v in self.hby.db.cfvs.getItemIter(keys=(field, "")):
+            vals.add(v)
 
         return list(vals)
 
@@ -735,6 +735,9 @@ class Habery:
         Parameters:
            clear is boolean, True means clear resource directories
         """
+        if self.mgr:
+            self.mgr.wipe()
+
         if self.ks:
             self.ks.close(clear=self.ks.temp or clear)
 
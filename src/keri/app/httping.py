@@ -5,6 +5,7 @@ keri.peer.httping module
 """
 import datetime
 import json
+import re
 from dataclasses import dataclass
 from urllib import parse
 from urllib.parse import urlparse
@@ -23,9 +24,13 @@ from keri.help import helping
 logger = help.ogler.getLogger()
 
 CESR_CONTENT_TYPE = "application/cesr+json"
+CESR_STREAM_CONTENT_TYPE = "application/cesr"
 CESR_ATTACHMENT_HEADER = "CESR-ATTACHMENT"
 CESR_DESTINATION_HEADER = "CESR-DESTINATION"
 
+# start bytes of JSON, MGPK and CBOR field maps, never in Base64 text attachments
+MsgStartRex = re.compile(rb'[{\x80-\xff]')
+
 
 class SignatureValidationComponent(object):
     """ Validate SKWA signatures """
@@ -113,6 +118,60 @@ def parseCesrHttpRequest(req):
     return cr
 
 
+def readCesrHttpRequest(req):
+    """
+    Read CESR stream from Falcon HTTP request without deserializing its messages
+    so they are only deserialized and validated once by the parser. Body of an
+    application/cesr+json request is one message with its attachments in the
+    CESR attachment header. Body of an application/cesr request is a stream of
+    one or more messages each followed by its attachments. Only the framing of
+    each message by its version string is checked here.
+
+    Parameters
+        req (falcon.Request) http request object in CESR format
+
+    Returns:
+        tuple: (ims, bodies) where ims is bytearray of CESR stream of messages
+            with attachments and bodies is list of raw bytes of each message
+
+    """
+    if req.content_type not in (CESR_CONTENT_TYPE, CESR_STREAM_CONTENT_TYPE):
+        raise falcon.HTTPError(falcon.HTTP_NOT_ACCEPTABLE,
+                               title="Content type error",
+                               description="Unacceptable content type.")
+
+    ims = bytearray(req.bounded_stream.read())
+
+    if req.content_type == CESR_CONTENT_TYPE:
+        if CESR_ATTACHMENT_HEADER not in req.headers:
+            raise falcon.HTTPError(falcon.HTTP_PRECONDITION_FAILED,
+                                   title="Attachment error",
+                                   description="Missing required attachment header.")
+        try:
+            smellage = kering.smell(ims[:kering.SMELLSIZE])
+        except kering.ExtractionError as ex:
+            raise falcon.HTTPError(falcon.HTTP_400,
+                                   title="Malformed message",
+                                   description=f"Invalid message body. {ex}")
+        if smellage.size != len(ims):
+            raise falcon.HTTPError(falcon.HTTP_400,
+                                   title="Malformed message",
+                                   description=f"Message body size {len(ims)} does not "
+                                               f"match version string size {smellage.size}.")
+        bodies = [bytes(ims)]
+        ims.extend(req.headers[CESR_ATTACHMENT_HEADER].encode("utf-8"))
+        return ims, bodies
+
+    try:
+        bodies = [body for body, _ in frameCESRStream(bytearray(ims))]
+    except kering.KeriError as ex:
+        raise falcon.HTTPError(falcon.HTTP_400,
+                               title="Malformed CESR stream",
+                               description=f"Invalid CESR stream body. {ex}")
+
+    return ims, bodies
+
+
 def createCESRRequest(msg, client, dest, path=None):
     """
     Turns a KERI message into a CESR http request against the provided hio http Client
@@ -152,9 +211,62 @@ def createCESRRequest(msg, client, dest, path=None):
     )
 
 
+def frameCESRStream(ims):
+    """
+    Generator that frames a stream of KERI messages with text domain attachments
+    into (body, attachment) pairs. Each body is sized by the version string of
+    its JSON, CBOR or MGPK serialization. Grouped attachments are sized by their
+    attachment group counter. Ungrouped attachments extend to the start byte of
+    the next message map which never occurs in Base64 text. Consumed bytes are
+    stripped from the front of ims once at the end instead of per message.
+
+    Parameters
+       ims (bytearray):  stream of KERI messages parsable as Serder.raw
+
+    Yields:
+       tuple: (body, attachment) bytes of each message
+
+    """
+    offset = 0
+    try:
+        while offset < len(ims):
+            cold = kering.sniff(ims[offset:offset + 1])
+            if cold != parsing.Colds.msg:  # not message error out to flush stream
+                raise kering.ColdStartError("Expecting message counter tritet={}"
+                                            "".format(cold))
+            try:
+                smellage = kering.smell(ims[offset:offset + kering.SMELLSIZE])
+            except kering.ShortageError as ex:  # need more bytes
+                raise kering.ExtractionError("unable to extract a valid message to send as HTTP")
+            if offset + smellage.size > len(ims):
+                raise kering.ExtractionError("unable to extract a valid message to send as HTTP")
+
+            body = bytes(ims[offset:offset + smellage.size])
+            offset += smellage.size
+
+            start = offset
+            while offset < len(ims) and kering.sniff(ims[offset:offset + 1]) == parsing.Colds.txt:
+                try:
+                    ctr = coring.Counter(qb64b=ims[offset:offset + 8])
+                except (kering.ExtractionError, kering.InvalidCodeError, ValueError):
+                    break
+                if ctr.code not in (coring.CtrDex.AttachmentGroup, coring.CtrDex.BigAttachmentGroup):
+                    break  # ungrouped so scan for next message
+                offset += len(ctr.qb64b) + ctr.count * 4
+
+            offset = min(offset, len(ims))
+            match = MsgStartRex.search(ims, offset)
+            offset = match.start() if match else len(ims)
+
+            yield body, bytes(ims[start:offset])
+    finally:
+        del ims[:offset]
+
+
 def streamCESRRequests(client, ims, dest, path=None):
     """
     Turns a stream of KERI messages into CESR http requests against the provided hio http Client
+    All requests are queued on the one client so they share its persistent connection.
 
     Parameters
        client (Client): hio http Client that will send the message as a CESR request
@@ -168,29 +280,8 @@ def streamCESRRequests(client, ims, dest, path=None):
     """
     path = path if path is not None else "/"
 
-    cold = kering.sniff(ims)  # check for spurious counters at front of stream
-    if cold in (parsing.Colds.txt, parsing.Colds.bny):  # not message error out to flush stream
-        # replace with pipelining here once CESR message format supported.
-        raise kering.ColdStartError("Expecting message counter tritet={}"
-                                    "".format(cold))
-
-    # Otherwise its a message cold start
     cnt = 0
-    while ims:  # extract and deserialize message from ims
-        try:
-            serder = coring.Sadder(raw=ims)
-        except kering.ShortageError as ex:  # need more bytes
-            raise kering.ExtractionError("unable to extract a valid message to send as HTTP")
-        else:  # extracted successfully
-            del ims[:serder.size]  # strip off event from front of ims
-
-        attachment = bytearray()
-        while ims and ims[0] != 0x7b:  # not new message so process attachments, must support CBOR and MsgPack
-            attachment.append(ims[0])
-            del ims[:1]
-
-        body = serder.raw
-
+    for body, attachment in frameCESRStream(ims):
         headers = Hict([
             ("Content-Type", CESR_CONTENT_TYPE),
             ("Content-Length", len(body)),
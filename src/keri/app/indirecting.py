@@ -19,14 +19,14 @@ from hio.core.tcp import serving
 from hio.help import decking
 
 import keri.app.oobiing
-from . import directing, storing, httping, forwarding, agenting, oobiing
+from . import directing, storing, httping, forwarding, agenting, oobiing, sharding
 from .habbing import GroupHab
 from .. import help, kering
 from ..core import eventing, parsing, routing, coring, serdering
 from ..core.coring import Ilks
 from ..db import basing, dbing
 from ..end import ending
-from ..help import helping
+from ..help import helping, ogling
 from ..peer import exchanging
 from ..vdr import verifying, viring
 from ..vdr.eventing import Tevery
@@ -35,10 +35,18 @@ logger = help.ogler.getLogger()
 
 
 def setupWitness(hby, alias="witness", mbx=None, aids=None, tcpPort=5631, httpPort=5632,
-                 keypath=None, certpath=None, cafilepath=None):
+                 keypath=None, certpath=None, cafilepath=None, shards=1, bran=None):
     """
     Setup witness controller and doers
 
+    When shards is more than one incoming HTTP messages are routed by identifier
+    prefix to that many shard processes that share the witness databases. TCP
+    intake is not sharded so the TCP server is not started in that mode.
+
+    Parameters:
+        shards (int): number of shard processes, one means process in this process
+        bran (str | None): passcode shard processes use to open hby
+
     """
     cues = decking.Deck()
     doers = []
@@ -82,10 +90,19 @@ def setupWitness(hby, alias="witness", mbx=None, aids=None, tcpPort=5631, httpPo
                             exc=exchanger,
                             rvy=rvy)
 
-    httpEnd = HttpEnd(rxbs=parser.ims, mbx=mbx)
-    app.add_route("/", httpEnd)
-    receiptEnd = ReceiptEnd(hab=hab, inbound=cues, aids=aids)
-    app.add_route("/receipts", receiptEnd)
+    if shards > 1:
+        sharder = sharding.Sharder(hby=hby, count=shards, alias=alias, bran=bran,
+                                   responses=rep.cues, mbx=mbx)
+        httpEnd = HttpEnd(rxbs=sharder.ims, mbx=mbx, qrycues=sharder.queries)
+        app.add_route("/", httpEnd)
+        receiptEnd = ReceiptEnd(hab=hab, inbound=cues, aids=aids, sharder=sharder)
+        app.add_route("/receipts", receiptEnd)
+    else:
+        sharder = None
+        httpEnd = HttpEnd(rxbs=parser.ims, mbx=mbx)
+        app.add_route("/", httpEnd)
+        receiptEnd = ReceiptEnd(hab=hab, inbound=cues, aids=aids)
+        app.add_route("/receipts", receiptEnd)
 
     server = createHttpServer(httpPort, app, keypath, certpath, cafilepath)
     if not server.reopen():
@@ -95,7 +112,7 @@ def setupWitness(hby, alias="witness", mbx=None, aids=None, tcpPort=5631, httpPo
     # setup doers
     regDoer = basing.BaserDoer(baser=verfer.reger)
 
-    if tcpPort is not None:
+    if tcpPort is not None and sharder is None:
         server = serving.Server(host="", port=tcpPort)
         if not server.reopen():
             raise RuntimeError(f"cannot create tcp server on port {tcpPort}")
@@ -108,7 +125,11 @@ def setupWitness(hby, alias="witness", mbx=None, aids=None, tcpPort=5631, httpPo
                             kvy=kvy, tvy=tvy, rvy=rvy, exc=exchanger, replies=rep.reps,
                             responses=rep.cues, queries=httpEnd.qrycues)
 
-    doers.extend([regDoer, httpServerDoer, rep, witStart, receiptEnd, *oobiery.doers])
+    compactor = storing.MailboxCompactor(mbx=mbx)
+
+    if sharder is not None:  # shards parse and process escrows instead of witStart
+        witStart = sharder
+    doers.extend([regDoer, httpServerDoer, rep, witStart, receiptEnd, compactor, *oobiery.doers])
     return doers
 
 
@@ -192,7 +213,7 @@ class WitnessStart(doing.DoDoer):
         _ = (yield self.tock)
 
         if self.parser.ims:
-            logger.info("Client %s received:\n%s\n...\n", self.kvy, self.parser.ims[:1024])
+            logger.info("Client %s received:\n%s\n...\n", self.kvy, ogling.preview(self.parser.ims))
         done = yield from self.parser.parsator(local=True)  # process messages continuously
         return done  # should nover get here except forced close
 
@@ -381,7 +402,7 @@ class Indirector(doing.DoDoer):
         _ = (yield self.tock)
 
         if self.parser.ims:
-            logger.info("Client %s received:\n%s\n...\n", self.hab.pre, self.parser.ims[:1024])
+            logger.info("Client %s received:\n%s\n...\n", self.hab.pre, ogling.preview(self.parser.ims))
         done = yield from self.parser.parsator(local=True)  # process messages continuously
         return done  # should nover get here except forced close
 
@@ -857,7 +878,9 @@ class HttpEnd:
 
     def on_post(self, req, rep):
         """
-        Handles POST for KERI event messages.
+        Handles POST for KERI event messages. Body bytes and attachment header
+        are appended to the parser stream as received so each message is only
+        deserialized by the parser. The connection is left open for keep-alive.
 
         Parameters:
               req (Request) Falcon HTTP request
@@ -871,10 +894,15 @@ class HttpEnd:
         requestBody:
            required: true
            content:
-             application/json:
+             application/cesr+json:
                schema:
                  type: object
-                 description: KERI event message
+                 description: KERI event message with attachments in CESR-ATTACHMENT header
+             application/cesr:
+               schema:
+                 type: string
+                 format: binary
+                 description: CESR stream of one or more KERI event messages with attachments
         responses:
            200:
               description: Mailbox query response for server sent events
@@ -886,34 +914,24 @@ class HttpEnd:
             return
 
         rep.set_header('Cache-Control', "no-cache")
-        rep.set_header('connection', "close")
 
-        cr = httping.parseCesrHttpRequest(req=req)
-        sadder = coring.Sadder(ked=cr.payload, kind=eventing.Serials.json)
-        msg = bytearray(sadder.raw)
-        msg.extend(cr.attachments.encode("utf-8"))
+        ims, bodies = httping.readCesrHttpRequest(req=req)
+        self.rxbs.extend(ims)
 
-        self.rxbs.extend(msg)
+        rep.status = falcon.HTTP_204  # no content so no content type
 
-        if sadder.proto in ("ACDC",):
-            rep.set_header('Content-Type', "application/json")
-            rep.status = falcon.HTTP_204
-        else:
-            ilk = sadder.ked["t"]
-            if ilk in (Ilks.icp, Ilks.rot, Ilks.ixn, Ilks.dip, Ilks.drt, Ilks.exn, Ilks.rpy):
-                rep.set_header('Content-Type', "application/json")
-                rep.status = falcon.HTTP_204
-            elif ilk in (Ilks.vcp, Ilks.vrt, Ilks.iss, Ilks.rev, Ilks.bis, Ilks.brv):
-                rep.set_header('Content-Type', "application/json")
-                rep.status = falcon.HTTP_204
-            elif ilk in (Ilks.qry,):
-                if sadder.ked["r"] in ("mbx",):
-                    rep.set_header('Content-Type', "text/event-stream")
-                    rep.status = falcon.HTTP_200
-                    rep.stream = QryRpyMailboxIterable(mbx=self.mbx, cues=self.qrycues, said=sadder.said)
-                else:
-                    rep.set_header('Content-Type', "application/json")
-                    rep.status = falcon.HTTP_204
+        for body in bodies:  # only mailbox queries get a response so only they are peeked at
+            if b"qry" not in body:
+                continue
+            try:
+                serder = serdering.SerderKERI(raw=body, verify=False)
+            except Exception:  # not a KERI message so left to parser to reject
+                continue
+            if serder.ilk == Ilks.qry and serder.ked["r"] in ("mbx",):
+                rep.set_header('Content-Type', "text/event-stream")
+                rep.status = falcon.HTTP_200
+                rep.stream = QryRpyMailboxIterable(mbx=self.mbx, cues=self.qrycues, said=serder.said)
+                break
 
     def on_put(self, req, rep):
         """
@@ -946,7 +964,6 @@ class HttpEnd:
             return
 
         rep.set_header('Cache-Control', "no-cache")
-        rep.set_header('connection', "close")
 
         self.rxbs.extend(req.bounded_stream.read())
 
@@ -968,16 +985,17 @@ class QryRpyMailboxIterable:
 
     def __next__(self):
         if self.iter is None:
-            if self.cues:
-                cue = self.cues.pull() # self.cues.popleft()
-                serder = cue["serder"]
-                if serder.said == self.said:
-                    kin = cue["kin"]
-                    if kin == "stream":
+            for cue in self.cues:  # find own cue in place without requeueing others
+                if cue["serder"].said == self.said:
+                    self.cues.remove(cue)
+                    if cue["kin"] == "stream":
+                        if cue.get("trim"):  # recipient acknowledged topics before its indices
+                            for topic, idx in cue["topics"].items():
+                                if isinstance(idx, int):
+                                    self.mbx.trimTopic(topic=cue["pre"] + topic, fn=idx)
                         self.iter = iter(MailboxIterable(mbx=self.mbx, pre=cue["pre"], topics=cue["topics"],
                                                          retry=self.retry))
-                else:
-                    self.cues.append(cue)
+                    break
 
             return b''
 
@@ -985,13 +1003,27 @@ class QryRpyMailboxIterable:
 
 
 class MailboxIterable:
+    """
+    Iterable of server sent event chunks of messages stored in mailbox topics
+    of pre. After initial catch up only reads topics in which messages have
+    been stored since the last chunk as signalled by registration with the
+    mailboxer. All available messages are batched into each chunk.
+
+    Class Attributes:
+        TimeoutMBX (float): seconds without messages before stream ends
+        RefreshMBX (float): seconds between full catch up reads to pick up
+            messages stored by other processes on the same mailbox database
+    """
     TimeoutMBX = 30000000
+    RefreshMBX = 5.0
 
     def __init__(self, mbx, pre, topics, retry=5000):
         self.mbx = mbx
         self.pre = pre
         self.topics = topics
         self.retry = retry
+        self.waiter = mbx.register(topics=[pre + topic for topic in topics])
+        self.refreshed = None
 
     def __iter__(self):
         self.start = self.end = time.perf_counter()
@@ -1004,8 +1036,22 @@ class MailboxIterable:
                 return bytearray(f"retry: {self.retry}\n\n".encode("utf-8"))
 
             data = bytearray()
+            now = time.perf_counter()
+            full = self.refreshed is None or now - self.refreshed >= self.RefreshMBX
+            if not full and not self.waiter.woken:  # nothing landed so no db read
+                self.end = now
+                return data
+
+            woken, self.waiter.woken = self.waiter.woken, set()
+            if full:
+                self.refreshed = now
+
             for topic, idx in self.topics.items():
                 key = self.pre + topic
+                keyb = key.encode("utf-8")
+                if not full and (keyb not in woken or self.mbx.marks.get(keyb, 0) <= idx):
+                    continue  # no new messages in topic
+
                 for fn, _, msg in self.mbx.cloneTopicIter(key, idx):
                     data.extend(bytearray("id: {}\nevent: {}\nretry: {}\ndata: ".format(fn, topic, self.retry)
                                           .encode("utf-8")))
@@ -1018,6 +1064,7 @@ class MailboxIterable:
             self.end = time.perf_counter()
             return data
 
+        self.mbx.unregister(self.waiter)
         raise StopIteration
 
 
@@ -1027,12 +1074,14 @@ class ReceiptEnd(doing.DoDoer):
      Most times a witness will be able to return its receipt for an event inband.  This API
      will provide that functionality.  When an event needs to be escrowed, this POST API
      will return a 202 and also provides a generic GET API for retrieving a receipt for any
-     event.
+     event. When run with a sharded witness runtime events are routed to their shard and the
+     POST API always returns a 202.
 
      """
 
-    def __init__(self, hab, inbound=None, outbound=None, aids=None):
+    def __init__(self, hab, inbound=None, outbound=None, aids=None, sharder=None):
         self.hab = hab
+        self.sharder = sharder
         self.inbound = inbound if inbound is not None else decking.Deck()
         self.outbound = outbound if outbound is not None else decking.Deck()
         self.aids = aids
@@ -1072,6 +1121,11 @@ class ReceiptEnd(doing.DoDoer):
         msg = bytearray(serder.raw)
         msg.extend(cr.attachments.encode("utf-8"))
 
+        if self.sharder is not None:  # shard processes event so receipt later with GET
+            self.sharder.ims.extend(msg)
+            rep.status = falcon.HTTP_202
+            return
+
         self.psr.parseOne(ims=msg, local=True)
 
         if pre in self.hab.kevers:
@@ -23,7 +23,8 @@ raw = json.dumps(ked, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
 
 """
 import math
-from collections import namedtuple, deque
+import time
+from collections import namedtuple, deque, OrderedDict
 from dataclasses import dataclass, asdict, field
 
 import pysodium
@@ -602,6 +603,14 @@ class Manager:
             decryption key is derived seed (private signing key seed)
         inited (bool): True means fully initialized wrt database.
                           False means not yet fully initialized
+        signers (OrderedDict): cache of unlocked Signer instances keyed by qb64
+            public key with values (signer, expiry) in LRU order. Saves the
+            db read and decryption of private key per signature.
+        signerTTL (float): seconds an unlocked signer stays cached. 0 disables
+        signerSize (int): max number of unlocked signers cached
+        hits (int): count of signer cache hits
+        misses (int): count of signer cache misses
+        evictions (int): count of signers evicted from cache by ttl or size
 
     Attributes (Hidden):
 
@@ -640,8 +649,11 @@ class Manager:
     Methods:
 
     """
+    SignerTTL = 60.0  # default seconds unlocked signer stays cached
+    SignerSize = 1024  # default max number of unlocked signers cached
 
-    def __init__(self, *, ks=None, seed=None, **kwa):
+    def __init__(self, *, ks=None, seed=None, signerTTL=None, signerSize=None,
+                 **kwa):
         """
         Setup Manager.
 
@@ -657,6 +669,10 @@ class Manager:
                 and decryption secret for the Manager and must be stored on
                 another device from the device that runs the Manager.
                 Currently only code MtrDex.Ed25519_Seed is supported.
+            signerTTL (float | None): seconds unlocked signer stays cached.
+                0 disables cache. None means use .SignerTTL
+            signerSize (int | None): max number of unlocked signers cached.
+                None means use .SignerSize
 
         Parameters: Passthrough to .setup for later initialization
             aeid (str): qb64 of non-transferable identifier prefix for
@@ -676,6 +692,12 @@ class Manager:
         self.decrypter = None
         self._seed = seed if seed is not None else ""
         self.inited = False
+        self.signers = OrderedDict()
+        self.signerTTL = signerTTL if signerTTL is not None else self.SignerTTL
+        self.signerSize = signerSize if signerSize is not None else self.SignerSize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
 
         # save keyword arg parameters to init later if db not opened yet
         self._inits = kwa
@@ -818,6 +840,7 @@ class Manager:
 
         # update .decrypter
         self.decrypter = coring.Decrypter(seed=seed) if seed else None
+        self.wipe()  # unlocked signers belong to prior authentication
 
 
     @property
@@ -924,6 +947,50 @@ class Manager:
         self.ks.gbls.pin('tier', tier)
 
 
+    def signer(self, pub):
+        """
+        Returns unlocked Signer for qb64 public key pub from .signers cache
+        when fresh otherwise fetches and decrypts from .ks.pris and caches it.
+        Returns None if no private key in db for pub.
+
+        Parameters:
+            pub (str | bytes): qb64 public key
+        """
+        if isinstance(pub, memoryview):
+            pub = bytes(pub)
+        if hasattr(pub, "decode"):
+            pub = pub.decode("utf-8")
+
+        now = time.monotonic()
+        if (entry := self.signers.get(pub)) is not None:
+            signer, expiry = entry
+            if expiry > now:
+                self.signers.move_to_end(pub)
+                self.hits += 1
+                return signer
+            del self.signers[pub]
+            self.evictions += 1
+
+        self.misses += 1
+        if (signer := self.ks.pris.get(pub, decrypter=self.decrypter)) is None:
+            return None
+
+        if self.signerTTL > 0 and self.signerSize > 0:
+            self.signers[pub] = (signer, now + self.signerTTL)
+            while len(self.signers) > self.signerSize:
+                self.signers.popitem(last=False)
+                self.evictions += 1
+
+        return signer
+
+    def wipe(self):
+        """
+        Wipes all unlocked signers from .signers cache. Called whenever keys
+        are moved, rotated, erased, or the keystore is locked or closed.
+        """
+        self.signers.clear()
+
+
     def incept(self, icodes=None, icount=1, icode=coring.MtrDex.Ed25519_Seed,
                      ncodes=None, ncount=1, ncode=coring.MtrDex.Ed25519_Seed,
                      dcode=coring.MtrDex.Blake3_256,
@@ -1071,6 +1138,8 @@ class Manager:
         if old == new:
             return
 
+        self.wipe()
+
         if self.ks.pres.get(old) is None:
             raise ValueError("Nonexistent old pre={}, nothing to assign.".format(old))
 
@@ -1154,6 +1223,8 @@ class Manager:
 
         """
         # Secret to decrypt here
+        self.wipe()
+
         if (pp := self.ks.prms.get(pre)) is None:
             raise ValueError("Attempt to rotate nonexistent pre={}.".format(pre))
 
@@ -1336,8 +1407,7 @@ class Manager:
                 if self.aeid and not self.decrypter:
                     raise kering.DecryptError("Unauthorized decryption attempt. "
                                               "Aeid but no decrypter.")
-                if ((signer := self.ks.pris.get(pub, decrypter=self.decrypter))
-                        is None):
+                if (signer := self.signer(pub)) is None:
                     raise ValueError("Missing prikey in db for pubkey={}".format(pub))
                 signers.append(signer)
 
@@ -1346,9 +1416,7 @@ class Manager:
                 if self.aeid and not self.decrypter:
                     raise kering.DecryptError("Unauthorized decryption attempt. "
                                               "Aeid but no decrypter.")
-                if ((signer := self.ks.pris.get(verfer.qb64,
-                                                decrypter=self.decrypter))
-                        is None):
+                if (signer := self.signer(verfer.qb64)) is None:
                     raise ValueError("Missing prikey in db for pubkey={}".format(verfer.qb64))
                 signers.append(signer)
 
@@ -1645,6 +1713,8 @@ class Manager:
                 advancement when advance is True otherwise ignore
 
         """
+        self.wipe()
+
         if (pp := self.ks.prms.get(pre)) is None:
             raise ValueError("Attempt to replay nonexistent pre={}.".format(pre))
 
@@ -1755,4 +1825,4 @@ class ManagerDoer(doing.Doer):
 
     def exit(self):
         """"""
-        pass
+        self.manager.wipe()
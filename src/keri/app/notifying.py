@@ -203,6 +203,10 @@ class Noter(dbing.LMDBer):
     Noter stores Notifications generated by the agent that are
     intended to be read and dismissed by the controller of the agent.
 
+    Notes are keyed by datetime and random ID so that iteration is in datetime
+    order. Secondary indexes by read status and by route hold only keys so
+    filtered pages and counts never load notes that are not returned.
+
     """
     TailDirPath = "keri/not"
     AltTailDirPath = ".keri/not"
@@ -220,6 +224,8 @@ class Noter(dbing.LMDBer):
         self.notes = None
         self.nidx = None
         self.ncigs = None
+        self.nrds = None
+        self.nrts = None
 
         super(Noter, self).__init__(name=name, headDirPath=headDirPath, reopen=reopen, **kwa)
 
@@ -235,8 +241,49 @@ class Noter(dbing.LMDBer):
         self.nidx = subing.Suber(db=self, subkey='nidx.')
         self.ncigs = subing.CesrSuber(db=self, subkey='ncigs.', klas=coring.Cigar)
 
+        # index of notes by read status, keyed by (read, dt, rid) with read "0" or "1"
+        self.nrds = subing.Suber(db=self, subkey='nrds.', sep='|')
+        # index of notes by route of attributes, keyed by (route, dt, rid)
+        self.nrts = subing.Suber(db=self, subkey='nrts.', sep='|')
+
+        if (not self.readonly and next(self.nrds.getItemIter(), None) is None
+                and next(self.notes.getItemIter(), None) is not None):
+            self.reindexNotes()
+
         return self.env
 
+    @staticmethod
+    def _route(note):
+        """ Returns route of note attributes or None if note has no route """
+        route = note.attrs.get("r") if isinstance(note.attrs, dict) else None
+        return route if isinstance(route, str) else None
+
+    def _index(self, note):
+        """ Adds note to read status and route indexes """
+        dt = note.datetime
+        rid = note.rid
+        self.nrds.pin(keys=("1" if note.read else "0", dt, rid), val=rid)
+        if (route := self._route(note)) is not None:
+            self.nrts.pin(keys=(route, dt, rid), val=rid)
+
+    def _unindex(self, note):
+        """ Removes note from read status and route indexes """
+        dt = note.datetime
+        rid = note.rid
+        self.nrds.rem(keys=("1" if note.read else "0", dt, rid))
+        if (route := self._route(note)) is not None:
+            self.nrts.rem(keys=(route, dt, rid))
+
+    def reindexNotes(self):
+        """ Rebuilds read status and route indexes from stored notes. Used to
+        populate indexes of database created before indexes existed.
+
+        """
+        notes = [note for _, note in self.notes.getItemIter()]
+        with self.trans():
+            for note in notes:
+                self._index(note)
+
     def add(self, note, cigar):
         """
         Adds note to database, keyed by the datetime and said of the note.
@@ -251,9 +298,11 @@ class Noter(dbing.LMDBer):
         if self.nidx.get(keys=(rid,)) is not None:
             return False
 
-        self.nidx.pin(keys=(rid,), val=dt.encode())
-        self.ncigs.pin(keys=(rid,), val=cigar)
-        return self.notes.pin(keys=(dt, rid), val=note)
+        with self.trans():
+            self.nidx.pin(keys=(rid,), val=dt.encode())
+            self.ncigs.pin(keys=(rid,), val=cigar)
+            self._index(note)
+            return self.notes.pin(keys=(dt, rid), val=note)
 
     def update(self, note, cigar):
         """
@@ -266,12 +315,18 @@ class Noter(dbing.LMDBer):
         """
         dt = note.datetime
         rid = note.rid
-        if self.nidx.get(keys=(rid,)) is None:
+        if (res := self.get(rid)) is None:
             return False
 
-        self.nidx.pin(keys=(rid,), val=dt.encode())
-        self.ncigs.pin(keys=(rid,), val=cigar)
-        return self.notes.pin(keys=(dt, rid), val=note)
+        old, _ = res
+        with self.trans():
+            self._unindex(old)
+            if old.datetime != dt:
+                self.notes.rem(keys=(old.datetime, rid))
+            self.nidx.pin(keys=(rid,), val=dt.encode())
+            self.ncigs.pin(keys=(rid,), val=cigar)
+            self._index(note)
+            return self.notes.pin(keys=(dt, rid), val=note)
 
     def get(self, rid):
         """
@@ -310,9 +365,11 @@ class Noter(dbing.LMDBer):
         note, _ = res
         dt = note.datetime
         rid = note.rid
-        self.nidx.rem(keys=(rid,))
-        self.ncigs.rem(keys=(rid,))
-        return self.notes.rem(keys=(dt, rid))
+        with self.trans():
+            self._unindex(note)
+            self.nidx.rem(keys=(rid,))
+            self.ncigs.rem(keys=(rid,))
+            return self.notes.rem(keys=(dt, rid))
 
     def getNoteCnt(self):
         """
@@ -324,6 +381,112 @@ class Noter(dbing.LMDBer):
         """
         return self.notes.cntAll()
 
+    def _scan(self, read=None, route=None):
+        """ Returns suber, top branch key and residual read filter of index
+        to scan for read and route filters.
+
+        Route matches notes whose route is route or any subroute of it.
+        """
+        if route is not None:
+            return self.nrts, route.rstrip("/").encode("utf-8"), read
+        if read is not None:
+            return self.nrds, self.nrds.tokey(("1" if read else "0", "")), None
+        return self.notes, b"", None
+
+    def _keyIter(self, txn, suber, top, last=""):
+        """ Returns iterator over keys of suber in txn that start with top
+        starting after cursor last
+        """
+        start = last.encode("utf-8") if last else top
+        cursor = txn.cursor(db=suber.sdb)
+        if not cursor.set_range(start):
+            return
+        for key in cursor.iternext(keys=True, values=False):
+            key = bytes(key)
+            if not key.startswith(top):
+                break
+            if last and key == start:
+                continue
+            yield key
+
+    def _matchKey(self, txn, key, suber, top, read):
+        """ Returns (dt, rid) of index key when it matches residual filters
+        otherwise None
+        """
+        dt, rid = key.decode("utf-8").rsplit(suber.sep, 2)[-2:]
+        if suber is self.nrts:
+            rest = key[len(top):]  # only route itself or its subroutes
+            if not (rest.startswith(b"|") or rest.startswith(b"/")):
+                return None
+            if read is not None:
+                rkey = self.nrds.tokey(("1" if read else "0", dt, rid))
+                if txn.get(rkey, db=self.nrds.sdb) is None:
+                    return None
+        return dt, rid
+
+    def getNoteIter(self, read=None, route=None, last=""):
+        """ Returns iterator of (cursor, note, cigar) of notes matching filters.
+        Notes and cigars are read in one read transaction. Pass cursor of last
+        item seen as last to resume with the next page.
+
+        Parameters:
+            read (bool | None): True for read notes, False for unread, None for all
+            route (str | None): route of notes, matches subroutes too, None for all
+            last (str): cursor of last item seen. Empty means from start
+
+        """
+        suber, top, rd = self._scan(read=read, route=route)
+        with self.readTrans(db=suber.sdb) as txn:
+            for key in self._keyIter(txn, suber, top, last=last):
+                if (match := self._matchKey(txn, key, suber, top, rd)) is None:
+                    continue
+                dt, rid = match
+                raw = txn.get(self.notes.tokey((dt, rid)), db=self.notes.sdb)
+                if raw is None:
+                    continue
+                cig = txn.get(self.ncigs.tokey((rid,)), db=self.ncigs.sdb)
+                yield (key.decode("utf-8"), Notice(raw=bytes(raw)),
+                       coring.Cigar(qb64b=bytes(cig)) if cig is not None else None)
+
+    def getNotePage(self, read=None, route=None, last="", limit=25):
+        """ Returns couple (notes, cursor) of a page of at most limit notes
+        where notes is list of (note, cigar) and cursor is passed as last to
+        get the next page. Cursor is empty when there are no more notes.
+
+        Parameters:
+            read (bool | None): True for read notes, False for unread, None for all
+            route (str | None): route of notes, matches subroutes too, None for all
+            last (str): cursor returned with previous page. Empty means from start
+            limit (int): maximum number of notes in page
+
+        """
+        notes = []
+        cursor = ""
+        for cursor, note, cig in self.getNoteIter(read=read, route=route, last=last):
+            notes.append((note, cig))
+            if len(notes) == limit:
+                break
+        else:
+            cursor = ""
+
+        return notes, cursor
+
+    def cntNotes(self, read=None, route=None):
+        """ Returns count of notes matching filters from keys of indexes only
+
+        Parameters:
+            read (bool | None): True for read notes, False for unread, None for all
+            route (str | None): route of notes, matches subroutes too, None for all
+
+        """
+        if read is None and route is None:
+            return self.notes.cntAll()
+
+        suber, top, rd = self._scan(read=read, route=route)
+        with self.readTrans(db=suber.sdb) as txn:
+            return sum(1 for key in self._keyIter(txn, suber, top)
+                       if self._matchKey(txn, key, suber, top, rd) is not None)
+
     def getNotes(self, start=0, end=25):
         """
         Returns list of tuples (note, cigar) of notes for controller of agent
@@ -337,20 +500,20 @@ class Noter(dbing.LMDBer):
             start = start.isoformat()
 
         notes = []
-        it = self.notes.getItemIter(keys=())
-
-        # Run off the items before start
-        for _ in range(start):
-            try:
-                next(it)
-            except StopIteration:
-                break
-
-        for ((_, _), note) in it:
-            cig = self.ncigs.get(keys=(note.rid,))
-            notes.append((note, cig))
-            if (not end == -1) and len(notes) == (end - start) + 1:
-                break
+        with self.readTrans(db=self.notes.sdb) as txn:
+            keys = self._keyIter(txn, self.notes, b"")
+            # Run off the keys before start without loading notes
+            for _ in range(start):
+                if next(keys, None) is None:
+                    return notes
+
+            for key in keys:
+                raw = txn.get(key, db=self.notes.sdb)
+                note = Notice(raw=bytes(raw))
+                cig = txn.get(self.ncigs.tokey((note.rid,)), db=self.ncigs.sdb)
+                notes.append((note, coring.Cigar(qb64b=bytes(cig)) if cig is not None else None))
+                if (not end == -1) and len(notes) == (end - start) + 1:
+                    break
 
         return notes
 
@@ -0,0 +1,352 @@
+# -*- encoding: utf-8 -*-
+"""
+keri.app.sharding module
+
+Prefix sharded multi-process runtime for witnesses. A front-end process
+serves HTTP and routes each incoming message by identifier prefix to one of N
+shard processes. Each shard runs its own Kevery over the shared LMDB
+environment so that signature verification and escrow processing of
+different identifiers proceed on different cores. Cues produced by a shard
+such as receipts and mailbox query streams are returned to the front-end as
+are the topics of messages a shard stores in the mailbox so that mailbox
+streams served by the front-end are woken.
+
+"""
+import hashlib
+import multiprocessing
+
+from hio.base import doing
+from hio.help import decking
+
+from .. import help, kering
+from ..core import eventing, parsing, routing, serdering
+from ..core.coring import Ilks
+from ..peer import exchanging
+from ..vdr import viring
+from ..vdr.eventing import Tevery
+from . import forwarding, habbing, httping, storing
+
+logger = help.ogler.getLogger()
+
+# ilks of messages routed by their own identifier prefix
+KeyIlks = (Ilks.icp, Ilks.rot, Ilks.ixn, Ilks.dip, Ilks.drt, Ilks.rct)
+
+
+def shardOf(pre, count):
+    """ Returns index of shard of count shards that owns identifier prefix pre
+
+    Parameters:
+        pre (str | bytes): qb64 identifier prefix
+        count (int): number of shards
+    """
+    if count <= 1 or not pre:
+        return 0
+    if hasattr(pre, "encode"):
+        pre = pre.encode("utf-8")
+    dig = hashlib.blake2b(pre, digest_size=8).digest()
+    return int.from_bytes(dig, "big") % count
+
+
+def routeShard(raw, count):
+    """ Returns index of shard of count shards to process message raw
+
+    Key events and receipts go to the shard of their identifier prefix and
+    queries to the shard of the queried prefix so all key state of a prefix
+    is updated by one shard in order. All other messages such as replies,
+    exchanges and TEL events go to shard zero which also processes their
+    escrows.
+
+    Parameters:
+        raw (bytes): serialized message without attachments
+        count (int): number of shards
+    """
+    if count <= 1:
+        return 0
+    try:
+        serder = serdering.SerderKERI(raw=raw, verify=False)  # shard validates
+    except Exception:  # not a KERI message
+        return 0
+
+    if serder.ilk in KeyIlks:
+        return shardOf(serder.pre, count)
+    if serder.ilk == Ilks.qry:
+        q = serder.ked.get("q")
+        return shardOf(q.get("i"), count) if isinstance(q, dict) else 0
+    return 0
+
+
+class Sharder(doing.Doer):
+    """
+    Sharder is the front-end of the sharded runtime. Frames messages appended
+    to .ims, routes each to its shard over a pipe and dispatches what shards
+    return. Cues of kin stream go to .queries and all others to .responses.
+    Escrow wakes from a shard are broadcast to the other shards. Mailbox
+    stores of a shard advance the marks and wake the waiters of .mbx.
+
+    Attributes:
+        hby (Habery): front-end database environment
+        mbx (Mailboxer | None): front-end mailbox read by mailbox streams
+        ims (bytearray): incoming message stream to route
+        conns (list): of multiprocessing Connection to each shard
+        procs (list): of spawned shard Process if any
+        queries (Deck): stream cues for HttpEnd mailbox queries
+        responses (Deck): other cues for Respondant
+        routed (list): of int count of messages routed to each shard
+
+    """
+
+    def __init__(self, hby, conns=None, count=1, alias="witness", bran=None,
+                 ims=None, queries=None, responses=None, mbx=None, **kwa):
+        """
+        Parameters:
+            hby (Habery): front-end database environment
+            conns (list | None): of Connection to running shards. None means
+                spawn count shard processes on enter
+            count (int): number of shard processes to spawn when conns is None
+            alias (str): name of witness Hab in each shard
+            bran (str | None): passcode to open Habery in each shard
+            ims (bytearray | None): incoming message stream to route
+            queries (Deck | None): stream cues for HttpEnd mailbox queries
+            responses (Deck | None): other cues for Respondant
+            mbx (Mailboxer | None): front-end mailbox read by mailbox streams
+        """
+        super(Sharder, self).__init__(**kwa)
+        self.hby = hby
+        self.mbx = mbx
+        self.conns = conns if conns is not None else []
+        self.count = len(self.conns) if conns is not None else count
+        self.alias = alias
+        self.bran = bran
+        self.procs = []
+        self.ims = ims if ims is not None else bytearray()
+        self.queries = queries if queries is not None else decking.Deck()
+        self.responses = responses if responses is not None else decking.Deck()
+        self.routed = [0] * self.count
+
+    def enter(self):
+        """ Spawns shard processes unless given connections to shards """
+        if not self.conns:
+            self.procs, self.conns = spawnShards(hby=self.hby, count=self.count,
+                                                 alias=self.alias, bran=self.bran)
+
+    def recur(self, tyme):
+        """ Routes incoming messages and dispatches returns from shards """
+        if self.ims:
+            self.route()
+
+        for index, conn in enumerate(self.conns):
+            try:
+                while conn.poll():
+                    self.dispatch(index, *conn.recv())
+            except (EOFError, OSError):
+                logger.error("Sharder: lost shard %s", index)
+
+        return False  # never done
+
+    def exit(self):
+        """ Closes connections to shards so they exit and joins spawned processes """
+        for conn in self.conns:
+            conn.close()
+        for proc in self.procs:
+            proc.join(timeout=5.0)
+            if proc.is_alive():
+                proc.terminate()
+
+    def route(self):
+        """ Sends each complete message with attachments in .ims to its shard.
+        A malformed frame is dropped only up to the next message start so
+        messages queued after it are still routed.
+        """
+        while self.ims:
+            try:
+                for body, atc in httping.frameCESRStream(self.ims):
+                    index = routeShard(body, len(self.conns))
+                    self.conns[index].send(("msg", body + atc))
+                    self.routed[index] += 1
+            except kering.ExtractionError as ex:  # .ims now starts at bad frame
+                match = httping.MsgStartRex.search(self.ims, 1)
+                end = match.start() if match else len(self.ims)
+                del self.ims[:end]
+                logger.error("Sharder: dropped %s bytes of malformed frame: %s",
+                             end, ex.args[0])
+
+    def dispatch(self, index, kind, val):
+        """ Dispatches val of kind returned by shard at index
+
+        Parameters:
+            index (int): index of shard
+            kind (str): cue, wake or store
+            val: cue dict, list of woken prefixes or dict of mailbox marks
+                keyed by stored topic
+        """
+        if kind == "wake":
+            for i, conn in enumerate(self.conns):
+                if i != index:
+                    conn.send(("wake", val))
+            return
+
+        if kind == "store":
+            if self.mbx is not None:
+                for topic, mark in val.items():
+                    self.mbx.notify(topic=topic, mark=mark)
+            return
+
+        # key state in memory may be stale since shards update it
+        self.hby.db.kevers.flush()
+        if val["kin"] == "stream":
+            self.queries.append(val)
+        else:
+            self.responses.append(val)
+
+
+class Shard(doing.Doer):
+    """
+    Shard processes messages routed to it by the front-end Sharder with its own
+    Kevery. Reattempts escrowed key events only of the prefixes it owns and
+    shard zero also processes reply, TEL and exchange escrows. Kevers of
+    prefixes owned by other shards are flushed from memory after every pass
+    so they are reloaded from the shared database.
+
+    Attributes:
+        hby (Habery): shard database environment
+        index (int): index of this shard
+        count (int): number of shards
+        conn (Connection): pipe to front-end
+        mbx (Mailboxer | None): mailbox for forwarded exchange messages whose
+            stored marks are returned to front-end
+        parser (Parser): parser of routed messages
+        kvy (Kevery): key event processor of owned prefixes
+        tvy (Tevery): TEL event processor
+        rvy (Revery): reply processor
+        exc (Exchanger): exchange message processor
+        cues (Deck): cues of kvy, tvy and rvy returned to front-end
+        wakes (list): of woken prefixes received from other shards
+
+    """
+
+    def __init__(self, hby, index, count, conn, mbx=None, reger=None, **kwa):
+        """
+        Parameters:
+            hby (Habery): shard database environment
+            index (int): index of this shard
+            count (int): number of shards
+            conn (Connection): pipe to front-end
+            mbx (Mailboxer | None): mailbox for forwarded exchange messages
+            reger (Reger | None): TEL database
+        """
+        super(Shard, self).__init__(**kwa)
+        self.hby = hby
+        self.index = index
+        self.count = count
+        self.conn = conn
+        self.mbx = mbx
+        self.cues = decking.Deck()
+        self.wakes = []
+
+        self.rvy = routing.Revery(db=hby.db, cues=self.cues)
+        self.kvy = eventing.Kevery(db=hby.db, lax=True, local=False, rvy=self.rvy,
+                                   cues=self.cues, owns=self.owns)
+        self.kvy.registerReplyRoutes(router=self.rvy.rtr)
+        self.tvy = Tevery(reger=reger, db=hby.db, local=False, cues=self.cues)
+        self.tvy.registerReplyRoutes(router=self.rvy.rtr)
+        handlers = [forwarding.ForwardHandler(hby=hby, mbx=mbx)] if mbx is not None else []
+        self.exc = exchanging.Exchanger(hby=hby, handlers=handlers)
+        self.parser = parsing.Parser(framed=True, kvy=self.kvy, tvy=self.tvy,
+                                     exc=self.exc, rvy=self.rvy)
+
+    def owns(self, pre):
+        """ Returns True if identifier prefix pre (str | bytes) is owned by this shard """
+        return shardOf(pre, self.count) == self.index
+
+    def recur(self, tyme):
+        """ One pass of receive, parse, escrow and return """
+        try:
+            while self.conn.poll():
+                kind, val = self.conn.recv()
+                if kind == "msg":
+                    self.parser.ims.extend(val)
+                else:
+                    self.wakes.extend(val)
+        except (EOFError, OSError):  # front-end closed so done
+            return True
+
+        if self.parser.ims:
+            self.parser.parse(local=True)
+
+        if self.hby.db.woken:  # share local wakes before adding remote ones
+            self.conn.send(("wake", list(self.hby.db.woken)))
+        for pre in self.wakes:
+            self.hby.db.wakeEscrows(pre)
+        self.wakes = []
+
+        self.kvy.processEscrows()
+        if self.index == 0:
+            self.rvy.processEscrowReply()
+            self.tvy.processEscrows()
+            self.exc.processEscrow()
+
+        if self.mbx is not None and self.mbx.marks:  # wake front-end mailbox streams
+            stored, self.mbx.marks = self.mbx.marks, dict()
+            self.conn.send(("store", stored))
+
+        while self.cues:
+            self.conn.send(("cue", self.cues.pull()))
+
+        self.hby.db.kevers.flush(keep=self.owns)
+        return False
+
+
+def runShard(name, base, bran, alias, index, count, conn):
+    """
+    Entry point of a shard process. Opens the shared databases and runs a
+    Shard until the front-end closes its pipe.
+
+    Parameters:
+        name (str): name of Habery
+        base (str): base of Habery
+        bran (str | None): passcode of Habery
+        alias (str): name of witness Hab
+        index (int): index of this shard
+        count (int): number of shards
+        conn (Connection): pipe to front-end
+    """
+    hby = habbing.Habery(name=name, base=base, bran=bran, temp=False)
+    hab = hby.habByName(name=alias)
+    reger = viring.Reger(name=hab.name, db=hab.db, temp=False)
+    mbx = storing.Mailboxer(name=alias, temp=False)
+    try:
+        shard = Shard(hby=hby, index=index, count=count, conn=conn, mbx=mbx, reger=reger)
+        doist = doing.Doist(limit=0.0, tock=0.03125, real=True)
+        doist.do(doers=[shard])
+    finally:
+        mbx.close()
+        reger.close()
+        hby.close()
+        conn.close()
+
+
+def spawnShards(hby, count, alias="witness", bran=None):
+    """ Returns couple (procs, conns) of count spawned shard processes and the
+    front-end ends of their pipes. Spawns rather than forks so no LMDB
+    environment open in the front-end is inherited.
+
+    Parameters:
+        hby (Habery): front-end database environment
+        count (int): number of shard processes
+        alias (str): name of witness Hab
+        bran (str | None): passcode of Habery
+    """
+    ctx = multiprocessing.get_context("spawn")
+    procs = []
+    conns = []
+    for index in range(count):
+        front, back = ctx.Pipe()
+        proc = ctx.Process(target=runShard, name=f"{hby.name}-shard-{index}",
+                           args=(hby.name, hby.base, bran, alias, index, count, back),
+                           daemon=True)
+        proc.start()
+        back.close()
+        procs.append(proc)
+        conns.append(front)
+
+    return procs, conns
@@ -3,6 +3,7 @@
 keri.app.storing module
 
 """
+import weakref
 
 from hio.base import doing
 from hio.help import decking
@@ -13,30 +14,84 @@ from .. import help
 from ..core import coring, serdering
 from ..core.coring import MtrDex
 from ..db import dbing, subing
+from ..help import helping
 
 logger = help.ogler.getLogger()
 
 
+class Mailwaiter:
+    """
+    Mailwaiter is registration of a mailbox stream on a Mailboxer for a set of
+    topics. Mailboxer.storeMsg adds the topic of each stored message to .woken
+    of every waiter registered for that topic so the stream only reads the
+    database when a message has landed in one of its topics.
+
+    Attributes:
+        topics (set): of bytes topics registered for
+        woken (set): of bytes topics with messages stored since last cleared
+    """
+    __slots__ = ("topics", "woken", "__weakref__")
+
+    def __init__(self, topics):
+        self.topics = set(topics)
+        self.woken = set()
+
+
 class Mailboxer(dbing.LMDBer):
     """
     Mailboxer stores exn messages in order and provider iterator access at an index.
 
+    Attributes:
+        marks (dict): per topic watermark of next fn after last message
+            stored by this process keyed by bytes topic
+        waiters (dict): weakref.WeakSet of registered Mailwaiter keyed by
+            bytes topic
+        topicQuota (int | None): max messages retained per topic
+        recipientQuota (int | None): max messages retained across all topics
+            of a recipient where topic is of form recipient/route
+        maxAge (float | None): seconds message is retained
+        stats (dict): cumulative counts of entries removed by retention
+
+    Retention never removes the latest message of a topic so that fn order
+    numbers of a topic keep increasing after trimming.
+
+    A message body stored in several topics is stored once keyed by its
+    digest and .mdts holds the datetime it was last stored in any topic. So
+    expiry of a shared body is measured from its latest store and never
+    removes an entry earlier than .maxAge after it was stored.
+
     """
     TailDirPath = "keri/mbx"
     AltTailDirPath = ".keri/mbx"
     TempPrefix = "keri_mbx_"
+    TopicQuota = None  # default unlimited
+    RecipientQuota = None  # default unlimited
+    MaxAge = None  # default no expiry
+    CompactBatch = 1000  # max removals per write transaction of compact
 
-    def __init__(self, name="mbx", headDirPath=None, reopen=True, **kwa):
+    def __init__(self, name="mbx", headDirPath=None, reopen=True, topicQuota=None,
+                 recipientQuota=None, maxAge=None, **kwa):
         """
 
         Parameters:
             headDirPath:
             perm:
             reopen:
+            topicQuota (int | None): max messages retained per topic
+            recipientQuota (int | None): max messages retained per recipient
+            maxAge (float | None): seconds message is retained
             kwa:
         """
         self.tpcs = None
         self.msgs = None
+        self.mdts = None
+        self.topicQuota = topicQuota if topicQuota is not None else self.TopicQuota
+        self.recipientQuota = (recipientQuota if recipientQuota is not None
+                               else self.RecipientQuota)
+        self.maxAge = maxAge if maxAge is not None else self.MaxAge
+        self.stats = dict(expired=0, trimmed=0, collected=0, compactions=0)
+        self.marks = dict()
+        self.waiters = dict()
 
         super(Mailboxer, self).__init__(name=name, headDirPath=headDirPath, reopen=reopen, **kwa)
 
@@ -48,11 +103,18 @@ class Mailboxer(dbing.LMDBer):
         """
         super(Mailboxer, self).reopen(**kwa)
 
-        self.tpcs = self.env.open_db(key=b'tpcs.', dupsort=True)
+        self.tpcs = self.openDB(key=b'tpcs.', dupsort=True)
         self.msgs = subing.Suber(db=self, subkey='msgs.')  # key states
+        self.mdts = subing.CesrSuber(db=self, subkey='mdts.', klas=coring.Dater)  # last stored
 
         return self.env
 
+    @property
+    def limited(self):
+        """ True when any retention limit is configured """
+        return (self.topicQuota is not None or self.recipientQuota is not None
+                or self.maxAge is not None)
+
     def delTopic(self, key):
         """
         Use snKey()
@@ -113,8 +175,187 @@ class Mailboxer(dbing.LMDBer):
             msg = msg.encode("utf-8")
 
         digb = coring.Diger(ser=msg, code=MtrDex.Blake3_256).qb64b
-        self.appendToTopic(topic=topic, val=digb)
-        return self.msgs.pin(keys=digb, val=msg)
+        ion = self.appendToTopic(topic=topic, val=digb)
+        result = self.msgs.pin(keys=digb, val=msg)
+        self.mdts.pin(keys=digb, val=coring.Dater())
+
+        self.notify(topic=topic, mark=ion + 1)
+
+        return result
+
+    def notify(self, topic, mark):
+        """
+        Advances watermark of topic to mark and wakes waiters registered for
+        topic. Used by .storeMsg and for messages stored in the shared
+        database by another process such as a shard.
+
+        Parameters:
+            topic (bytes | str): topic of stored message
+            mark (int): next fn after last message stored in topic
+
+        """
+        if hasattr(topic, "encode"):
+            topic = topic.encode("utf-8")
+
+        if mark > self.marks.get(topic, 0):
+            self.marks[topic] = mark
+        for waiter in self.waiters.get(topic, ()):
+            waiter.woken.add(topic)
+
+    def register(self, topics):
+        """
+        Returns Mailwaiter registered to be woken on messages stored in topics.
+        Registration is weak so it lapses when the waiter is garbage collected.
+
+        Parameters:
+            topics (Iterable): of str or bytes topics
+
+        """
+        topics = [topic.encode("utf-8") if hasattr(topic, "encode") else topic
+                  for topic in topics]
+        waiter = Mailwaiter(topics=topics)
+        for topic in waiter.topics:
+            self.waiters.setdefault(topic, weakref.WeakSet()).add(waiter)
+        return waiter
+
+    def unregister(self, waiter):
+        """
+        Removes registration of waiter from all its topics
+
+        Parameters:
+            waiter (Mailwaiter): registration returned by .register
+
+        """
+        for topic in waiter.topics:
+            if (waiters := self.waiters.get(topic)) is not None:
+                waiters.discard(waiter)
+                if not waiters:
+                    del self.waiters[topic]
+
+    def trimTopic(self, topic, fn):
+        """
+        Removes messages of topic before fn such as those acknowledged by the
+        recipient as received. Latest message of topic is always kept.
+        Message bodies no longer in any topic are removed by .compact.
+
+        Returns:
+            count (int): number of topic entries removed
+
+        Parameters:
+            topic (str | bytes): topic of messages
+            fn (int): first seen order number of first message to keep
+
+        """
+        if hasattr(topic, "encode"):
+            topic = topic.encode("utf-8")
+
+        iokeys = [bytes(iokey) for iokey, _ in self.getIoSetItemsIter(self.tpcs, key=topic)]
+        iokeys = [iokey for iokey in iokeys[:-1] if dbing.unsuffix(iokey)[1] < fn]
+        for iokey in iokeys:
+            self.delVal(self.tpcs, iokey)
+
+        self.stats["trimmed"] += len(iokeys)
+        return len(iokeys)
+
+    def compact(self, now=None):
+        """
+        Applies retention to all topics and removes orphaned message bodies.
+        Expires messages older than .maxAge, then trims oldest messages of each
+        topic beyond .topicQuota and of each recipient beyond .recipientQuota.
+        Latest message of each topic is always kept.
+
+        Scans without a write transaction and then removes in write
+        transactions of at most .CompactBatch entries each so that writers
+        are never blocked for a whole scan. A body stored again after the scan
+        started is not collected since its .mdts datetime is later.
+
+        Returns:
+            stats (dict): counts for this compaction of expired, trimmed and
+                collected entries and of remaining topics and msgs
+
+        Parameters:
+            now (datetime | None): current datetime for expiry. Default now
+
+        """
+        scanned = helping.nowUTC()
+        now = now if now is not None else scanned
+        stats = dict(expired=0, trimmed=0, collected=0, topics=0, msgs=0)
+
+        topics = dict()  # topic to list of (iokey, dig) in order
+        for iokey, dig in self.getTopItemIter(db=self.tpcs):
+            topic, _ = dbing.unsuffix(iokey)
+            topics.setdefault(topic, []).append((bytes(iokey), bytes(dig)))
+
+        dates = dict()
+
+        def dated(dig):
+            if dig not in dates:
+                dater = self.mdts.get(keys=dig)
+                dates[dig] = dater.datetime if dater is not None else now
+            return dates[dig]
+
+        removes = []
+        recipients = dict()  # recipient to list of retained (iokey, dig)
+        for topic, entries in topics.items():
+            removable, last = entries[:-1], entries[-1:]
+            if self.maxAge is not None:
+                kept = []
+                for entry in removable:
+                    if (now - dated(entry[1])).total_seconds() > self.maxAge:
+                        removes.append(entry)
+                        stats["expired"] += 1
+                    else:
+                        kept.append(entry)
+                removable = kept
+
+            if self.topicQuota is not None and len(removable) + 1 > self.topicQuota:
+                cut = len(removable) + 1 - max(self.topicQuota, 1)
+                removes.extend(removable[:cut])
+                stats["trimmed"] += cut
+                removable = removable[cut:]
+
+            topics[topic] = removable + last
+            recipient = topic.split(b'/', 1)[0]
+            recipients.setdefault(recipient, []).extend(removable + last)
+
+        if self.recipientQuota is not None:
+            lasts = set(entries[-1] for entries in topics.values())
+            for recipient, entries in recipients.items():
+                if (excess := len(entries) - self.recipientQuota) <= 0:
+                    continue
+                removable = sorted((entry for entry in entries if entry not in lasts),
+                                   key=lambda entry: dated(entry[1]))[:excess]
+                removes.extend(removable)
+                stats["trimmed"] += len(removable)
+
+        removed = set(removes)
+        kept = set(dig for entries in topics.values() for (iokey, dig) in entries
+                   if (iokey, dig) not in removed)
+        orphans = [dig for (dig,), _ in self.msgs.getItemIter()
+                   if dig.encode("utf-8") not in kept]
+
+        for i in range(0, len(removes), self.CompactBatch):
+            with self.trans():
+                for iokey, _ in removes[i:i + self.CompactBatch]:
+                    self.delVal(self.tpcs, iokey)
+
+        # garbage collect message bodies no longer in any topic
+        for i in range(0, len(orphans), self.CompactBatch):
+            with self.trans():
+                for dig in orphans[i:i + self.CompactBatch]:
+                    dater = self.mdts.get(keys=dig)
+                    if dater is not None and dater.datetime > scanned:
+                        continue  # stored again since scan
+                    self.msgs.rem(keys=dig)
+                    self.mdts.rem(keys=dig)
+                    stats["collected"] += 1
+
+        stats["msgs"] = len(kept)
+        stats["topics"] = len(topics)
+        for key in ("expired", "trimmed", "collected"):
+            self.stats[key] += stats[key]
+        self.stats["compactions"] += 1
+        return stats
 
     def cloneTopicIter(self, topic, fn=0):
         """
@@ -131,6 +372,48 @@ class Mailboxer(dbing.LMDBer):
                 yield ion, topic, msg.encode("utf-8")
 
 
+class MailboxCompactor(doing.Doer):
+    """
+    MailboxCompactor periodically applies Mailboxer retention and garbage
+    collection via Mailboxer.compact. Skips the compaction when no retention
+    limit is configured and no topic entries were trimmed since the last one
+    since then there is nothing to remove.
+
+    Attributes:
+        mbx (Mailboxer): mailbox database to compact
+        period (float): seconds between compactions
+        last (float | None): tyme of last compaction
+        stats (dict | None): stats of last compaction
+        trimmed (int): mbx.stats trimmed count as of last compaction
+
+    """
+    Period = 3600.0  # default seconds between compactions
+
+    def __init__(self, mbx, period=None, **kwa):
+        """
+        Parameters:
+            mbx (Mailboxer): mailbox database to compact
+            period (float | None): seconds between compactions
+        """
+        super(MailboxCompactor, self).__init__(**kwa)
+        self.mbx = mbx
+        self.period = period if period is not None else self.Period
+        self.last = None
+        self.stats = None
+        self.trimmed = mbx.stats["trimmed"]
+
+    def recur(self, tyme):
+        """ Compact when period has elapsed since last compaction """
+        if self.last is None or tyme - self.last >= self.period:
+            self.last = tyme
+            if self.mbx.limited or self.mbx.stats["trimmed"] != self.trimmed:
+                self.stats = self.mbx.compact()
+                self.trimmed = self.mbx.stats["trimmed"]
+                logger.info("Mailbox compaction: %s", self.stats)
+
+        return False  # never done
+
+
 class Respondant(doing.DoDoer):
     """
     Respondant processes buffer of response messages from inbound 'exn' messages and
@@ -4,6 +4,7 @@ keri.core.coring module
 
 """
 import re
+import functools
 import json
 from typing import Union
 from collections.abc import Sequence, Mapping
@@ -40,7 +41,7 @@ from ..kering import (Versionage, Version, VERRAWSIZE, VERFMT, MAXVERFULLSPAN,
 from ..kering import Serials, Serialage, Protocols, Protocolage, Ilkage, Ilks
 
 
-from ..help import helping
+from ..help import helping, metering
 from ..help.helping import sceil, nonStringIterable, nonStringSequence
 from ..help.helping import (intToB64, intToB64b, b64ToInt, B64_CHARS,
                             codeB64ToB2, codeB2ToB64, Reb64, nabSextets)
@@ -668,8 +669,13 @@ class Matter:
                                    (fully qualified Base64)
         _exfil (types.MethodType): extracts .code and .raw from qb64b
                                    (fully qualified Base64)
+        _qb64b (bytes | None): cached .qb64b None means not yet computed
+        _qb64 (str | None): cached .qb64 None means not yet computed
+        _qb2 (bytes | None): cached .qb2 None means not yet computed
 
     """
+    __slots__ = ('_code', '_size', '_raw', '_qb64b', '_qb64', '_qb2')
+
     Codex = MtrDex
     # Hards table maps from bytes Base64 first code char to int of hard size, hs,
     # (stable) of code. The soft size, ss, (unstable) is always 0 for Matter
@@ -802,6 +808,7 @@ class Matter:
             .raw and .code and .size and .rsize
 
         """
+        self._qb64b = self._qb64 = self._qb2 = None  # encodings computed lazily
         size = None  # variable raw binary size including leader in quadlets
         if raw is not None:  # raw provided
             if not code:
@@ -962,8 +969,11 @@ class Matter:
         Property qb64b:
         Returns Fully Qualified Base64 Version encoded as bytes
         Assumes self.raw and self.code are correctly populated
+        Cached since immutable once computed
         """
-        return self._infil()
+        if self._qb64b is None:
+            self._qb64b = self._infil()
+        return self._qb64b
 
     @property
     def qb64(self):
@@ -971,16 +981,22 @@ class Matter:
         Property qb64:
         Returns Fully Qualified Base64 Version
         Assumes self.raw and self.code are correctly populated
+        Cached since immutable once computed
         """
-        return self.qb64b.decode("utf-8")
+        if self._qb64 is None:
+            self._qb64 = self.qb64b.decode("utf-8")
+        return self._qb64
 
     @property
     def qb2(self):
         """
         Property qb2:
         Returns Fully Qualified Binary Version Bytes
+        Cached since immutable once computed
         """
-        return self._binfil()
+        if self._qb2 is None:
+            self._qb2 = self._binfil()
+        return self._qb2
 
     @property
     def transferable(self):
@@ -1188,6 +1204,8 @@ class Matter:
         self._code = hard  # hard only
         self._size = size
         self._raw = raw  # ensure bytes so immutable and for crypto ops
+        self._qb64b = bytes(qb64b)  # keep source so no need to re-encode
+        self._qb64 = self._qb2 = None
 
 
     def _bexfil(self, qb2):
@@ -1271,6 +1289,8 @@ class Matter:
         self._code = hard
         self._size = size
         self._raw = bytes(raw)  # ensure bytes so immutable and crypto operations
+        self._qb2 = bytes(qb2)  # keep source so no need to re-encode
+        self._qb64b = self._qb64 = None
 
 
 class Seqner(Matter):
@@ -1313,6 +1333,8 @@ class Seqner(Matter):
     Methods:
 
     """
+    __slots__ = ()
+
 
     def __init__(self, raw=None, qb64b=None, qb64=None, qb2=None,
                  code=MtrDex.Salt_128, sn=None, snh=None, **kwa):
@@ -1434,6 +1456,8 @@ class Number(Matter):
 
     Methods:
     """
+    __slots__ = ()
+
     Codex = NumDex
 
     def __init__(self, raw=None, qb64b=None, qb64=None, qb2=None,
@@ -1683,6 +1707,8 @@ class Dater(Matter):
     Methods:
 
     """
+    __slots__ = ()
+
     ToB64 = str.maketrans(":.+", "cdp")  #  translate characters
     FromB64 = str.maketrans("cdp", ":.+")  #  translate characters
 
@@ -1836,6 +1862,8 @@ class Texter(Matter):
         Bytes_Big_L2: str = '9AAB'  # Byte String big lead size 2
 
     """
+    __slots__ = ()
+
 
     def __init__(self, raw=None, qb64b=None, qb64=None, qb2=None,
                  code=MtrDex.Bytes_L0, text=None, **kwa):
@@ -1940,6 +1968,8 @@ class Bexter(Matter):
         StrB64_Big_L2: str = '9AAA'  # String Base64 Only Big Leader Size 2
 
     """
+    __slots__ = ()
+
 
     def __init__(self, raw=None, qb64b=None, qb64=None, qb2=None,
                  code=MtrDex.StrB64_L0, bext=None, **kwa):
@@ -2033,6 +2063,8 @@ class Pather(Bexter):
         qb64 = '4AAC-A-1-B-3'
 
     """
+    __slots__ = ()
+
 
     def __init__(self, raw=None, qb64b=None, qb64=None, qb2=None, bext=None,
                  code=MtrDex.StrB64_L0, path=None, **kwa):
@@ -2249,6 +2281,8 @@ class Verfer(Matter):
         verify: verifies signature
 
     """
+    __slots__ = ('_verify',)
+
 
     def __init__(self, **kwa):
         """
@@ -2266,6 +2300,7 @@ class Verfer(Matter):
         else:
             raise ValueError("Unsupported code = {} for verifier.".format(self.code))
 
+    @metering.timed("keri_verfer_verify", label=lambda self, *pa, **kwa: self.code)
     def verify(self, sig, ser):
         """
         Returns True if bytes signature sig verifies on bytes serialization ser
@@ -2382,6 +2417,8 @@ class Cigar(Matter):
         ._exfil is method to extract .code and .raw from fully qualified Base64
 
     """
+    __slots__ = ('_verfer',)
+
 
     def __init__(self, verfer=None, **kwa):
         """
@@ -2450,6 +2487,8 @@ class Signer(Matter):
         sign: create signature
 
     """
+    __slots__ = ('_sign', '_verfer')
+
 
     def __init__(self, raw=None, code=MtrDex.Ed25519_Seed, transferable=True, **kwa):
         """
@@ -2744,6 +2783,8 @@ class Salter(Matter):
         ._exfil is method to extract .code and .raw from fully qualified Base64
 
     """
+    __slots__ = ('tier',)
+
     Tier = Tiers.low
 
     def __init__(self, raw=None, code=MtrDex.Salt_128, tier=None, **kwa):
@@ -2864,6 +2905,8 @@ class Cipher(Matter):
     See Matter for inherited attributes and properties
 
     """
+    __slots__ = ()
+
 
     def __init__(self, raw=None, code=None, **kwa):
         """
@@ -2929,6 +2972,8 @@ class Encrypter(Matter):
         encrypt: returns cipher text
 
     """
+    __slots__ = ('_encrypt',)
+
 
     def __init__(self, raw=None, code=MtrDex.X25519, verkey=None, **kwa):
         """
@@ -3043,6 +3088,8 @@ class Decrypter(Matter):
         decrypt: create cipher text
 
     """
+    __slots__ = ('_decrypt',)
+
 
     def __init__(self, code=MtrDex.X25519_Private, seed=None, **kwa):
         """
@@ -3140,6 +3187,8 @@ class Diger(Matter):
 
 
     """
+    __slots__ = ('_verify',)
+
 
     def __init__(self, raw=None, ser=None, code=MtrDex.Blake3_256, **kwa):
         """
@@ -3372,6 +3421,8 @@ class Prefixer(Matter):
         ._infil is method to compute fully qualified Base64 from .raw and .code
         ._exfil is method to extract .code and .raw from fully qualified Base64
     """
+    __slots__ = ('_derive', '_verify')
+
     Dummy = "#"  # dummy spaceholder char for pre. Must not be a valid Base64 char
 
     def __init__(self, raw=None, code=None, ked=None, allows=None, **kwa):
@@ -3675,6 +3726,8 @@ class Saider(Matter):
         _verify (types.MethodType): verifies said ((.qb64 ) against a given sad
 
     """
+    __slots__ = ()
+
     Dummy = "#"  # dummy spaceholder char for said. Must not be a valid Base64 char
     # should be same set of codes as in coring.DigestCodex coring.DigDex so
     # .digestive property works. Unit test ensures code sets match
@@ -4073,8 +4126,13 @@ class Indexer:
         ._binfil is method to compute fully qualified Base2 from .raw and .code
         ._exfil is method to extract .code and .raw from fully qualified Base64
         ._bexfil is method to extract .code and .raw from fully qualified Base2
+        ._qb64b (bytes | None): cached .qb64b None means not yet computed
+        ._qb64 (str | None): cached .qb64 None means not yet computed
+        ._qb2 (bytes | None): cached .qb2 None means not yet computed
 
     """
+    __slots__ = ('_code', '_index', '_ondex', '_raw', '_qb64b', '_qb64', '_qb2')
+
     Codex = IdrDex
     # Hards table maps from bytes Base64 first code char to int of hard size, hs,
     # (stable) of code. The soft size, ss, (unstable) is always > 0 for Indexer.
@@ -4134,6 +4192,7 @@ class Indexer:
         .raw, .code, .index, .ondex.
 
         """
+        self._qb64b = self._qb64 = self._qb2 = None  # encodings computed lazily
         if raw is not None:  # raw provided
             if not code:
                 raise EmptyMaterialError("Improper initialization need either "
@@ -4254,8 +4313,11 @@ class Indexer:
         Property qb64b:
         Returns Fully Qualified Base64 Version encoded as bytes
         Assumes self.raw and self.code are correctly populated
+        Cached since immutable once computed
         """
-        return self._infil()
+        if self._qb64b is None:
+            self._qb64b = self._infil()
+        return self._qb64b
 
     @property
     def qb64(self):
@@ -4263,16 +4325,22 @@ class Indexer:
         Property qb64:
         Returns Fully Qualified Base64 Version
         Assumes self.raw and self.code are correctly populated
+        Cached since immutable once computed
         """
-        return self.qb64b.decode("utf-8")
+        if self._qb64 is None:
+            self._qb64 = self.qb64b.decode("utf-8")
+        return self._qb64
 
     @property
     def qb2(self):
         """
         Property qb2:
         Returns Fully Qualified Binary Version Bytes
+        Cached since immutable once computed
         """
-        return self._binfil()
+        if self._qb2 is None:
+            self._qb2 = self._binfil()
+        return self._qb2
 
     def _infil(self):
         """
@@ -4509,6 +4577,8 @@ class Indexer:
         self._index = index
         self._ondex = ondex
         self._raw = raw  # must be bytes for crpto opts and immutable not bytearray
+        self._qb64b = bytes(qb64b)  # keep source so no need to re-encode
+        self._qb64 = self._qb2 = None
 
 
 
@@ -4614,6 +4684,8 @@ class Indexer:
         self._index = index
         self._ondex = ondex
         self._raw = bytes(raw)  # must be bytes for crypto ops and not bytearray mutable
+        self._qb2 = bytes(qb2)  # keep source so no need to re-encode
+        self._qb64b = self._qb64 = None
 
 
 class Siger(Indexer):
@@ -4637,6 +4709,8 @@ class Siger(Indexer):
 
 
     """
+    __slots__ = ('_verfer',)
+
 
     def __init__(self, verfer=None, **kwa):
         """Initialze instance
@@ -4746,8 +4820,13 @@ class Counter:
         ._count is int value for .count property
         ._infil is method to compute fully qualified Base64 from .raw and .code
         ._exfil is method to extract .code and .raw from fully qualified Base64
+        ._qb64b (bytes | None): cached .qb64b None means not yet computed
+        ._qb64 (str | None): cached .qb64 None means not yet computed
+        ._qb2 (bytes | None): cached .qb2 None means not yet computed
 
     """
+    __slots__ = ('_code', '_count', '_qb64b', '_qb64', '_qb2')
+
     # Hards table maps from bytes Base64 first two code chars to int of
     # hard size, hs,(stable) of code. The soft size, ss, (unstable) for Counter
     # is always > 0 and hs + ss = fs always
@@ -4812,6 +4891,7 @@ class Counter:
         .code and .count
 
         """
+        self._qb64b = self._qb64 = self._qb2 = None  # encodings computed lazily
         if code is not None:  # code provided
             if code not in self.Sizes:
                 raise InvalidCodeError("Unsupported code={}.".format(code))
@@ -4873,8 +4953,11 @@ class Counter:
         Property qb64b:
         Returns Fully Qualified Base64 Version encoded as bytes
         Assumes self.raw and self.code are correctly populated
+        Cached since immutable once computed
         """
-        return self._infil()
+        if self._qb64b is None:
+            self._qb64b = self._infil()
+        return self._qb64b
 
 
     @property
@@ -4883,8 +4966,11 @@ class Counter:
         Property qb64:
         Returns Fully Qualified Base64 Version
         Assumes self.raw and self.code are correctly populated
+        Cached since immutable once computed
         """
-        return self.qb64b.decode("utf-8")
+        if self._qb64 is None:
+            self._qb64 = self.qb64b.decode("utf-8")
+        return self._qb64
 
 
     @property
@@ -4892,8 +4978,11 @@ class Counter:
         """
         Property qb2:
         Returns Fully Qualified Binary Version Bytes
+        Cached since immutable once computed
         """
-        return self._binfil()
+        if self._qb2 is None:
+            self._qb2 = self._binfil()
+        return self._qb2
 
 
     def countToB64(self, l=None):
@@ -5042,6 +5131,7 @@ class Counter:
 
         self._code = hard
         self._count = count
+        self._qb64b = self._qb64 = self._qb2 = None
 
 
     def _bexfil(self, qb2):
@@ -5083,6 +5173,7 @@ class Counter:
 
         self._code = hard
         self._count = count
+        self._qb64b = self._qb64 = self._qb2 = None
 
 
 class Sadder:
@@ -5758,6 +5849,7 @@ class Tholder:
 
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def weight(w: str) -> Fraction:
         """Returns valid weight from w else raises error (ValueError or TypeError).
         w expression must evaluate to 0, 1, or strict proper rational fraction.
@@ -4,9 +4,10 @@ keri.core.eventing module
 
 """
 import datetime
-import json
 import logging
+import os
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, astuple, asdict, field
 from urllib.parse import urlsplit
 from math import ceil
@@ -35,7 +36,7 @@ from ..kering import (MissingEntryError,
                       MissingDelegableApprovalError)
 from ..kering import Version, Versionage
 
-from ..help import helping
+from ..help import helping, metering, ogling
 
 logger = help.ogler.getLogger()
 
@@ -43,6 +44,12 @@ EscrowTimeoutPS = 3600  # seconds for partial signed escrow timeout
 
 MaxIntThold = 2 ** 32 - 1
 
+# min number of unique sigs on one msg before verifySigs verifies them in
+# parallel. libsodium and openssl release the GIL while verifying
+BatchVerifySize = 8
+
+_verifyPool = None  # ThreadPoolExecutor shared by verifySigs, created lazily
+
 @dataclass(frozen=True)
 class TraitCodex:
     """
@@ -416,7 +423,7 @@ def deTransReceiptQuintuple(data, strip=False):
 
 
 
-def verifySigs(raw, sigers, verfers):
+def verifySigs(raw, sigers, verfers, tholder=None):
     """
     Returns tuple of (vsigers, vindices) where:
         vsigers is list  of unique verified sigers with assigned verfer
@@ -431,35 +438,76 @@ def verifySigs(raw, sigers, verfers):
         raw (bytes) signed data
         sigers is list of indexed Siger instances (signatures)
         verfers is list of Verfer instance (public keys)
+        tholder (Tholder | None): when provided stop verifying as soon as
+            tholder is satisfied by the verified indices. Only use when the
+            extra verified sigers beyond the threshold are not needed.
+            None means verify all sigers
 
     """
     if sigers is None:
         sigers = []
-    # Ensure no duplicate sigers by using set math on sigers' sigs otherwise
-    # indices count for threshold will be erroneous. Does not modify in place
-    # passed in sigers list, but instead depends on caller to use indices to
-    # modify its copy to filter out unverifiable or duplicate sigers
-    usigs = oset([siger.qb64 for siger in sigers])
-    usigers = [Siger(qb64=sig) for sig in usigs]
-
-    # verify indexes of attached signatures against verifiers and assign
-    # verfer to each siger
-    for siger in usigers:
+    # Ensure no duplicate sigers by deduping on sigers' raw sigs and indexes
+    # otherwise indices count for threshold will be erroneous. Does not modify
+    # in place passed in sigers list, but instead depends on caller to use
+    # indices to modify its copy to filter out unverifiable or duplicate sigers
+    usigers = []
+    seen = set()
+    for siger in sigers:
+        key = (siger.code, siger.index, siger.ondex, siger.raw)
+        if key in seen:
+            continue
+        seen.add(key)
+        # verify indexes of attached signatures against verifiers and assign
+        # verfer to each siger
         if siger.index >= len(verfers):
             logger.info("Skipped sig: Index=%s to large.\n", siger.index)
+            continue
         siger.verfer = verfers[siger.index]  # assign verfer
+        usigers.append(siger)
 
     # create lists of unique verified signatures and indices
     vindices = []
     vsigers = []
-    for siger in usigers:
-        if siger.verfer.verify(siger.raw, raw):
+    if tholder is not None:  # short circuit once threshold satisfied
+        for siger in usigers:
+            if siger.verfer.verify(siger.raw, raw):
+                vindices.append(siger.index)
+                vsigers.append(siger)
+                if tholder.satisfy(vindices):
+                    break
+
+        return (vsigers, vindices)
+
+    for siger, verified in zip(usigers, _verifyBatch(raw, usigers)):
+        if verified:
             vindices.append(siger.index)
             vsigers.append(siger)
 
     return (vsigers, vindices)
 
 
+def _verifyBatch(raw, sigers):
+    """
+    Returns list of bools, one per siger in sigers, True when siger verifies
+    on raw with its assigned .verfer. Verifies in parallel on the shared
+    thread pool when there are at least BatchVerifySize sigers.
+
+    Parameters:
+        raw (bytes): signed data
+        sigers (list): Siger instances each with assigned .verfer
+    """
+    if len(sigers) < BatchVerifySize:
+        return [siger.verfer.verify(siger.raw, raw) for siger in sigers]
+
+    global _verifyPool
+    if _verifyPool is None:
+        _verifyPool = ThreadPoolExecutor(max_workers=min(32, os.cpu_count() or 1),
+                                         thread_name_prefix="verifySigs")
+
+    return list(_verifyPool.map(lambda siger: siger.verfer.verify(siger.raw, raw),
+                                sigers))
+
+
 def validateSigs(serder, sigers, verfers, tholder):
     """
     Validates signatures given by sigers using keys given by verfers on msg
@@ -2948,51 +2996,55 @@ class Kever:
         dgkeys = (serder.pre, serder.said)
         dgkey = dgKey(serder.preb, serder.saidb)
         dtsb = helping.nowIso8601().encode("utf-8")
-        self.db.putDts(dgkey, dtsb)  # idempotent do not change dts if already
-        if sigers:
-            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])  # idempotent
-        if wigers:
-            self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
-        if wits:
-            self.db.wits.put(keys=dgkey, vals=[coring.Prefixer(qb64=w) for w in wits])
-
-        self.db.putEvt(dgkey, serder.raw)  # idempotent (maybe already excrowed)
-        # update event source
-        if (esr := self.db.esrs.get(keys=dgkeys)):  # preexisting esr
-            if local and not esr.local:  # local overwrites prexisting remote
-                esr.local = local
-                self.db.esrs.pin(keys=dgkeys, val=esr)
-            # otherwise don't change
-        else:  # not preexisting so put
-            esr = basing.EventSourceRecord(local=local)
-            self.db.esrs.put(keys=dgkeys, val=esr)
-
-        val = (coring.Prefixer(qb64b=serder.preb), coring.Seqner(sn=serder.sn))
-        for verfer in (serder.verfers if serder.verfers is not None else []):
-            self.db.pubs.add(keys=(verfer.qb64,), val=val)
-        for diger in (serder.ndigers if serder.ndigers is not None else []):
-            self.db.digs.add(keys=(diger.qb64,), val=val)
-        if first:  # append event dig to first seen database in order
-            if seqner and saider:  # delegation for authorized delegated or issued event
-                couple = seqner.qb64b + saider.qb64b
-                self.db.setAes(dgkey, couple)  # authorizer (delegator/issuer) event seal
-            fn = self.db.appendFe(serder.preb, serder.saidb)
-            if firner and fn != firner.sn:  # cloned replay but replay fn not match
-                if self.cues is not None:  # cue to notice BadCloneFN
-                    self.cues.push(dict(kin="noticeBadCloneFN", serder=serder,
-                                          fn=fn, firner=firner, dater=dater))
-                logger.info("Kever Mismatch Cloned Replay FN: %s First seen "
-                            "ordinal fn %s and clone fn %s \nEvent=\n%s\n",
-                            serder.preb, fn, firner.sn, serder.pretty())
-            if dater:  # cloned replay use original's dts from dater
-                dtsb = dater.dtsb
-            self.db.setDts(dgkey, dtsb)  # first seen so set dts to now
-            self.db.fons.pin(keys=dgkey, val=Seqner(sn=fn))
-            logger.info("Kever state: %s First seen ordinal %s at %s\nEvent=\n%s\n",
-                        serder.preb, fn, dtsb.decode("utf-8"), serder.pretty())
-        self.db.addKe(snKey(serder.preb, serder.sn), serder.saidb)
+        # commit event and all its indexes atomically in one write transaction
+        with self.db.trans():
+            self.db.putDts(dgkey, dtsb)  # idempotent do not change dts if already
+            if sigers:
+                self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])  # idempotent
+            if wigers:
+                self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            if wits:
+                self.db.wits.put(keys=dgkey, vals=[coring.Prefixer(qb64=w) for w in wits])
+
+            self.db.putEvt(dgkey, serder.raw)  # idempotent (maybe already excrowed)
+            # update event source
+            if (esr := self.db.esrs.get(keys=dgkeys)):  # preexisting esr
+                if local and not esr.local:  # local overwrites prexisting remote
+                    esr.local = local
+                    self.db.esrs.pin(keys=dgkeys, val=esr)
+                # otherwise don't change
+            else:  # not preexisting so put
+                esr = basing.EventSourceRecord(local=local)
+                self.db.esrs.put(keys=dgkeys, val=esr)
+
+            val = (coring.Prefixer(qb64b=serder.preb), coring.Seqner(sn=serder.sn))
+            for verfer in (serder.verfers if serder.verfers is not None else []):
+                self.db.pubs.add(keys=(verfer.qb64,), val=val)
+            for diger in (serder.ndigers if serder.ndigers is not None else []):
+                self.db.digs.add(keys=(diger.qb64,), val=val)
+            self.db.indexSeals(serder)  # anchored seals for findAnchoringSeal
+            if first:  # append event dig to first seen database in order
+                if seqner and saider:  # delegation for authorized delegated or issued event
+                    couple = seqner.qb64b + saider.qb64b
+                    self.db.setAes(dgkey, couple)  # authorizer (delegator/issuer) event seal
+                fn = self.db.appendFe(serder.preb, serder.saidb)
+                if firner and fn != firner.sn:  # cloned replay but replay fn not match
+                    if self.cues is not None:  # cue to notice BadCloneFN
+                        self.cues.push(dict(kin="noticeBadCloneFN", serder=serder,
+                                              fn=fn, firner=firner, dater=dater))
+                    logger.info("Kever Mismatch Cloned Replay FN: %s First seen "
+                                "ordinal fn %s and clone fn %s \nEvent=\n%s\n",
+                                serder.preb, fn, firner.sn, ogling.pretty(serder))
+                if dater:  # cloned replay use original's dts from dater
+                    dtsb = dater.dtsb
+                self.db.setDts(dgkey, dtsb)  # first seen so set dts to now
+                self.db.fons.pin(keys=dgkey, val=Seqner(sn=fn))
+                logger.info("Kever state: %s First seen ordinal %s at %s\nEvent=\n%s\n",
+                            serder.preb, fn, dtsb.decode("utf-8"), ogling.pretty(serder))
+            self.db.addKe(snKey(serder.preb, serder.sn), serder.saidb)
+        self.db.wakeEscrows(serder.preb)  # escrows waiting on this KEL may now pass
         logger.info("Kever state: %s Added to KEL valid event=\n%s\n",
-                    serder.preb, serder.pretty())
+                    serder.preb, ogling.pretty(serder))
         return (fn, dtsb.decode("utf-8"))  # (fn int, dts str) if first else (None, dts str)
 
 
@@ -3034,7 +3086,7 @@ class Kever:
         self.db.misfits.add(snKey(serder.preb, serder.sn), serder.saidb)
         # log escrowed
         logger.info("Kever state: escrowed misfit event=\n%s\n",
-                    json.dumps(serder.ked, indent=1))
+                    ogling.dumps(serder.ked))
 
 
     def escrowDelegableEvent(self, serder, sigers, wigers=None, local=True):
@@ -3072,7 +3124,7 @@ class Kever:
         self.db.delegables.add(snKey(serder.preb, serder.sn), serder.saidb)
         # log escrowed
         logger.info("Kever state: escrowed delegable event=\n%s\n",
-                    json.dumps(serder.ked, indent=1))
+                    ogling.dumps(serder.ked))
 
 
     def escrowPSEvent(self, serder, sigers, wigers=None, local=True):
@@ -3109,6 +3161,10 @@ class Kever:
 
         snkey = snKey(serder.preb, serder.sn)
         self.db.addPse(snkey, serder.saidb)  # b'EOWwyMU3XA7RtWdelFt-6waurOTH_aW_Z9VTaU-CshGk.00000000000000000000000000000001'
+        if serder.ilk == Ilks.dip:  # wait on delegator's KEL for delegating seal
+            self.db.waitEscrows(serder.preb, serder.delpre)
+        elif serder.ilk == Ilks.drt and self.delpre:
+            self.db.waitEscrows(serder.preb, self.delpre)
         logger.info("Kever state: Escrowed partially signed or delegated "
                     "event = %s\n", serder.ked)
 
@@ -3361,6 +3417,26 @@ class Kever:
 
 
 
+class OwnedPrefixes:
+    """
+    Set like view of identifier prefixes restricted to those owned by a
+    Kevery. Used as pres of escrow processing so that only escrowed items of
+    owned prefixes are reattempted.
+
+    Attributes:
+        owns (Callable): returns True when bytes identifier prefix is owned
+        pres (set | None): bytes identifier prefixes to reattempt. None means all
+    """
+    __slots__ = ("owns", "pres")
+
+    def __init__(self, owns, pres=None):
+        self.owns = owns
+        self.pres = pres
+
+    def __contains__(self, pre):
+        return self.owns(pre) and (self.pres is None or pre in self.pres)
+
+
 class Kevery:
     """
     Kevery (Key Event Message Processing Facility) processes an incoming
@@ -3395,6 +3471,8 @@ class Kevery:
                 non-idempotent way. Useful for reinitializing the Kevers from
                 a persisted KEL without updating non-idempotent first seen .fels
                 and timestamps.
+        owns (Callable | None): returns True when bytes identifier prefix is
+                owned so its escrowed items are reattempted. None means all
 
 
     Properties:
@@ -3413,9 +3491,11 @@ class Kevery:
     TimeoutVRE = 3600  # seconds to timeout unverified transferable receipt escrows
     TimeoutKSN = 3600  # seconds to timeout key state notice message escrows
     TimeoutQNF = 300   # seconds to timeout query not found escrows
+    SweepPeriod = 60  # seconds between full escrow passes that check timeouts
 
     def __init__(self, *, cues=None, db=None, rvy=None,
-                 lax=True, local=False, cloned=False, direct=True, check=False):
+                 lax=True, local=False, cloned=False, direct=True, check=False,
+                 owns=None):
         """
         Initialize instance:
 
@@ -3437,6 +3517,9 @@ class Kevery:
                 non-idempotent way. Useful for reinitializing the Kevers from
                 a persisted KEL without updating non-idempotent first seen .fels
                 and timestamps.
+            owns (Callable | None): returns True when bytes identifier prefix
+                is owned by this Kevery so its escrowed items are reattempted
+                here. None means owns all prefixes.
         """
         self.cues = cues if cues is not None else decking.Deck()  # subclass of deque
         if db is None:
@@ -3448,6 +3531,9 @@ class Kevery:
         self.cloned = True if cloned else False  # process as cloned
         self.direct = True if direct else False  # process as direct mode
         self.check = True if check else False  # process as check mode
+        self.swept = None  # datetime of last full escrow pass None means never
+        self.reprocessing = False  # True while reattempting escrowed items
+        self.owns = owns
 
     @property
     def kevers(self):
@@ -3492,6 +3578,7 @@ class Kevery:
         return []
 
 
+    @metering.timed("keri_kevery_event", label=lambda self, serder, *pa, **kwa: serder.ilk)
     def processEvent(self, serder, sigers, *, wigers=None,
                      delseqner=None, delsaider=None,
                      firner=None, dater=None, local=None):
@@ -3524,6 +3611,8 @@ class Kevery:
         # fetch ked ilk  pre, sn, dig to see how to process
         pre = serder.pre
         ked = serder.ked
+        if not self.reprocessing:  # new sigs may complete escrowed events of pre
+            self.db.wakeEscrows(serder.preb)
 
         # See todo for Prefixer fix redundancy XXX
         try:  # see if code of pre is supported and matches size of pre
@@ -3763,6 +3852,8 @@ class Kevery:
         # fetch  pre dig to process
         ked = serder.ked
         pre = serder.pre
+        if not self.reprocessing:  # receipts may complete escrowed items of pre
+            self.db.wakeEscrows(serder.preb)
         sn = serder.sn
 
         # Only accept receipt if for last seen version of event at sn
@@ -3794,11 +3885,11 @@ class Kevery:
                     if pre in self.prefixes:  # skip own receiptor of own event
                         # sign own events not receipt them
                         logger.info("Kevery process: skipped own receipt attachment"
-                                    " on own event receipt=\n%s\n", serder.pretty())
+                                    " on own event receipt=\n%s\n", ogling.pretty(serder))
                         continue  # skip own receipt attachment on own event
                     if not local:  # so skip own receipt on other event when non-local source
                         logger.info("Kevery process: skipped own receipt attachment"
-                                    " on nonlocal event receipt=\n%s\n", serder.pretty())
+                                    " on nonlocal event receipt=\n%s\n", ogling.pretty(serder))
                         continue  # skip own receipt attachment on non-local event
 
                 if wiger.verfer.verify(wiger.raw, lserder.raw):
@@ -3839,6 +3930,8 @@ class Kevery:
         # fetch  pre dig to process
         ked = serder.ked
         pre = serder.pre
+        if not self.reprocessing:  # receipts may complete escrowed items of pre
+            self.db.wakeEscrows(serder.preb)
         sn = serder.sn
 
         # Only accept receipt if for last seen version of event at sn
@@ -3866,11 +3959,11 @@ class Kevery:
                     if pre in self.prefixes:  # skip own receipter of own event
                         # sign own events not receipt them
                         logger.info("Kevery process: skipped own receipt attachment"
-                                    " on own event receipt=\n%s\n", serder.pretty())
+                                    " on own event receipt=\n%s\n", ogling.pretty(serder))
                         continue  # skip own receipt attachment on own event
                     if not local:  # skip own receipt on other event when not local
                         logger.info("Kevery process: skipped own receipt attachment"
-                                    " on nonlocal event receipt=\n%s\n", serder.pretty())
+                                    " on nonlocal event receipt=\n%s\n", ogling.pretty(serder))
                         continue  # skip own receipt attachment on non-local event
 
                 if cigar.verfer.verify(cigar.raw, lserder.raw):
@@ -3918,6 +4011,8 @@ class Kevery:
         # fetch  pre dig to process
         ked = serder.ked
         pre = serder.pre
+        if not self.reprocessing:  # receipts may complete escrowed items of pre
+            self.db.wakeEscrows(serder.preb)
         sn = serder.sn
 
         # Only accept receipt if event is latest event at sn. Means its been
@@ -3947,11 +4042,11 @@ class Kevery:
                 if pre in self.prefixes:  # skip own receipter on own event
                     # sign own events not receipt them
                     logger.info("Kevery process: skipped own receipt attachment"
-                                " on own event receipt=\n%s\n", serder.pretty())
+                                " on own event receipt=\n%s\n", ogling.pretty(serder))
                     continue  # skip own receipt attachment on own event
                 if not local:  # own receipt on other event when not local
                     logger.info("Kevery process: skipped own receipt attachment"
-                                " on nonlocal event receipt=\n%s\n", serder.pretty())
+                                " on nonlocal event receipt=\n%s\n", ogling.pretty(serder))
                     continue  # skip own receipt attachment on non-local event
 
             if cigar.verfer.verify(cigar.raw, serder.raw):
@@ -3994,6 +4089,8 @@ class Kevery:
         # fetch  pre, dig,seal to process
         ked = serder.ked
         pre = serder.pre
+        if not self.reprocessing:  # receipts may complete escrowed items of pre
+            self.db.wakeEscrows(serder.preb)
         sn = serder.sn
 
         # Only accept receipt if for last seen version of event at sn
@@ -4093,6 +4190,8 @@ class Kevery:
         # fetch  pre, dig,seal to process
         ked = serder.ked
         pre = serder.pre
+        if not self.reprocessing:  # receipts may complete escrowed items of pre
+            self.db.wakeEscrows(serder.preb)
         sn = serder.sn
 
         if firner:  # retrieve last event by fn ordinal
@@ -4669,7 +4768,17 @@ class Kevery:
                 self.escrowQueryNotFoundEvent(serder=serder, prefixer=source, sigers=sigers, cigars=cigars)
                 raise QueryNotFoundError("Query not found error={}.".format(ked))
 
-            self.cues.push(dict(kin="stream", serder=serder, pre=pre, src=src, topics=topics))
+            # topics before the query indices may be trimmed from the mailbox
+            # only when the query is signed by the current keys of pre itself
+            trim = False
+            if source is not None and source.qb64 == pre and sigers:
+                kever = self.kevers[pre]
+                _, indices = verifySigs(raw=serder.raw, sigers=sigers, verfers=kever.verfers,
+                                        tholder=kever.tholder)
+                trim = kever.tholder.satisfy(indices)
+
+            self.cues.push(dict(kin="stream", serder=serder, pre=pre, src=src, topics=topics,
+                                trim=trim))
             # if pre in self.kevers:
             #     kever = self.kevers[pre]
             #     if src in kever.wits and src in self.db.prefixes:  # We are a witness for identifier
@@ -4747,7 +4856,7 @@ class Kevery:
         self.db.misfits.add(snKey(serder.preb, serder.sn), serder.saidb)
         # log escrowed
         logger.info("Kevery process: escrowed misfit event=\n%s\n",
-                    json.dumps(serder.ked, indent=1))
+                    ogling.dumps(serder.ked))
 
 
     def escrowOOEvent(self, serder, sigers, seqner=None, saider=None, wigers=None, local=True):
@@ -4787,7 +4896,7 @@ class Kevery:
         self.db.addOoe(snKey(serder.preb, serder.sn), serder.saidb)
         # log escrowed
         logger.info("Kevery process: escrowed out of order event=\n%s\n",
-                    json.dumps(serder.ked, indent=1))
+                    ogling.dumps(serder.ked))
 
     def escrowQueryNotFoundEvent(self, prefixer, serder, sigers, cigars=None):
         """
@@ -4805,13 +4914,15 @@ class Kevery:
         self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
         self.db.putEvt(dgkey, serder.raw)
         self.db.addQnf(dgkey, serder.saidb)
+        if (qpre := serder.ked.get("q", {}).get("i")):  # wait on queried KEL
+            self.db.waitEscrows(prefixer.qb64b, qpre)
 
         for cigar in cigars:
             self.db.addRct(key=dgkey, val=cigar.verfer.qb64b + cigar.qb64b)
 
         # log escrowed
         logger.info("Kevery process: escrowed query not found event=\n%s\n",
-                    json.dumps(serder.ked, indent=1))
+                    ogling.dumps(serder.ked))
 
     def escrowLDEvent(self, serder, sigers, local=True):
         """
@@ -4842,7 +4953,7 @@ class Kevery:
         self.db.addLde(snKey(serder.preb, serder.sn), serder.saidb)
         # log duplicitous
         logger.info("Kevery process: escrowed likely duplicitous event=\n%s\n",
-                    json.dumps(serder.ked, indent=1))
+                    ogling.dumps(serder.ked))
 
     def escrowUWReceipt(self, serder, wigers, said):
         """
@@ -4951,6 +5062,7 @@ class Kevery:
             for siger in sigers:  # escrow each quintlet
                 quintuple = prelet + siger.qb64b  # quintuple
                 self.db.addVre(key=snKey(serder.preb, serder.sn), val=quintuple)
+            self.db.waitEscrows(serder.preb, prefixer.qb64b)  # receipter's KEL
             # log escrowed
             logger.info("Kevery process: escrowed unverified transferable receipt "
                         "of pre=%s sn=%x dig=%s by pre=%s\n", serder.pre,
@@ -4993,6 +5105,7 @@ class Kevery:
         for siger in sigers:  # escrow each quintlet
             quintuple = prelet + siger.qb64b  # quintuple
             self.db.addVre(key=snKey(serder.preb, serder.sn), val=quintuple)
+        self.db.waitEscrows(serder.preb, prefixer.qb64b)  # receipter's KEL
         # log escrowed
         logger.info("Kevery process: escrowed unverified transferable receipt "
                     "of pre=%s sn=%x dig=%s by pre=%s\n", serder.pre,
@@ -5026,6 +5139,7 @@ class Kevery:
         quintuple = (serder.saidb + sprefixer.qb64b + sseqner.qb64b +
                      saider.qb64b + siger.qb64b)
         self.db.addVre(key=snKey(serder.preb, serder.sn), val=quintuple)
+        self.db.waitEscrows(serder.preb, sprefixer.qb64b)  # receipter's KEL
         # log escrowed
         logger.info("Kevery process: escrowed unverified transferabe validator "
                     "receipt of pre= %s sn=%x dig=%s\n", serder.pre, serder.sn,
@@ -5035,27 +5149,55 @@ class Kevery:
         """
         Iterate throush escrows and process any that may now be finalized
 
+        Only reattempts escrowed items whose identifier prefix has been woken
+        via .db.wakeEscrows since the last pass. The first pass and every
+        .SweepPeriod seconds thereafter sweep all escrowed items, checking
+        timeouts and reattempting them, so an item whose wake was missed
+        waits at most one sweep period. The first pass must reattempt
+        everything anyway since the wake registry is not persisted across
+        restarts. Woken prefixes are restored when a pass raises so their
+        items are reattempted by the next pass.
+
         Parameters:
         """
-
+        now = helping.nowUTC()
+        woken = self.db.woken
+        if self.swept is None:  # first pass so reattempt everything
+            sweep = True
+        else:
+            sweep = (now - self.swept) > datetime.timedelta(seconds=self.SweepPeriod)
+            if not sweep and not woken:  # nothing woken and no sweep due
+                return
+        if sweep:
+            self.swept = now
+        pres = None if sweep else woken  # sweep reattempts everything
+        self.db.woken = set()
+        if self.owns is not None:  # only reattempt escrowed items of owned prefixes
+            pres = OwnedPrefixes(owns=self.owns, pres=pres)
+
+        self.reprocessing = True
         try:
-            self.processEscrowOutOfOrders()
-            self.processEscrowUnverWitness()
-            self.processEscrowUnverNonTrans()
-            self.processEscrowUnverTrans()
-            self.processEscrowPartialWigs()
-            self.processEscrowPartialSigs()
-            self.processEscrowDuplicitous()
-            self.processQueryNotFound()
+            self.processEscrowOutOfOrders(pres=pres, sweep=sweep)
+            self.processEscrowUnverWitness(pres=pres, sweep=sweep)
+            self.processEscrowUnverNonTrans(pres=pres, sweep=sweep)
+            self.processEscrowUnverTrans(pres=pres, sweep=sweep)
+            self.processEscrowPartialWigs(pres=pres, sweep=sweep)
+            self.processEscrowPartialSigs(pres=pres, sweep=sweep)
+            self.processEscrowDuplicitous(pres=pres, sweep=sweep)
+            self.processQueryNotFound(pres=pres, sweep=sweep)
 
         except Exception as ex:  # log diagnostics errors etc
+            self.db.woken.update(woken)  # reattempt unprocessed wakes next pass
             if logger.isEnabledFor(logging.DEBUG):
                 logger.exception("Kevery escrow process error: %s\n", ex.args[0])
             else:
                 logger.error("Kevery escrow process error: %s\n", ex.args[0])
             raise ex
 
-    def processEscrowOutOfOrders(self):
+        finally:
+            self.reprocessing = False
+
+    def processEscrowOutOfOrders(self, pres=None, sweep=False):
         """
         Process events escrowed by Kever that are recieved out-of-order.
         An event is out of order if its prior event has not been accepted into its KEL.
@@ -5091,13 +5233,23 @@ class Kevery:
                         Get and Attach Signatures
                         Process event as if it came in over the wire
                         If successful then remove from escrow table
+
+        Parameters:
+            pres (set | None): bytes identifier prefixes whose escrowed items
+                are to be reattempted. None means reattempt all escrowed items.
+            sweep (bool): True means check timeouts of escrowed items not in
+                pres. False means skip escrowed items not in pres.
         """
 
+        seen = 0  # escrowed items visited this pass
         key = ekey = b''  # both start same. when not same means escrows found
         while True:  # break when done
             for ekey, edig in self.db.getOoeItemsNextIter(key=key):
+                seen += 1
                 try:
                     pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
+                    if not sweep and pres is not None and bytes(pre) not in pres:
+                        continue  # nothing it waits on has changed so skip
                     dgkey = dgKey(pre, bytes(edig))
                     if not (esr := self.db.esrs.get(keys=dgkey)):  # get event source, otherwise error
                         # no local sourde so raise ValidationError which unescrows below
@@ -5119,12 +5271,17 @@ class Kevery:
                     dte = helping.fromIso8601(bytes(dtb))
                     if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutOOE):
                         # escrow stale so raise ValidationError which unescrows below
+                        help.meter.count("keri_escrow_timeouts_total", "ooes")
                         logger.info("Kevery unescrow error: Stale event escrow "
                                     " at dig = %s\n", bytes(edig))
 
                         raise ValidationError("Stale event escrow "
                                               "at dig = {}.".format(bytes(edig)))
 
+                    if pres is not None and bytes(pre) not in pres:
+                        continue  # sweep only checks timeout when not woken
+                    help.meter.count("keri_escrow_attempts_total", "ooes")
+
                     # get the escrowed event using edig
                     eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
                     if eraw is None:
@@ -5186,18 +5343,21 @@ class Kevery:
                         logger.error("Kevery unescrowed: %s\n", ex.args[0])
 
                 else:  # unescrow succeeded, remove from escrow
+                    help.meter.count("keri_escrow_successes_total", "ooes")
                     # We don't remove all escrows at pre,sn because some might be
                     # duplicitous so we process remaining escrows in spite of found
                     # valid event escrow.
                     self.db.delOoe(snKey(pre, sn), edig)  # removes one escrow at key val
                     logger.info("Kevery unescrow succeeded in valid event: "
-                                "event=\n%s\n", json.dumps(eserder.ked, indent=1))
+                                "event=\n%s\n", ogling.dumps(eserder.ked))
 
             if ekey == key:  # still same so no escrows found on last while iteration
                 break
             key = ekey  # setup next while iteration, with key after ekey
 
-    def processEscrowPartialSigs(self):
+        help.meter.gauge("keri_escrow_size", "ooes", seen)
+
+    def processEscrowPartialSigs(self, pres=None, sweep=False):
         """
         Process events escrowed by Kever that were only partially fulfilled,
         either due to missing signatures or missing dependent events like a
@@ -5230,14 +5390,24 @@ class Kevery:
                         Get and Attach Signatures
                         Process event as if it came in over the wire
                         If successful then remove from escrow table
+
+        Parameters:
+            pres (set | None): bytes identifier prefixes whose escrowed items
+                are to be reattempted. None means reattempt all escrowed items.
+            sweep (bool): True means check timeouts of escrowed items not in
+                pres. False means skip escrowed items not in pres.
         """
 
+        seen = 0  # escrowed items visited this pass
         key = ekey = b''  # both start same. when not same means escrows found
         while True:  # break when done
             for ekey, edig in self.db.getPseItemsNextIter(key=key):
+                seen += 1
                 eserder = None
                 try:
                     pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
+                    if not sweep and pres is not None and bytes(pre) not in pres:
+                        continue  # nothing it waits on has changed so skip
                     dgkey = dgKey(pre, bytes(edig))
                     if not (esr := self.db.esrs.get(keys=dgkey)):  # get event source, otherwise error
                         # no local sourde so raise ValidationError which unescrows below
@@ -5259,12 +5429,17 @@ class Kevery:
                     dte = helping.fromIso8601(bytes(dtb))
                     if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutPSE):
                         # escrow stale so raise ValidationError which unescrows below
+                        help.meter.count("keri_escrow_timeouts_total", "pses")
                         logger.info("Kevery unescrow error: Stale event escrow "
                                     " at dig = %s\n", bytes(edig))
 
                         raise ValidationError("Stale event escrow "
                                               "at dig = {}.".format(bytes(edig)))
 
+                    if pres is not None and bytes(pre) not in pres:
+                        continue  # sweep only checks timeout when not woken
+                    help.meter.count("keri_escrow_attempts_total", "pses")
+
                     # get the escrowed event using edig
                     eraw = self.db.getEvt(dgkey)
                     if eraw is None:
@@ -5345,6 +5520,7 @@ class Kevery:
                         logger.error("Kevery unescrowed: %s\n", ex.args[0])
 
                 else:  # unescrow succeeded, remove from escrow
+                    help.meter.count("keri_escrow_successes_total", "pses")
                     # We don't remove all escrows at pre,sn because some might be
                     # duplicitous so we process remaining escrows in spite of found
                     # valid event escrow.
@@ -5355,13 +5531,15 @@ class Kevery:
                         self.cues.push(dict(kin="psUnescrow", serder=eserder))
 
                     logger.info("Kevery unescrow succeeded in valid event: "
-                                "event=\n%s\n", json.dumps(eserder.ked, indent=1))
+                                "event=\n%s\n", ogling.dumps(eserder.ked))
 
             if ekey == key:  # still same so no escrows found on last while iteration
                 break
             key = ekey  # setup next while iteration, with key after ekey
 
-    def processEscrowPartialWigs(self):
+        help.meter.gauge("keri_escrow_size", "pses", seen)
+
+    def processEscrowPartialWigs(self, pres=None, sweep=False):
         """
         Process events escrowed by Kever that were only partially fulfilled
         due to missing signatures from witnesses. Events only make into this
@@ -5396,13 +5574,23 @@ class Kevery:
                         Get and Attach Witness Signatures
                         Process event as if it came in over the wire
                         If successful then remove from escrow table
+
+        Parameters:
+            pres (set | None): bytes identifier prefixes whose escrowed items
+                are to be reattempted. None means reattempt all escrowed items.
+            sweep (bool): True means check timeouts of escrowed items not in
+                pres. False means skip escrowed items not in pres.
         """
 
+        seen = 0  # escrowed items visited this pass
         key = ekey = b''  # both start same. when not same means escrows found
         while True:  # break when done
             for ekey, edig in self.db.getPweItemsNextIter(key=key):
+                seen += 1
                 try:
                     pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
+                    if not sweep and pres is not None and bytes(pre) not in pres:
+                        continue  # nothing it waits on has changed so skip
                     dgkey = dgKey(pre, bytes(edig))
                     if not (esr := self.db.esrs.get(keys=dgkey)):  # get event source, otherwise error
                         # no local sourde so raise ValidationError which unescrows below
@@ -5424,12 +5612,17 @@ class Kevery:
                     dte = helping.fromIso8601(bytes(dtb))
                     if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutPWE):
                         # escrow stale so raise ValidationError which unescrows below
+                        help.meter.count("keri_escrow_timeouts_total", "pwes")
                         logger.info("Kevery unescrow error: Stale event escrow "
                                     " at dig = %s\n", bytes(edig))
 
                         raise ValidationError("Stale event escrow "
                                               "at dig = {}.".format(bytes(edig)))
 
+                    if pres is not None and bytes(pre) not in pres:
+                        continue  # sweep only checks timeout when not woken
+                    help.meter.count("keri_escrow_attempts_total", "pwes")
+
                     # get the escrowed event using edig
                     eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
                     if eraw is None:
@@ -5512,18 +5705,21 @@ class Kevery:
                         logger.error("Kevery unescrowed: %s\n", ex.args[0])
 
                 else:  # unescrow succeeded, remove from escrow
+                    help.meter.count("keri_escrow_successes_total", "pwes")
                     # We don't remove all escrows at pre,sn because some might be
                     # duplicitous so we process remaining escrows in spite of found
                     # valid event escrow.
                     self.db.delPwe(snKey(pre, sn), edig)  # removes one escrow at key val
                     logger.info("Kevery unescrow succeeded in valid event: "
-                                "event=\n%s\n", json.dumps(eserder.ked, indent=1))
+                                "event=\n%s\n", ogling.dumps(eserder.ked))
 
             if ekey == key:  # still same so no escrows found on last while iteration
                 break
             key = ekey  # setup next while iteration, with key after ekey
 
-    def processEscrowUnverWitness(self):
+        help.meter.gauge("keri_escrow_size", "pwes", seen)
+
+    def processEscrowUnverWitness(self, pres=None, sweep=False):
         """
         Process escrowed unverified event receipts from witness receiptors
         A receipt is unverified if the associated event has not been accepted
@@ -5570,14 +5766,24 @@ class Kevery:
                         compare dig so same event
                         verify wigs via wigers
                         If successful then remove from escrow table
+
+        Parameters:
+            pres (set | None): bytes identifier prefixes whose escrowed items
+                are to be reattempted. None means reattempt all escrowed items.
+            sweep (bool): True means check timeouts of escrowed items not in
+                pres. False means skip escrowed items not in pres.
         """
 
         ims = bytearray()
+        seen = 0  # escrowed items visited this pass
         key = ekey = b''  # both start same. when not same means escrows found
         while True:  # break when done
             for ekey, ecouple in self.db.getUweItemsNextIter(key=key):
+                seen += 1
                 try:
                     pre, sn = splitKeySN(ekey)  # get pre and sn from escrow db key
+                    if not sweep and pres is not None and bytes(pre) not in pres:
+                        continue  # nothing it waits on has changed so skip
 
                     #  get escrowed receipt's rdiger of receipted event and
                     # wiger indexed signature of receipted event
@@ -5598,12 +5804,17 @@ class Kevery:
                     dte = helping.fromIso8601(bytes(dtb))
                     if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutUWE):
                         # escrow stale so raise ValidationError which unescrows below
+                        help.meter.count("keri_escrow_timeouts_total", "uwes")
                         logger.info("Kevery unescrow error: Stale event escrow "
                                     " at dig = %s\n", rdiger.qb64b)
 
                         raise ValidationError("Stale event escrow "
                                               "at dig = {}.".format(rdiger.qb64b))
 
+                    if pres is not None and bytes(pre) not in pres:
+                        continue  # sweep only checks timeout when not woken
+                    help.meter.count("keri_escrow_attempts_total", "uwes")
+
                     # lookup database dig of the receipted event in pwes escrow
                     # using pre and sn lastEvt
                     found = self._processEscrowFindUnver(pre=pre,
@@ -5636,6 +5847,7 @@ class Kevery:
                         logger.error("Kevery unescrowed: %s\n", ex.args[0])
 
                 else:  # unescrow succeeded, remove from escrow
+                    help.meter.count("keri_escrow_successes_total", "uwes")
                     # We don't remove all escrows at pre,sn because some might be
                     # duplicitous so we process remaining escrows in spite of found
                     # valid event escrow.
@@ -5647,7 +5859,9 @@ class Kevery:
                 break
             key = ekey  # setup next while iteration, with key after ekey
 
-    def processEscrowUnverNonTrans(self):
+        help.meter.gauge("keri_escrow_size", "uwes", seen)
+
+    def processEscrowUnverNonTrans(self, pres=None, sweep=False):
         """
         Process escrowed unverified event receipts from nontrans receiptors
         A receipt is unverified if the associated event has not been accepted
@@ -5692,14 +5906,24 @@ class Kevery:
                         compare dig so same event
                         verify sigs via cigars
                         If successful then remove from escrow table
+
+        Parameters:
+            pres (set | None): bytes identifier prefixes whose escrowed items
+                are to be reattempted. None means reattempt all escrowed items.
+            sweep (bool): True means check timeouts of escrowed items not in
+                pres. False means skip escrowed items not in pres.
         """
 
         ims = bytearray()
+        seen = 0  # escrowed items visited this pass
         key = ekey = b''  # both start same. when not same means escrows found
         while True:  # break when done
             for ekey, etriplet in self.db.getUreItemsNextIter(key=key):
+                seen += 1
                 try:
                     pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
+                    if not sweep and pres is not None and bytes(pre) not in pres:
+                        continue  # nothing it waits on has changed so skip
                     rsaider, sprefixer, cigar = deReceiptTriple(etriplet)
                     cigar.verfer = Verfer(qb64b=sprefixer.qb64b)
 
@@ -5718,12 +5942,17 @@ class Kevery:
                     dte = helping.fromIso8601(bytes(dtb))
                     if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutURE):
                         # escrow stale so raise ValidationError which unescrows below
+                        help.meter.count("keri_escrow_timeouts_total", "ures")
                         logger.info("Kevery unescrow error: Stale event escrow "
                                     " at dig = %s\n", rsaider.qb64b)
 
                         raise ValidationError("Stale event escrow "
                                               "at dig = {}.".format(rsaider.qb64b))
 
+                    if pres is not None and bytes(pre) not in pres:
+                        continue  # sweep only checks timeout when not woken
+                    help.meter.count("keri_escrow_attempts_total", "ures")
+
                     # Is receipt for unverified witnessed event in .Pwes escrow
                     # if found then try else clause will remove from escrow
                     found = self._processEscrowFindUnver(pre=pre,
@@ -5809,6 +6038,7 @@ class Kevery:
                         logger.error("Kevery unescrowed: %s\n", ex.args[0])
 
                 else:  # unescrow succeeded, remove from escrow
+                    help.meter.count("keri_escrow_successes_total", "ures")
                     # We don't remove all escrows at pre,sn because some might be
                     # duplicitous so we process remaining escrows in spite of found
                     # valid event escrow.
@@ -5820,7 +6050,9 @@ class Kevery:
                 break
             key = ekey  # setup next while iteration, with key after ekey
 
-    def processQueryNotFound(self):
+        help.meter.gauge("keri_escrow_size", "ures", seen)
+
+    def processQueryNotFound(self, pres=None, sweep=False):
         """
         Process qry events escrowed by Kevery for KELs that have not yet met the criteria of the query.
         A missing KEL or criteria for an event in a KEL at a particular sequence number or an event containing a
@@ -5843,15 +6075,25 @@ class Kevery:
                         Get and Attach Signatures
                         Process event as if it came in over the wire
                         If successful then remove from escrow table
+
+        Parameters:
+            pres (set | None): bytes identifier prefixes whose escrowed items
+                are to be reattempted. None means reattempt all escrowed items.
+            sweep (bool): True means check timeouts of escrowed items not in
+                pres. False means skip escrowed items not in pres.
         """
 
+        seen = 0  # escrowed items visited this pass
         key = ekey = b''  # both start same. when not same means escrows found
         pre = b''
         sn = 0
         while True:  # break when done
             for ekey, edig in self.db.getQnfItemsNextIter(key=key):
+                seen += 1
                 try:
                     pre, _ = splitKey(ekey)  # get pre and sn from escrow item
+                    if not sweep and pres is not None and bytes(pre) not in pres:
+                        continue  # nothing it waits on has changed so skip
                     # check date if expired then remove escrow.
                     dtb = self.db.getDts(dgKey(pre, bytes(edig)))
                     if dtb is None:  # othewise is a datetime as bytes
@@ -5867,12 +6109,17 @@ class Kevery:
                     dte = helping.fromIso8601(bytes(dtb))
                     if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutQNF):
                         # escrow stale so raise ValidationError which unescrows below
+                        help.meter.count("keri_escrow_timeouts_total", "qnfs")
                         logger.info("Kevery unescrow error: Stale qry event escrow "
                                     " at dig = %s\n", bytes(edig))
 
                         raise ValidationError("Stale qry event escrow "
                                               "at dig = {}.".format(bytes(edig)))
 
+                    if pres is not None and bytes(pre) not in pres:
+                        continue  # sweep only checks timeout when not woken
+                    help.meter.count("keri_escrow_attempts_total", "qnfs")
+
                     # get the escrowed event using edig
                     eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
                     if eraw is None:
@@ -5929,17 +6176,20 @@ class Kevery:
                     else:
                         logger.error("Kevery unescrowed: %s\n", ex.args[0])
                 else:  # unescrow succeeded, remove from escrow
+                    help.meter.count("keri_escrow_successes_total", "qnfs")
                     # We don't remove all escrows at pre,sn because some might be
                     # duplicitous so we process remaining escrows in spite of found
                     # valid event escrow.
                     self.db.delQnf(dgKey(pre, edig), edig)  # removes one escrow at key val
                     logger.info("Kevery unescrow succeeded in valid event: "
-                                "event=\n%s\n", json.dumps(eserder.ked, indent=1))
+                                "event=\n%s\n", ogling.dumps(eserder.ked))
 
             if ekey == key:  # still same so no escrows found on last while iteration
                 break
             key = ekey  # setup next while iteration, with key after ekey
 
+        help.meter.gauge("keri_escrow_size", "qnfs", seen)
+
 
     def _processEscrowFindUnver(self, pre, sn, rsaider, wiger=None, cigar=None):
         """
@@ -6049,7 +6299,7 @@ class Kevery:
 
         return found
 
-    def processEscrowUnverTrans(self):
+    def processEscrowUnverTrans(self, pres=None, sweep=False):
         """
         Process event receipts from transferable identifiers (validators)
         escrowed by Kever that are unverified.
@@ -6092,14 +6342,24 @@ class Kevery:
                         compare dig so same event
                         verify sigs via sigers
                         If successful then remove from escrow table
+
+        Parameters:
+            pres (set | None): bytes identifier prefixes whose escrowed items
+                are to be reattempted. None means reattempt all escrowed items.
+            sweep (bool): True means check timeouts of escrowed items not in
+                pres. False means skip escrowed items not in pres.
         """
 
         ims = bytearray()
+        seen = 0  # escrowed items visited this pass
         key = ekey = b''  # both start same. when not same means escrows found
         while True:  # break when done
             for ekey, equinlet in self.db.getVreItemsNextIter(key=key):
+                seen += 1
                 try:
                     pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
+                    if not sweep and pres is not None and bytes(pre) not in pres:
+                        continue  # nothing it waits on has changed so skip
                     esaider, sprefixer, sseqner, ssaider, siger = deTransReceiptQuintuple(equinlet)
 
                     # check date if expired then remove escrow.
@@ -6117,12 +6377,17 @@ class Kevery:
                     dte = helping.fromIso8601(bytes(dtb))
                     if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutVRE):
                         # escrow stale so raise ValidationError which unescrows below
+                        help.meter.count("keri_escrow_timeouts_total", "vres")
                         logger.info("Kevery unescrow error: Stale event escrow "
                                     " at dig = %s\n", esaider.qb64b)
 
                         raise ValidationError("Stale event escrow "
                                               "at dig = {}.".format(esaider.qb64b))
 
+                    if pres is not None and bytes(pre) not in pres:
+                        continue  # sweep only checks timeout when not woken
+                    help.meter.count("keri_escrow_attempts_total", "vres")
+
                     # get dig of the receipted event using pre and sn lastEvt
                     raw = self.db.getKeLast(snKey(pre, sn))
                     if raw is None:
@@ -6205,7 +6470,9 @@ class Kevery:
 
                 except UnverifiedTransferableReceiptError as ex:
                     # still waiting on missing prior event to validate
-                    # only happens if we process above
+                    # only happens if we process above. Waiting on receipter's
+                    # KEL again since waking it cleared the registration
+                    self.db.waitEscrows(pre, sprefixer.qb64b)
                     if logger.isEnabledFor(logging.DEBUG):  # adds exception data
                         logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
                     else:
@@ -6220,6 +6487,7 @@ class Kevery:
                         logger.error("Kevery unescrowed: %s\n", ex.args[0])
 
                 else:  # unescrow succeeded, remove from escrow
+                    help.meter.count("keri_escrow_successes_total", "vres")
                     # We don't remove all escrows at pre,sn because some might be
                     # duplicitous so we process remaining escrows in spite of found
                     # valid event escrow.
@@ -6230,7 +6498,9 @@ class Kevery:
                 break
             key = ekey  # setup next while iteration, with key after ekey
 
-    def processEscrowDuplicitous(self):
+        help.meter.gauge("keri_escrow_size", "vres", seen)
+
+    def processEscrowDuplicitous(self, pres=None, sweep=False):
         """
         Process events escrowed by Kever that are likely duplicitous.
         An event is likely duplicitous if a different version of event already
@@ -6265,12 +6535,22 @@ class Kevery:
                         Get and Attach Signatures
                         Process event as if it came in over the wire
                         If successful then remove from escrow table
+
+        Parameters:
+            pres (set | None): bytes identifier prefixes whose escrowed items
+                are to be reattempted. None means reattempt all escrowed items.
+            sweep (bool): True means check timeouts of escrowed items not in
+                pres. False means skip escrowed items not in pres.
         """
+        seen = 0  # escrowed items visited this pass
         key = ekey = b''  # both start same. when not same means escrows found
         while True:  # break when done
             for ekey, edig in self.db.getLdeItemsNextIter(key=key):
+                seen += 1
                 try:
                     pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
+                    if not sweep and pres is not None and bytes(pre) not in pres:
+                        continue  # nothing it waits on has changed so skip
                     dgkey = dgKey(pre, bytes(edig))
                     if not (esr := self.db.esrs.get(keys=dgkey)):  # get event source, otherwise error
                         # no local sourde so raise ValidationError which unescrows below
@@ -6292,12 +6572,17 @@ class Kevery:
                     dte = helping.fromIso8601(bytes(dtb))
                     if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutLDE):
                         # escrow stale so raise ValidationError which unescrows below
+                        help.meter.count("keri_escrow_timeouts_total", "ldes")
                         logger.info("Kevery unescrow error: Stale event escrow "
                                     " at dig = %s\n", bytes(edig))
 
                         raise ValidationError("Stale event escrow "
                                               "at dig = {}.".format(bytes(edig)))
 
+                    if pres is not None and bytes(pre) not in pres:
+                        continue  # sweep only checks timeout when not woken
+                    help.meter.count("keri_escrow_attempts_total", "ldes")
+
                     # get the escrowed event using edig
                     eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
                     if eraw is None:
@@ -6353,17 +6638,20 @@ class Kevery:
                         logger.error("Kevery unescrowed: %s\n", ex.args[0])
 
                 else:  # unescrow succeeded, remove from escrow
+                    help.meter.count("keri_escrow_successes_total", "ldes")
                     # We don't remove all escrows at pre,sn because some might be
                     # duplicitous so we process remaining escrows in spite of found
                     # valid event escrow.
                     self.db.delLde(snKey(pre, sn), edig)  # removes one escrow at key val
                     logger.info("Kevery unescrow succeeded in valid event: "
-                                "event=\n%s\n", json.dumps(eserder.ked, indent=1))
+                                "event=\n%s\n", ogling.dumps(eserder.ked))
 
             if ekey == key:  # still same so no escrows found on last while iteration
                 break
             key = ekey  # setup next while iteration, with key after ekey
 
+        help.meter.gauge("keri_escrow_size", "ldes", seen)
+
     def duplicity(self, serder, sigers):
         """
         PlaceHolder Reminder
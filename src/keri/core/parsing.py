@@ -6,6 +6,7 @@ message stream parsing support
 """
 
 import logging
+import time
 import traceback
 from collections import namedtuple
 from dataclasses import dataclass, astuple
@@ -20,6 +21,93 @@ from ..kering import ColdDex, Colds, sniff
 logger = help.ogler.getLogger()
 
 
+class Cursor:
+    """
+    Cursor is a read cursor over an incoming message stream bytearray that
+    walks the stream by offset instead of deleting each extracted primitive
+    off the front of the stream. Stripping from a Cursor, as done by
+    klas(qb64b=cursor, strip=True) or klas(qb2=cursor, strip=True), only
+    advances .offset so extraction does not memmove the rest of the stream.
+    The consumed front of the stream is compacted out of .ims by .compact
+    which the Parser only calls at message boundaries.
+
+    A Cursor quacks like the bytearray it wraps for the operations the
+    primitive constructors and Serdery perform on their input stream, that is,
+    len, truth, indexing, slicing, and deletion of a front slice. Slices return
+    copies of only the sliced bytes in the type of the wrapped stream.
+
+    Attributes:
+        ims (bytearray): wrapped incoming message stream. May be extended by
+            other doers while parsing since Cursor holds no buffer exports.
+        offset (int): number of bytes at front of .ims already consumed
+
+    """
+
+    def __init__(self, ims=None, offset=0):
+        """
+        Initialize instance
+
+        Parameters:
+            ims (bytearray): incoming message stream to wrap
+            offset (int): number of bytes at front of ims already consumed
+        """
+        self.ims = ims if ims is not None else bytearray()
+        self.offset = offset
+
+    def __len__(self):
+        """Returns number of unconsumed bytes in stream"""
+        return max(len(self.ims) - self.offset, 0)
+
+    def __bool__(self):
+        return len(self.ims) > self.offset
+
+    def __getitem__(self, key):
+        """Returns byte or slice of unconsumed bytes relative to .offset"""
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            return self.ims[self.offset + start:self.offset + stop:step]
+
+        size = len(self)
+        if key < 0:
+            key += size
+        if not 0 <= key < size:
+            raise IndexError("Cursor index out of range.")
+        return self.ims[self.offset + key]
+
+    def __delitem__(self, key):
+        """Consumes front slice of unconsumed bytes by advancing .offset.
+        Only deletion of a front slice, i.e. del cursor[:n], is supported.
+        """
+        if (not isinstance(key, slice) or key.start not in (None, 0)
+                or key.step not in (None, 1)):
+            raise TypeError("Cursor only supports deletion from front of stream.")
+        _, stop, _ = key.indices(len(self))
+        self.offset += stop
+
+    @property
+    def consumed(self):
+        """Returns number of bytes consumed since last compaction"""
+        return self.offset
+
+    def compact(self, force=False):
+        """
+        Deletes consumed bytes from front of .ims and resets .offset.
+        Clearing a fully consumed stream is always done since it is cheap.
+        Otherwise only compacts once consumed bytes are at least as many as
+        unconsumed bytes so that compaction cost is amortized linear in the
+        size of the stream.
+
+        Parameters:
+            force (bool): True means compact regardless of consumed size
+        """
+        if self.offset >= len(self.ims):  # all consumed so clear is cheap
+            del self.ims[:]
+            self.offset = 0
+        elif self.offset and (force or self.offset >= len(self.ims) - self.offset):
+            del self.ims[:self.offset]
+            self.offset = 0
+
+
 class Parser:
     """
     Parser is stream parser that processes an incoming message stream.
@@ -47,11 +135,15 @@ class Parser:
         vry (Verfifier): credential verifier with wallet storage
         local (bool): True means event source is local (protected) for validation
                          False means event source is remote (unprotected) for validation
+        cursor (bool): True means walk ims with a Cursor that only compacts
+                consumed bytes at message boundaries. False means strip each
+                extracted primitive off the front of ims.
 
     """
 
     def __init__(self, ims=None, framed=True, pipeline=False, kvy=None,
-                 tvy=None, exc=None, rvy=None, vry=None, local=False):
+                 tvy=None, exc=None, rvy=None, vry=None, local=False,
+                 cursor=True):
         """
         Initialize instance:
 
@@ -68,6 +160,9 @@ class Parser:
             vry (Verfifier): credential verifier with wallet storage
             local (bool): True means event source is local (protected) for validation
                          False means event source is remote (unprotected) for validation
+            cursor (bool): True means walk ims with a Cursor that only compacts
+                consumed bytes at message boundaries. False means strip each
+                extracted primitive off the front of ims.
         """
         self.ims = ims if ims is not None else bytearray()
         self.framed = True if framed else False  # extract until end-of-stream
@@ -78,6 +173,7 @@ class Parser:
         self.rvy = rvy
         self.vry = vry
         self.local = True if local else False
+        self.cursor = True if cursor else False
 
 
     @staticmethod
@@ -405,6 +501,9 @@ class Parser:
         else:
             ims = self.ims  # use instance attribute by default
 
+        if self.cursor and not isinstance(ims, Cursor):
+            ims = Cursor(ims)  # walk by offset, compact at message boundaries
+
         framed = framed if framed is not None else self.framed
         pipeline = pipeline if pipeline is not None else self.pipeline
         kvy = kvy if kvy is not None else self.kvy
@@ -428,6 +527,7 @@ class Parser:
                                                    local=local)
 
             except kering.SizedGroupError as ex:  # error inside sized group
+                help.meter.count("keri_parser_errors_total", ex.__class__.__name__)
                 # processOneIter already flushed group so do not flush stream
                 if logger.isEnabledFor(logging.ERROR):
                     logger.exception("Parser msg extraction error: %s\n", ex.args[0])
@@ -435,6 +535,7 @@ class Parser:
                     logger.error("Parser msg extraction error: %s\n", ex.args[0])
 
             except (kering.ColdStartError, kering.ExtractionError) as ex:  # some extraction error
+                help.meter.count("keri_parser_errors_total", ex.__class__.__name__)
                 if logger.isEnabledFor(logging.ERROR):
                     logger.exception("Parser msg extraction error: %s\n", ex.args[0])
                 else:
@@ -442,12 +543,16 @@ class Parser:
                 del ims[:]  # delete rest of stream to force cold restart
 
             except (kering.ValidationError, Exception) as ex:  # non Extraction Error
+                help.meter.count("keri_parser_errors_total", ex.__class__.__name__)
                 # Non extraction errors happen after successfully extracted from stream
                 # so we don't flush rest of stream just resume
                 if logger.isEnabledFor(logging.ERROR):
                     logger.exception("Parser msg non-extraction error: %s\n", ex)
                 else:
                     logger.error("Parser msg non-extraction error: %s\n", ex)
+
+            if isinstance(ims, Cursor):  # message boundary so may compact
+                ims.compact()
             yield
 
         return True
@@ -489,6 +594,9 @@ class Parser:
         else:
             ims = self.ims  # use instance attribute by default
 
+        if self.cursor and not isinstance(ims, Cursor):
+            ims = Cursor(ims)  # walk by offset, compact at message boundaries
+
         framed = framed if framed is not None else self.framed
         pipeline = pipeline if pipeline is not None else self.pipeline
         kvy = kvy if kvy is not None else self.kvy
@@ -513,6 +621,7 @@ class Parser:
                                                    local=local)
 
             except kering.SizedGroupError as ex:  # error inside sized group
+                help.meter.count("keri_parser_errors_total", ex.__class__.__name__)
                 # processOneIter already flushed group so do not flush stream
                 if logger.isEnabledFor(logging.ERROR):
                     logger.exception("Kevery msg extraction error: %s\n", ex.args[0])
@@ -520,6 +629,7 @@ class Parser:
                     logger.error("Kevery msg extraction error: %s\n", ex.args[0])
 
             except (kering.ColdStartError, kering.ExtractionError) as ex:  # some extraction error
+                help.meter.count("keri_parser_errors_total", ex.__class__.__name__)
                 if logger.isEnabledFor(logging.ERROR):
                     logger.exception("Kevery msg extraction error: %s\n", ex.args[0])
                 else:
@@ -527,6 +637,7 @@ class Parser:
                 del ims[:]  # delete rest of stream to force cold restart
 
             except (kering.ValidationError, Exception) as ex:  # non Extraction Error
+                help.meter.count("keri_parser_errors_total", ex.__class__.__name__)
                 # Non extraction errors happen after successfully extracted from stream
                 # so we don't flush rest of stream just resume
                 if logger.isEnabledFor(logging.ERROR):
@@ -536,6 +647,9 @@ class Parser:
             finally:
                 done = True
 
+        if isinstance(ims, Cursor):  # leave ims holding only unconsumed bytes
+            ims.compact(force=True)
+
         return done
 
 
@@ -580,6 +694,9 @@ class Parser:
         else:
             ims = self.ims  # use instance attribute by default
 
+        if self.cursor and not isinstance(ims, Cursor):
+            ims = Cursor(ims)  # walk by offset, compact at message boundaries
+
         framed = framed if framed is not None else self.framed
         pipeline = pipeline if pipeline is not None else self.pipeline
         kvy = kvy if kvy is not None else self.kvy
@@ -603,6 +720,7 @@ class Parser:
                                                    local=local)
 
             except kering.SizedGroupError as ex:  # error inside sized group
+                help.meter.count("keri_parser_errors_total", ex.__class__.__name__)
                 # processOneIter already flushed group so do not flush stream
                 if logger.isEnabledFor(logging.ERROR):
                     logger.exception("Parser msg extraction error: %s\n", ex.args[0])
@@ -610,6 +728,7 @@ class Parser:
                     logger.error("Parser msg extraction error: %s\n", ex.args[0])
 
             except (kering.ColdStartError, kering.ExtractionError) as ex:  # some extraction error
+                help.meter.count("keri_parser_errors_total", ex.__class__.__name__)
                 if logger.isEnabledFor(logging.ERROR):
                     logger.exception("Parser msg extraction error: %s\n", ex.args[0])
                 else:
@@ -617,12 +736,16 @@ class Parser:
                 del ims[:]  # delete rest of stream to force cold restart
 
             except (kering.ValidationError, Exception) as ex:  # non Extraction Error
+                help.meter.count("keri_parser_errors_total", ex.__class__.__name__)
                 # Non extraction errors happen after successfully extracted from stream
                 # so we don't flush rest of stream just resume
                 if logger.isEnabledFor(logging.ERROR):
                     logger.exception("Parser msg non-extraction error: %s\n", ex.args[0])
                 else:
                     logger.error("Parser msg non-extraction error: %s\n", ex.args[0])
+
+            if isinstance(ims, Cursor):  # message boundary so may compact
+                ims.compact()
             yield
 
         return True  # should never return
@@ -741,7 +864,8 @@ class Parser:
 
                     pims = ims[:pags]  # copy out substream pipeline group
                     del ims[:pags]  # strip off from ims
-                    ims = pims  # now just process substream as one counted frame
+                    # now just process substream as one counted frame
+                    ims = Cursor(pims) if isinstance(ims, Cursor) else pims
 
                     if pipeline:
                         pass  # pass extracted ims to pipeline processor
@@ -974,6 +1098,9 @@ class Parser:
                                              "attachment group of size={}.".format(pags))
             raise  # no pipeline group so can't preflush, must flush stream
 
+        # time dispatch of extracted message by its ilk when metered
+        start = time.perf_counter() if help.meter.enabled else None
+
         if isinstance(serder, serdering.SerderKERI):
             ilk = serder.ilk  # dispatch abased on ilk
 
@@ -1124,4 +1251,9 @@ class Parser:
             raise kering.ValidationError("Unexpected protocol type = {} for event message ="
                                          " {}.".format(serder.proto, serder.pretty()))
 
+        if start is not None:
+            kind = serder.ilk or serder.proto
+            help.meter.count("keri_parser_msgs_total", kind)
+            help.meter.observe("keri_parser_dispatch_seconds", kind, time.perf_counter() - start)
+
         return True  # done state
@@ -6,13 +6,15 @@ keri.core.routing module
 import datetime
 import logging
 import re
+import time
+from collections import OrderedDict
 
 from hio.help import decking
 
 from . import eventing, coring, serdering
 from .. import help, kering
 from ..db import dbing
-from ..help import helping
+from ..help import helping, ogling
 
 logger = help.ogler.getLogger()
 
@@ -23,9 +25,21 @@ class Router:
     Reply message router that accepts registration of route `r` handlers and dispatches
     reply messages to the appropriate handler.
 
+    Routes are indexed by path segment in a trie of RouteNodes. Static segments
+    are matched by dict lookup and templated {field} segments match any non
+    empty segment. Templates with partially templated segments fall back to
+    regex search. Resolved routes are cached.
+
+    Attributes:
+        routes (list): of Route in registration order
+        root (RouteNode): root of route trie
+        fallbacks (list): of Route only matchable by regex
+        cache (OrderedDict): of (Route, fields) keyed by resolved route str
+
     """
 
     defaultResourceFunc = "processReply"
+    CacheSize = 1024  # max number of resolved routes cached
 
     def __init__(self, routes=None):
         """ Initialized instance with optiona list of existing routes
@@ -34,7 +48,12 @@ class Router:
             routes (list): preregistered routes for this router
 
         """
-        self.routes = routes if routes is not None else list()
+        self.routes = list()
+        self.root = RouteNode()
+        self.fallbacks = list()
+        self.cache = OrderedDict()
+        for route in (routes if routes is not None else []):
+            self._index(route)
 
     def addRoute(self, routeTemplate, resource, suffix=None):
         """ Add a route between a route template and a resource
@@ -50,7 +69,38 @@ class Router:
         """
 
         fields, regex = compile_uri_template(routeTemplate)
-        self.routes.append(Route(regex=regex, fields=fields, resource=resource, suffix=suffix))
+        self._index(Route(regex=regex, fields=fields, resource=resource, suffix=suffix,
+                          template=routeTemplate))
+
+    def _index(self, route):
+        """ Append route and index it in trie by its template segments or as
+        regex fallback when template not available or not segment aligned
+
+        Parameters:
+            route (Route): route to index
+        """
+        route.order = len(self.routes)
+        self.routes.append(route)
+        self.cache.clear()
+
+        if route.template is None:
+            self.fallbacks.append(route)
+            return
+
+        template = route.template
+        if template != "/" and template.endswith("/"):  # as per compile_uri_template
+            template = template[:-1]
+
+        node = self.root
+        for seg in splitRoute(template):
+            if (field := FieldRex.fullmatch(seg)) is not None:
+                node = node.params.setdefault(field.group(1), RouteNode())
+            elif "{" in seg:  # partially templated segment
+                self.fallbacks.append(route)
+                return
+            else:
+                node = node.statics.setdefault(seg.lower(), RouteNode())
+        node.routes.append(route)
 
     def dispatch(self, serder, saider, cigars, tsgs):
         """
@@ -67,7 +117,7 @@ class Router:
         ked = serder.ked
         # Dispatch based on route
         r = ked["r"]
-        route, match = self._find(route=r)
+        route, kwargs = self._find(route=r)
         if route is None:
             raise kering.ValidationError(f"No resource is registered to handle route {r}")
 
@@ -75,33 +125,54 @@ class Router:
         if route.suffix is not None:
             fname += route.suffix
 
-        kwargs = match.groupdict()
         for name in route.fields:
             if name not in kwargs:
                 raise kering.ValidationError(f"parameter {name} not found in route {r}")
 
         fn = getattr(route.resource, fname, self.processRouteNotFound)
-        fn(serder=serder, saider=saider, route=r, cigars=cigars, tsgs=tsgs, **kwargs)
+        route.hits += 1
+        start = time.perf_counter()
+        try:
+            fn(serder=serder, saider=saider, route=r, cigars=cigars, tsgs=tsgs, **kwargs)
+        finally:
+            route.elapsed += time.perf_counter() - start
 
     def _find(self, route):
-        """ Linear seach thru added routes, returning the first one that matchs
+        """ Returns the first registered route that matches
 
-        Searches through the registered routes until a regex in one of the routes matches
-        the provided route and returns the Route object along with the re.Match object.
+        Resolves from cache, else walks the route trie and checks regex
+        fallbacks keeping the match of the earliest registered route.
 
         Parameters:
             route (str): the route from the `r` of the reply message
 
         Returns:
             Route: the Route object with the resource that is registered to process this rpy message
-            re.Match:  the regular expression match that contains the grouping of matched parameters.
+            dict:  the matched parameters keyed by field name
 
         """
-        for r in self.routes:
+        if (found := self.cache.get(route)) is not None:
+            self.cache.move_to_end(route)
+            return found[0], dict(found[1])
+
+        best, fields = None, None
+        if isinstance(route, str) and route.startswith("/"):
+            best, fields = self.root.search(splitRoute(route), 0, dict())
+
+        for r in self.fallbacks:
+            if best is not None and r.order > best.order:
+                break
             if res := r.regex.search(route):
-                return r, res
+                best, fields = r, res.groupdict()
+                break
+
+        if best is None:
+            return None, None
 
-        return None, None
+        self.cache[route] = (best, fields)
+        if len(self.cache) > self.CacheSize:
+            self.cache.popitem(last=False)
+        return best, dict(fields)
 
     def processRouteNotFound(self, *, serder, saider, route,
                              cigars=None, tsgs=None, **kwargs):
@@ -267,25 +338,25 @@ class Revery:
             if not self.lax and cigar.verfer.qb64 in self.prefixes:  # own cig
                 if not self.local:  # own cig when not local so ignore
                     logger.info("Kevery process: skipped own attachment"
-                                " on nonlocal reply msg=\n%s\n", serder.pretty())
+                                " on nonlocal reply msg=\n%s\n", ogling.pretty(serder))
                     continue  # skip own cig attachment on non-local reply msg
 
             if aid != cigar.verfer.qb64:  # cig not by aid
                 logger.info("Kevery process: skipped cig not from aid="
-                            "%s on reply msg=\n%s\n", aid, serder.pretty())
+                            "%s on reply msg=\n%s\n", aid, ogling.pretty(serder))
                 continue  # skip invalid cig's verfer is not aid
 
             if odater:  # get old compare datetimes to see if later
                 if dater.datetime <= odater.datetime:
                     logger.info("Kevery process: skipped stale update from "
-                                "%s of reply msg=\n%s\n", aid, serder.pretty())
+                                "%s of reply msg=\n%s\n", aid, ogling.pretty(serder))
                     continue  # skip if not later
                     # raise ValidationError(f"Stale update of {route} from {aid} "
                     # f"via {Ilks.rpy}={serder.ked}.")
 
             if not cigar.verfer.verify(cigar.raw, serder.raw):  # cig not verify
                 logger.info("Kevery process: skipped nonverifying cig from "
-                            "%s on reply msg=\n%s\n", cigar.verfer.qb64, serder.pretty())
+                            "%s on reply msg=\n%s\n", cigar.verfer.qb64, ogling.pretty(serder))
                 continue  # skip if cig not verify
 
             # All constraints satisfied so update
@@ -298,13 +369,13 @@ class Revery:
             if not self.lax and prefixer.qb64 in self.prefixes:  # own sig
                 if not self.local:  # own sig when not local so ignore
                     logger.info("Kevery process: skipped own attachment"
-                                " on nonlocal reply msg=\n%s\n", serder.pretty())
+                                " on nonlocal reply msg=\n%s\n", ogling.pretty(serder))
                     continue  # skip own sig attachment on non-local reply msg
 
             spre = prefixer.qb64
             if aid != spre:  # sig not by aid
                 logger.info("Kevery process: skipped signature not from aid="
-                            "%s on reply msg=\n%s\n", aid, serder.pretty())
+                            "%s on reply msg=\n%s\n", aid, ogling.pretty(serder))
                 continue  # skip invalid signature is not from aid
 
             if osaider:  # check if later logic  sn > or sn == and dt >
@@ -314,7 +385,7 @@ class Revery:
                     if seqner.sn < osqr.sn:  # sn earlier
                         logger.info("Kevery process: skipped stale key state sig"
                                     "from %s sn=%s<%s on reply msg=\n%s\n",
-                                    aid, seqner.sn, osqr.sn, serder.pretty())
+                                    aid, seqner.sn, osqr.sn, ogling.pretty(serder))
                         continue  # skip if sn earlier
 
                     if seqner.sn == osqr.sn:  # sn same so check datetime
@@ -322,7 +393,7 @@ class Revery:
                             if dater.datetime <= odater.datetime:
                                 logger.info("Kevery process: skipped stale key"
                                             "state sig datetime from %s on reply msg=\n%s\n",
-                                            aid, serder.pretty())
+                                            aid, ogling.pretty(serder))
                                 continue  # skip if not later
 
             # retrieve sdig of last event at sn of signer.
@@ -499,7 +570,7 @@ class Revery:
                 else:  # unescrow succeded
                     self.db.rpes.rem(keys=(route, ), val=saider)  # remove escrow only
                     logger.info("Kevery unescrow succeeded for reply=\n%s\n",
-                                serder.pretty())
+                                ogling.pretty(serder))
 
             except Exception as ex:  # log diagnostics errors etc
                 self.db.rpes.rem(keys=(route,), val=saider)  # remove escrow only
@@ -524,7 +595,7 @@ class Route:
 
     """
 
-    def __init__(self, regex, fields, resource, suffix=None):
+    def __init__(self, regex, fields, resource, suffix=None, template=None):
         """ Initialize instance of route
 
         Parameters:
@@ -532,12 +603,69 @@ class Route:
             fields(set): field names for matches in regex
             resource(object): the handler for this route
             suffix(Optional(str)): a suffix to be applied to the handler method
+            template(Optional(str)): route template regex was compiled from
 
         """
         self.regex = regex
         self.fields = fields
         self.resource = resource
         self.suffix = suffix
+        self.template = template
+        self.order = 0  # registration order in router
+        self.hits = 0  # number of dispatches
+        self.elapsed = 0.0  # total seconds in handler
+
+
+class RouteNode:
+    """ Node of Router trie of route template path segments
+
+    Properties:
+        .statics(dict): child RouteNode keyed by lowercase static segment
+        .params(dict): child RouteNode keyed by field name of templated segment
+        .routes(list): Route instances whose template ends at this node
+
+    """
+    __slots__ = ("statics", "params", "routes")
+
+    def __init__(self):
+        self.statics = dict()
+        self.params = dict()
+        self.routes = list()
+
+    def search(self, segs, i, fields):
+        """ Returns (Route, fields) of earliest registered route matching
+        segs from index i on or (None, None)
+
+        Parameters:
+            segs(list): of str path segments of route
+            i(int): index of next segment to match
+            fields(dict): matched field values so far
+
+        """
+        if i == len(segs):
+            return (self.routes[0], fields) if self.routes else (None, None)
+
+        best, found = None, None
+        seg = segs[i]
+        if (child := self.statics.get(seg.lower())) is not None:
+            best, found = child.search(segs, i + 1, fields)
+
+        if seg:  # templated segment matches any non empty segment
+            for name, child in self.params.items():
+                route, matched = child.search(segs, i + 1, dict(fields, **{name: seg}))
+                if route is not None and (best is None or route.order < best.order):
+                    best, found = route, matched
+
+        return best, found
+
+
+FieldRex = re.compile(r'{([a-zA-Z]\w*)}')  # fully templated route segment
+
+
+def splitRoute(route):
+    """ Returns list of path segments of route with leading slash removed """
+    route = route[1:]
+    return route.split("/") if route else []
 
 
 def compile_uri_template(template):
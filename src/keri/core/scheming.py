@@ -6,6 +6,7 @@ self-addressing and schema support
 """
 
 import json
+from collections import OrderedDict
 
 import cbor2 as cbor
 import jsonschema
@@ -52,6 +53,14 @@ class CacheResolver:
             return None
         return schemer.raw
 
+    def schemer(self, said):
+        """ Returns cached Schemer for schema SAID said or None if not cached
+
+        Parameters:
+            said (str): SAID of schema
+        """
+        return self.db.schema.get(said)
+
     def handler(self, uri):
         """ Handler provided to jsonschema for cache resolution
 
@@ -85,8 +94,18 @@ class CacheResolver:
 
 class JSONSchema:
     """ JSON Schema support class
+
+    Compiled validators are cached process wide by schema SAID in .Validators
+    so validating against a known schema only validates the instance.
+
+    Class Attributes:
+        ValidatorCacheSize (int): max number of compiled validators cached
+        Validators (OrderedDict): least recently used cache of compiled
+            validators keyed by schema SAID with values (resolver, validator)
     """
     id_ = Saids.dollar  # ID Field Label
+    ValidatorCacheSize = 1024
+    Validators = OrderedDict()
 
     def __init__(self, resolver=None):
         """ Initialize instance
@@ -209,12 +228,58 @@ class JSONSchema:
 
         return True
 
-    def verify_json(self, schema=b'', raw=b''):
+    @classmethod
+    def compiled(cls, said):
+        """ Returns True if compiled validator for schema SAID said is cached
+
+        Parameters:
+            said (str): SAID of schema
+        """
+        return said in cls.Validators
+
+    def validator(self, schema, said=None):
+        """ Returns compiled validator for schema
+
+        Checks schema and compiles validator with .resolver hooked in once.
+        When said is provided then caches compiled validator by said in
+        .Validators and reuses it on later calls with the same said and
+        resolver.
+
+        Parameters:
+            schema (dict): is the JSON schema to compile
+            said (str | None): verified SAID of schema to cache by.
+                None means do not cache
+
+        """
+        if said is not None and said in self.Validators:
+            resolver, validator = self.Validators[said]
+            if resolver is self.resolver:
+                self.Validators.move_to_end(said)
+                return validator
+
+        klas = jsonschema.validators.validator_for(schema)
+        klas.check_schema(schema)
+        kwargs = dict()
+        if self.resolver is not None:
+            kwargs["resolver"] = self.resolver.resolver(scer=schema)
+        validator = klas(schema, **kwargs)
+
+        if said is not None:
+            self.Validators[said] = (self.resolver, validator)
+            self.Validators.move_to_end(said)
+            while len(self.Validators) > self.ValidatorCacheSize:
+                self.Validators.popitem(last=False)  # evict least recently used
+
+        return validator
+
+    def verify_json(self, schema=b'', raw=b'', said=None):
         """ Verify the raw content against the schema for JSON that conforms to the schema
 
         Parameters:
             schema (bytes): is the schema use for validation
             raw (bytes): is JSON to validate against the Schema
+            said (str | None): verified SAID of schema to cache compiled
+                validator by. None means do not cache
 
         Returns:
             boolean: True if the JSON passes validation against the
@@ -224,10 +289,10 @@ class JSONSchema:
         """
         try:
             d = json.loads(raw)
-            kwargs = dict()
-            if self.resolver is not None:
-                kwargs["resolver"] = self.resolver.resolver(scer=raw)
-            jsonschema.validate(instance=d, schema=schema, **kwargs)
+            validator = self.validator(schema=schema, said=said)
+            error = jsonschema.exceptions.best_match(validator.iter_errors(d))
+            if error is not None:
+                raise error
         except jsonschema.exceptions.ValidationError as ex:
             raise kering.ValidationError(f'Credential validation exception: {ex}')
         except jsonschema.exceptions.SchemaError as ex:
@@ -407,7 +472,7 @@ class Schemer:
             raw (bytes): is serialised JSON content to verify against schema
         """
 
-        return self.typ.verify_json(schema=self.sed, raw=raw)
+        return self.typ.verify_json(schema=self.sed, raw=raw, said=self.said)
 
     def pretty(self, *, size=1024):
         """
@@ -425,5 +490,7 @@ class Schemer:
                 False otherwise
 
         """
+        if self.typ.compiled(self.said):  # already checked when compiled
+            return True
 
         return self.typ.verify_schema(schema=self.sed)
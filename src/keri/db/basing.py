@@ -21,6 +21,7 @@ need to call it
 
 import os
 import shutil
+import sys
 from collections import namedtuple
 from contextlib import contextmanager
 from dataclasses import dataclass, asdict, field
@@ -78,17 +79,37 @@ class dbdict(dict):
     Subclass of dict that has db as attribute and employs read through cache
     from db Baser.stts of kever states to reload kever from state in database
     when not found in memory as dict item.
+
+    When .size is not None acts as a bounded least recently used cache.
+    Once more than .size kevers are in memory, the least recently used kevers
+    are evicted unless pinned. Kevers of locally owned prefixes in .db.prefixes
+    and .db.groups are pinned. Evicted kevers are safely rehydrated from their
+    key state record in .db.states on next access since Kever persists its
+    state on every update.
+
+    Attributes:
+        db (Baser | None): database for read through of key state records
+        size (int | None): max number of kevers kept in memory, exceeded
+            only when all are pinned. None means unbounded so never evict
+        hits (int): count of lookups satisfied from memory
+        misses (int): count of lookups that read through to .db
+        evictions (int): count of kevers evicted from memory
     """
-    __slots__ = ('db')  # no .__dict__ just for db reference
+    __slots__ = ('db', 'size', 'hits', 'misses', 'evictions')  # no .__dict__
 
-    def __init__(self, *pa, **kwa):
+    def __init__(self, *pa, size=None, **kwa):
         super(dbdict, self).__init__(*pa, **kwa)
         self.db = None
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
 
     def __getitem__(self, k):
         try:
-            return super(dbdict, self).__getitem__(k)
+            val = super(dbdict, self).__getitem__(k)
         except KeyError as ex:
+            self.misses += 1
             if not self.db:
                 raise ex  # reraise KeyError
             if (ksr := self.db.states.get(keys=k)) is None:
@@ -100,6 +121,17 @@ class dbdict(dict):
             self.__setitem__(k, kever)
             return kever
 
+        self.hits += 1
+        if self.size is not None:  # move to most recently used end
+            super(dbdict, self).__delitem__(k)
+            super(dbdict, self).__setitem__(k, val)
+        return val
+
+    def __setitem__(self, k, v):
+        super(dbdict, self).__setitem__(k, v)
+        if self.size is not None and len(self) > self.size:
+            self.evict(keep=k)
+
     def __contains__(self, k):
         if not super(dbdict, self).__contains__(k):
             try:
@@ -122,12 +154,61 @@ class dbdict(dict):
 
         """
         if not super(dbdict, self).__contains__(k):
-            return default
+            if self.size is None:  # unbounded so never evicted
+                return default
+            try:  # may have been evicted so read through
+                return self.__getitem__(k)
+            except KeyError:
+                return default
         else:
             return self.__getitem__(k)
 
+    def pinned(self, k):
+        """Returns True if kever at k is never evicted, False otherwise
+
+        Parameters:
+            k (str): qb64 identifier prefix key
+        """
+        return bool(self.db and (k in self.db.prefixes or k in self.db.groups))
+
+    def flush(self, keep=None):
+        """Drops unpinned kevers from memory so that next access reloads them
+        from their key state record in .db. Used when other processes may
+        update key state in .db. Bounds unbounded .size so that .get reads
+        through.
+
+        Parameters:
+            keep (Callable | None): returns True for key of kever to keep
+        """
+        if self.size is None:
+            self.size = sys.maxsize
+        for k in list(super(dbdict, self).__iter__()):
+            if self.pinned(k) or (keep is not None and keep(k)):
+                continue
+            super(dbdict, self).__delitem__(k)
+            self.evictions += 1
 
+    def evict(self, keep=None):
+        """Evicts least recently used unpinned kevers until within .size
 
+        Parameters:
+            keep (str | None): key never to evict such as the one just added
+        """
+        if self.size is None:
+            return
+        excess = len(self) - self.size
+        if excess <= 0:
+            return
+        victims = []
+        for k in super(dbdict, self).__iter__():  # oldest first
+            if k == keep or self.pinned(k):
+                continue
+            victims.append(k)
+            if len(victims) >= excess:
+                break
+        for k in victims:
+            super(dbdict, self).__delitem__(k)
+            self.evictions += 1
 
 
 @dataclass
@@ -545,6 +626,12 @@ class Baser(dbing.LMDBer):
 
         kevers (dict): Kever instances indexed by identifier prefix qb64
         prefixes (OrderedSet): local prefixes corresponding to habitats for this db
+        woken (set): of bytes identifier prefixes whose escrowed items may
+            now be processable because something they wait on has changed
+            since the last escrow processing pass
+        waiters (dict): maps bytes identifier prefix of a dependency to set of
+            bytes identifier prefixes of escrowed items waiting on it, such as
+            delegatees waiting on their delegator's KEL
 
         .evts is named sub DB whose values are serialized events
             dgKey
@@ -847,6 +934,19 @@ class Baser(dbing.LMDBer):
         the events's prefix and sequence number so can look up an event by any
         of its next public signing key digests. Updated by Kever.logEvent
 
+        .seals is CatCesrIoSetSuber with subkey="seals." of concatenated tuples
+        (qb64 snh, qb64 said) indexed by (qb64 pre, seal digest) where seal
+        digest is the "d" or "rd" field of an anchored seal. Maps each anchored
+        seal to the sequence number and said of every event in the KEL of pre
+        that anchors it so can find anchoring events without scanning the KEL.
+        Updated by Kever.logEvent
+
+        .migs is CesrSuber with subkey="migs." of qb64 Dater indexed by name of
+        completed migration. Marks when a derived index such as .seals was
+        fully populated for events logged before it existed. .seals is only
+        consulted once "seals" is marked, either on creation of a fresh
+        database or by migrateSeals, otherwise KELs are scanned.
+
         Missing ToDo XXXX other attributes as sub dbs not documented here
             such as .wits etc
 
@@ -855,7 +955,7 @@ class Baser(dbing.LMDBer):
 
     """
 
-    def __init__(self, headDirPath=None, reopen=False, **kwa):
+    def __init__(self, headDirPath=None, reopen=False, maxKevers=None, **kwa):
         """
         Setup named sub databases.
 
@@ -870,13 +970,18 @@ class Baser(dbing.LMDBer):
                 If not provided use default .HeadDirpath
             mode is int numeric os dir permissions for database directory
             reopen (bool): True means database will be reopened by this init
+            maxKevers (int | None): max number of kevers cached in memory by
+                .kevers before least recently used unpinned kevers are evicted.
+                None means unbounded.
 
 
         """
         self.prefixes = oset()  # should change to hids for hab ids
         self.groups = oset()  # group hab ids
-        self._kevers = dbdict()
+        self._kevers = dbdict(size=maxKevers)
         self._kevers.db = self  # assign db for read through cache of kevers
+        self.woken = set()  # prefixes whose escrows need reattempt
+        self.waiters = dict()  # dependency prefix to set of waiting prefixes
 
         super(Baser, self).__init__(headDirPath=headDirPath, reopen=reopen, **kwa)
 
@@ -909,25 +1014,25 @@ class Baser(dbing.LMDBer):
         # Names end with "." as sub DB name must include a non Base64 character
         # to avoid namespace collisions with Base64 identifier prefixes.
 
-        self.evts = self.env.open_db(key=b'evts.')
-        self.fels = self.env.open_db(key=b'fels.')
-        self.dtss = self.env.open_db(key=b'dtss.')
-        self.aess = self.env.open_db(key=b'aess.')
-        self.sigs = self.env.open_db(key=b'sigs.', dupsort=True)
-        self.wigs = self.env.open_db(key=b'wigs.', dupsort=True)
-        self.rcts = self.env.open_db(key=b'rcts.', dupsort=True)
-        self.ures = self.env.open_db(key=b'ures.', dupsort=True)
-        self.vrcs = self.env.open_db(key=b'vrcs.', dupsort=True)
-        self.vres = self.env.open_db(key=b'vres.', dupsort=True)
-        self.kels = self.env.open_db(key=b'kels.', dupsort=True)
-        self.pses = self.env.open_db(key=b'pses.', dupsort=True)
-        self.pdes = self.env.open_db(key=b'pdes.')
-        self.pwes = self.env.open_db(key=b'pwes.', dupsort=True)
-        self.uwes = self.env.open_db(key=b'uwes.', dupsort=True)
-        self.ooes = self.env.open_db(key=b'ooes.', dupsort=True)
-        self.dels = self.env.open_db(key=b'dels.', dupsort=True)
-        self.ldes = self.env.open_db(key=b'ldes.', dupsort=True)
-        self.qnfs = self.env.open_db(key=b'qnfs.', dupsort=True)
+        self.evts = self.openDB(key=b'evts.')
+        self.fels = self.openDB(key=b'fels.')
+        self.dtss = self.openDB(key=b'dtss.')
+        self.aess = self.openDB(key=b'aess.')
+        self.sigs = self.openDB(key=b'sigs.', dupsort=True)
+        self.wigs = self.openDB(key=b'wigs.', dupsort=True)
+        self.rcts = self.openDB(key=b'rcts.', dupsort=True)
+        self.ures = self.openDB(key=b'ures.', dupsort=True)
+        self.vrcs = self.openDB(key=b'vrcs.', dupsort=True)
+        self.vres = self.openDB(key=b'vres.', dupsort=True)
+        self.kels = self.openDB(key=b'kels.', dupsort=True)
+        self.pses = self.openDB(key=b'pses.', dupsort=True)
+        self.pdes = self.openDB(key=b'pdes.')
+        self.pwes = self.openDB(key=b'pwes.', dupsort=True)
+        self.uwes = self.openDB(key=b'uwes.', dupsort=True)
+        self.ooes = self.openDB(key=b'ooes.', dupsort=True)
+        self.dels = self.openDB(key=b'dels.', dupsort=True)
+        self.ldes = self.openDB(key=b'ldes.', dupsort=True)
+        self.qnfs = self.openDB(key=b'qnfs.', dupsort=True)
 
         # event source local (protected) or non-local (remote not protected)
         self.esrs = koming.Komer(db=self,
@@ -1128,6 +1233,10 @@ class Baser(dbing.LMDBer):
         # Field values for contact information for remote identifiers.  Keyed by prefix/field
         self.cfld = subing.Suber(db=self,
                                  subkey="cfld.")
+        # Contact field value index keyed by field|lowercased value|prefix, val is field value
+        self.cfvs = subing.Suber(db=self, subkey="cfvs.", sep="|")
+        # Contact field token index keyed by field|lowercased token suffix|prefix, val is prefix
+        self.ctks = subing.Suber(db=self, subkey="ctks.", sep="|")
 
         # Global settings for the Habery environment
         self.hbys = subing.Suber(db=self, subkey='hbys.')
@@ -1138,7 +1247,7 @@ class Baser(dbing.LMDBer):
         # Transferable signatures on contact data
         self.ccigs = subing.CesrSuber(db=self, subkey='ccigs.', klas=coring.Cigar)
         # Chunked image data for contact information for remote identifiers
-        self.imgs = self.env.open_db(key=b'imgs.')
+        self.imgs = self.openDB(key=b'imgs.')
 
         # Delegation escrow dbs #
         # delegated partial witness escrow
@@ -1163,6 +1272,18 @@ class Baser(dbing.LMDBer):
         self.digs = subing.CatCesrIoSetSuber(db=self, subkey="digs.",
                                              klas=(coring.Prefixer, coring.Seqner))
 
+        # anchored seal digest mapped to the seq no and said of each event of
+        # the anchoring AID whose seals list contains it so can look up
+        # anchoring events without scanning the KEL. updated by Kever.logEvent.
+        self.seals = subing.CatCesrIoSetSuber(db=self, subkey="seals.",
+                                              klas=(coring.Seqner, coring.Saider))
+
+        # completed migration name mapped to datetime of its completion
+        self.migs = subing.CesrSuber(db=self, subkey="migs.", klas=coring.Dater)
+        if (not self.readonly and self.migs.get(keys="seals") is None
+                and next(self.getTopItemIter(db=self.evts), None) is None):
+            self.migs.pin(keys="seals", val=coring.Dater())  # fresh so nothing to backfill
+
         # multisig sig embed payload SAID mapped to containing exn messages across group multisig participants
         self.meids = subing.CesrIoSetSuber(db=self, subkey="meids.", klas=coring.Saider)
 
@@ -1444,6 +1565,71 @@ class Baser(dbing.LMDBer):
                 yield dmsg
 
 
+    @staticmethod
+    def sealDigest(seal):
+        """
+        Returns digest of anchored seal used as its .seals index key
+        or None when seal has no digest field to index by
+
+        Parameters:
+            seal (dict): dict form of anchored seal
+        """
+        if not isinstance(seal, dict):
+            return None
+        dig = seal.get("d", seal.get("rd"))
+        return dig if isinstance(dig, str) and dig else None
+
+    def indexSeals(self, serder):
+        """
+        Adds anchored seals of event serder to the .seals index.
+        Idempotent.
+
+        Parameters:
+            serder (SerderKERI): event whose seals list to index
+        """
+        val = None
+        for seal in serder.seals or []:
+            if (dig := self.sealDigest(seal)) is None:
+                continue
+            if val is None:
+                val = (coring.Seqner(sn=serder.sn), coring.Saider(qb64=serder.said))
+            self.seals.add(keys=(serder.pre, dig), val=val)
+
+    def getSealedEvtIter(self, pre, dig, sn=0, last=False):
+        """
+        Returns iterator of events in sn order from the KEL of pre at or
+        after sn that anchor a seal with digest dig as given by .seals index.
+
+        Parameters:
+            pre (bytes|str): identifier of the KEL to search
+            dig (str): digest of anchored seal
+            sn (int): beginning sn to search
+            last (bool): True means only last event at any sn so skips
+                disputed or superseded events.
+        """
+        if hasattr(pre, "decode"):
+            pre = pre.decode("utf-8")
+
+        entries = [(seqner.sn, saider) for seqner, saider in
+                   self.seals.getIter(keys=(pre, dig)) if seqner.sn >= sn]
+        entries.sort(key=lambda entry: entry[0])
+        for esn, saider in entries:
+            if last:
+                ldig = self.getKeLast(key=dbing.snKey(pre, esn))
+                if ldig is None or bytes(ldig) != saider.qb64b:
+                    continue
+            if not (raw := self.getEvt(key=dbing.dgKey(pre, saider.qb64b))):
+                continue
+            yield serdering.SerderKERI(raw=bytes(raw))
+
+    @property
+    def sealsIndexed(self):
+        """
+        Returns True when .seals index covers every logged event so it may
+        be used in place of scanning KELs, False otherwise
+        """
+        return self.migs.get(keys="seals") is not None
+
     def findAnchoringSealEvent(self, pre, seal, sn=0):
         """
         Search through a KEL for the event that contains a specific anchored
@@ -1453,6 +1639,8 @@ class Baser(dbing.LMDBer):
         Returns the Serder of the first event with the anchored SealEvent seal,
             None if not found
 
+        Candidates are looked up in the .seals index by seal digest once
+        .sealsIndexed otherwise falls back to scanning the KEL.
 
         Parameters:
             pre (bytes|str): identifier of the KEL to search
@@ -1466,8 +1654,13 @@ class Baser(dbing.LMDBer):
 
         seal = eventing.SealEvent(**seal)  #convert to namedtuple
 
-        for evt in self.getEvtPreIter(pre=pre, sn=sn):  # includes disputed & superseded
-            srdr = serdering.SerderKERI(raw=evt.tobytes())
+        if self.sealsIndexed:
+            srdrs = self.getSealedEvtIter(pre=pre, dig=seal.d, sn=sn)
+        else:  # database predates .seals and not yet migrated so scan
+            srdrs = (serdering.SerderKERI(raw=evt.tobytes()) for evt in
+                     self.getEvtPreIter(pre=pre, sn=sn))
+
+        for srdr in srdrs:  # includes disputed & superseded
             for eseal in srdr.seals or []:
                 if tuple(eseal) == eventing.SealEvent._fields:
                     eseal = eventing.SealEvent(**eseal)  # convert to namedtuple
@@ -1485,6 +1678,9 @@ class Baser(dbing.LMDBer):
         Returns the Serder of the first event with the anchored Seal seal,
             None if not found
 
+        Candidates are looked up in the .seals index by seal digest when the
+        seal has one and .sealsIndexed otherwise falls back to scanning the KEL.
+
         Parameters:
             pre (bytes|str): identifier of the KEL to search
             seal (dict): dict form of Seal of any type to find in anchored
@@ -1494,9 +1690,16 @@ class Baser(dbing.LMDBer):
         """
         # create generic Seal namedtuple class using keys from provided seal dict
         Seal = namedtuple('Seal', list(seal))  # matching type
+        dig = self.sealDigest(seal)
+        seal = Seal(**seal)  # convert to namedtuple to compare with eseal
 
-        for evt in self.getEvtLastPreIter(pre=pre, sn=sn):  # only last evt at sn
-            srdr = serdering.SerderKERI(raw=evt.tobytes())
+        if dig is not None and self.sealsIndexed:
+            srdrs = self.getSealedEvtIter(pre=pre, dig=dig, sn=sn, last=True)
+        else:  # no digest to index by or index incomplete so scan
+            srdrs = (serdering.SerderKERI(raw=evt.tobytes()) for evt in
+                     self.getEvtLastPreIter(pre=pre, sn=sn))  # only last evt at sn
+
+        for srdr in srdrs:
             for eseal in srdr.seals or []:
                 if tuple(eseal) == Seal._fields:  # same type of seal
                     eseal = Seal(**eseal)  #convert to namedtuple
@@ -1562,6 +1765,38 @@ class Baser(dbing.LMDBer):
 
         return members
 
+    def wakeEscrows(self, pre):
+        """
+        Marks escrowed items of identifier prefix pre and of any prefixes
+        waiting on pre as ready to be reattempted by the next escrow processing
+        pass. Called whenever anything that escrowed items of pre may depend on
+        changes such as an event, signature, or receipt for pre.
+
+        Parameters:
+            pre (str | bytes): qb64 identifier prefix
+        """
+        if hasattr(pre, "encode"):
+            pre = pre.encode("utf-8")
+        self.woken.add(pre)
+        self.woken.update(self.waiters.pop(pre, ()))
+
+    def waitEscrows(self, pre, dep):
+        """
+        Registers that escrowed items of identifier prefix pre wait on changes
+        to identifier prefix dep so that waking dep also wakes pre.
+        Registration is cleared when dep is woken. Reattempts that re-escrow
+        register again.
+
+        Parameters:
+            pre (str | bytes): qb64 identifier prefix of escrowed items
+            dep (str | bytes): qb64 identifier prefix of dependency
+        """
+        if hasattr(pre, "encode"):
+            pre = pre.encode("utf-8")
+        if hasattr(dep, "encode"):
+            dep = dep.encode("utf-8")
+        self.waiters.setdefault(dep, set()).add(pre)
+
     def fullyWitnessed(self, serder):
         """ Verify the witness threshold on the event
 
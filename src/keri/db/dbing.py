@@ -61,6 +61,7 @@ from hio.base import filing
 
 from ..kering import MaxON  # maximum ordinal number for seqence or first seen
 
+from .. import help
 from ..help import helping
 
 #MaxON = int("f"*32, 16)  # largest possible ordinal number, sequence or first seen
@@ -257,6 +258,35 @@ def openLMDB(*, cls=None, name="test", temp=True, **kwa):
             lmdber.close(clear=lmdber.temp)  # clears if lmdber.temp
 
 
+class BoundTxn:
+    """
+    BoundTxn wraps the unit of work transaction of an LMDBer so that its
+    operations default to sub db .db like a transaction begun on .db.
+
+    Attributes:
+        txn (lmdb.Transaction): unit of work transaction
+        db (lmdb._Database | None): default named sub db
+    """
+    __slots__ = ("txn", "db")
+
+    def __init__(self, txn, db=None):
+        self.txn = txn
+        self.db = db
+
+    def get(self, key, default=None, db=None):
+        return self.txn.get(key, default, db=db if db is not None else self.db)
+
+    def put(self, key, value, dupdata=True, overwrite=True, append=False, db=None):
+        return self.txn.put(key, value, dupdata=dupdata, overwrite=overwrite,
+                            append=append, db=db if db is not None else self.db)
+
+    def delete(self, key, value=b'', db=None):
+        return self.txn.delete(key, value, db=db if db is not None else self.db)
+
+    def cursor(self, db=None):
+        return self.txn.cursor(db=db if db is not None else self.db)
+
+
 class LMDBer(filing.Filer):
     """
     LBDBer base class for LMDB manager instances.
@@ -283,6 +313,10 @@ class LMDBer(filing.Filer):
 
     Properties:
 
+    Hidden:
+        _txn (lmdb.Transaction | None): open write transaction of the unit
+            of work opened by .trans. None when no unit of work in progress.
+
     File/Directory Creation Mode Notes:
         .Perm provides default restricted access permissions to directory and/or files
         stat.S_ISVTX | stat.S_IRUSR | stat.S_IWUSR | stat.S_IXUSR
@@ -347,6 +381,8 @@ class LMDBer(filing.Filer):
         """
         self.env = None
         self.readonly = True if readonly else False
+        self._txn = None
+        self.names = dict()  # sub db names keyed by sub db for metrics labels
         super(LMDBer, self).__init__(**kwa)
 
 
@@ -379,6 +415,7 @@ class LMDBer(filing.Filer):
         if readonly is not None:
             self.readonly = readonly
 
+        self.names = dict()
         # open lmdb major database instance
         # creates files data.mdb and lock.mdb in .dbDirPath
         self.env = lmdb.open(self.path, max_dbs=self.MaxNamedDBs, map_size=104857600,
@@ -400,10 +437,103 @@ class LMDBer(filing.Filer):
                 pass
 
         self.env = None
+        self._txn = None
 
         return(super(LMDBer, self).close(clear=clear))
 
 
+    def openDB(self, key, **kwa):
+        """
+        Returns named sub db of .env at key opened with kwa such as dupsort.
+        Records its name in .names to label its metrics.
+
+        Parameters:
+            key (bytes): name of sub db such as b'evts.'
+        """
+        sdb = self.env.open_db(key=key, **kwa)
+        self.names[sdb] = key.decode("utf-8").rstrip(".")
+        return sdb
+
+
+    @contextmanager
+    def trans(self):
+        """
+        Context manager for a unit of work. All reads and writes to any sub db
+        of .env made inside the with block, whether directly through the
+        LMDBer methods or through the SuberBase and Komer sub db classes that
+        use them, join one write transaction that is committed atomically with
+        a single sync on exit of the block or aborted when the block raises.
+        Nested .trans blocks join the outermost unit of work.
+
+        Usage:
+
+        with db.trans():
+            db.putEvt(dgkey, raw)
+            db.fons.pin(keys=dgkey, val=Seqner(sn=fn))
+
+        """
+        if self._txn is not None:  # already in unit of work so join it
+            yield self._txn
+            return
+
+        with self.env.begin(write=True, buffers=True) as txn:
+            self._txn = txn
+            try:
+                yield txn
+            finally:
+                self._txn = None
+
+
+    @contextmanager
+    def readTrans(self, db=None):
+        """
+        Context manager that yields a transaction for consistent reads across
+        sub dbs. Operations on the yielded transaction default to sub db db
+        and may name any other with their db parameter. Inside a unit of work
+        opened by .trans joins it so reads see its uncommitted writes.
+        Otherwise begins a standalone read only transaction.
+
+        Usage:
+
+        with db.readTrans(db=db.evts) as txn:
+            raw = txn.get(dgkey)
+            sig = txn.get(dgkey, db=db.sigs)
+
+        Parameters:
+            db (lmdb._Database | None): default named sub db. None means main db
+        """
+        with self._begin(db=db, write=False) as txn:
+            yield txn
+
+
+    @contextmanager
+    def _begin(self, db, write=False):
+        """
+        Context manager that begins and yields transaction on db.
+        When inside a unit of work opened by .trans then yields the unit of
+        work transaction bound to db so that writes are only committed with
+        the unit of work and reads see its uncommitted writes. Because no
+        child transaction is opened, iterators left suspended or abandoned
+        inside the unit of work neither hide nor lose later reads and writes.
+        Otherwise begins a standalone transaction.
+
+        Parameters:
+            db (lmdb._Database): instance of named sub db
+            write (bool): True means write transaction. Ignored inside unit of
+                work which is always a write transaction
+        """
+        if help.meter.enabled:
+            help.meter.count("keri_db_writes_total" if write else "keri_db_reads_total",
+                             self.names.get(db, ""))
+
+        if self._txn is not None:
+            yield BoundTxn(txn=self._txn, db=db)
+            return
+
+        with self.env.begin(db=db, write=write, buffers=True) as txn:
+            yield txn
+
+
     # For subdbs with no duplicate values allowed at each key. (dupsort==False)
     def putVal(self, db, key, val):
         """
@@ -417,7 +547,9 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             val is bytes of value to be written
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
+            if help.meter.enabled:
+                help.meter.count("keri_db_written_bytes_total", self.names.get(db, ""), len(val))
             try:
                 return (txn.put(key, val, overwrite=False))
             except lmdb.BadValsizeError as ex:
@@ -436,7 +568,9 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             val is bytes of value to be written
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
+            if help.meter.enabled:
+                help.meter.count("keri_db_written_bytes_total", self.names.get(db, ""), len(val))
             try:
                 return (txn.put(key, val))
             except lmdb.BadValsizeError as ex:
@@ -454,12 +588,15 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
 
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             try:
-                return(txn.get(key))
+                val = txn.get(key)
             except lmdb.BadValsizeError as ex:
                 raise KeyError(f"Key: `{key}` is either empty, too big (for lmdb),"
                                " or wrong DUPFIXED size. ref) lmdb.BadValsizeError")
+            if val is not None and help.meter.enabled:
+                help.meter.count("keri_db_read_bytes_total", self.names.get(db, ""), len(val))
+            return val
 
 
     def delVal(self, db, key):
@@ -471,7 +608,7 @@ class LMDBer(filing.Filer):
             db is opened named sub db with dupsort=False
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             try:
                 return (txn.delete(key))
             except lmdb.BadValsizeError as ex:
@@ -486,7 +623,7 @@ class LMDBer(filing.Filer):
         Parameters:
             db is opened named sub db with dupsort=True
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             count = 0
             for _, _ in cursor:
@@ -512,7 +649,7 @@ class LMDBer(filing.Filer):
             split (bool): True means split key at sep before returning
             sep (bytes): separator char for key
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             if not cursor.set_range(key):  #  moves to val at key >= key, first if empty
                 return  # no values end of db
@@ -547,7 +684,7 @@ class LMDBer(filing.Filer):
                         from multiple branches of the key space. If top key is
                         empty then gets all items in database
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             if cursor.set_range(key):  # move to val at key >= key if any
                 for ckey, cval in cursor.iternext():  # get key, val at cursor
@@ -581,7 +718,7 @@ class LMDBer(filing.Filer):
         """
         # when deleting can't use cursor.iternext() because the cursor advances
         # twice (skips one) once for iternext and once for delete.
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             result = False
             cursor = txn.cursor()
             if cursor.set_range(key):  # move to val at key >= key if any
@@ -616,7 +753,7 @@ class LMDBer(filing.Filer):
         # set key with fn at max and then walk backwards to find last entry at pre
         # if any otherwise zeroth entry at pre
         key = onKey(pre, MaxON)
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             on = 0  # unless other cases match then zeroth entry at pre
             cursor = txn.cursor()
             if not cursor.set_range(key):  # max is past end of database
@@ -663,7 +800,7 @@ class LMDBer(filing.Filer):
             pre is bytes of itdentifier prefix
             on is int ordinal number to resume replay
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             key = onKey(pre, on)  # start replay at this enty 0 is earliest
             if not cursor.set_range(key):  #  moves to val at key >= key
@@ -691,7 +828,7 @@ class LMDBer(filing.Filer):
             key is key location in db to resume replay,
                    If empty then start at first key in database
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             if not cursor.set_range(key):  #  moves to val at key >= key, first if empty
                 return  # no values end of db
@@ -728,7 +865,7 @@ class LMDBer(filing.Filer):
         """
         result = False
         vals = oset(vals)  # make set
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             ion = 0
             iokey = suffix(key, ion, sep=sep)  # start zeroth entry if any
             cursor = txn.cursor()
@@ -768,7 +905,7 @@ class LMDBer(filing.Filer):
             val (bytes): serialized value to add
 
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             vals = oset()
             ion = 0
             iokey = suffix(key, ion, sep=sep)  # start zeroth entry if any
@@ -807,7 +944,7 @@ class LMDBer(filing.Filer):
         self.delIoSetVals(db=db, key=key, sep=sep)
         result = False
         vals = oset(vals)  # make set
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             for i, val in enumerate(vals):
                 iokey = suffix(key, i, sep=sep)  # ion is at add on amount
                 result = txn.put(iokey, val, dupdata=False, overwrite=True) or result
@@ -831,7 +968,7 @@ class LMDBer(filing.Filer):
         """
         ion = 0  # default is zeroth insertion at key
         iokey = suffix(key, ion=MaxSuffix, sep=sep)  # make iokey at max and walk back
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             cursor = txn.cursor()  # create cursor to walk back
             if not cursor.set_range(iokey):  # max is past end of database
                 # Three possibilities for max past end of database
@@ -881,7 +1018,7 @@ class LMDBer(filing.Filer):
             ion (int): starting ordinal value, default 0
 
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             vals = []
             iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
             cursor = txn.cursor()
@@ -909,7 +1046,7 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
             ion (int): starting ordinal value, default 0
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
@@ -937,7 +1074,7 @@ class LMDBer(filing.Filer):
         val = None
         ion = None  # no last value
         iokey = suffix(key, ion=MaxSuffix, sep=sep)  # make iokey at max and walk back
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()  # create cursor to walk back
             if not cursor.set_range(iokey):  # max is past end of database
                 # Three possibilities for max past end of database
@@ -1003,7 +1140,7 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
         """
         result = False
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             iokey = suffix(key, 0, sep=sep)  # start at zeroth value for key
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
@@ -1046,7 +1183,7 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
             val (bytes): value to delete
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             iokey = suffix(key, 0, sep=sep)  # start zeroth value for key
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
@@ -1072,7 +1209,7 @@ class LMDBer(filing.Filer):
             ion (int): starting ordinal value, default 0
 
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             items = []
             iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
             cursor = txn.cursor()
@@ -1100,7 +1237,7 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
             ion (int): starting ordinal value, default 0
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
@@ -1124,7 +1261,7 @@ class LMDBer(filing.Filer):
             db (lmdb._Database): instance of named sub db with dupsort==False
             iokey (bytes): actual key with ordinal key suffix
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             try:
                 return txn.delete(iokey)
             except lmdb.BadValsizeError as ex:
@@ -1149,7 +1286,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             vals is list of bytes of values to be written
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             result = True
             try:
                 for val in vals:
@@ -1182,7 +1319,7 @@ class LMDBer(filing.Filer):
         dups = set(self.getVals(db, key))  #get preexisting dups if any
         result = False
         if val not in dups:
-            with self.env.begin(db=db, write=True, buffers=True) as txn:
+            with self._begin(db=db, write=True) as txn:
                 try:
                     result = txn.put(key, val, dupdata=True)
                 except lmdb.BadValsizeError as ex:
@@ -1203,7 +1340,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             vals = []
             try:
@@ -1226,7 +1363,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             val = None
             try:
@@ -1250,7 +1387,7 @@ class LMDBer(filing.Filer):
             db is opened named sub db with dupsort=True
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             vals = []
             try:
@@ -1270,7 +1407,7 @@ class LMDBer(filing.Filer):
             db is opened named sub db with dupsort=True
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             count = 0
             try:
@@ -1293,7 +1430,7 @@ class LMDBer(filing.Filer):
             db is opened named sub db
             pre is bytes of key within sub db's keyspace pre.on
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             key = onKey(pre, on)  # start replay at this enty 0 is earliest
             count = 0
@@ -1320,7 +1457,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             val is bytes of dup val at key to delete
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             try:
                 return (txn.delete(key, val))
             except lmdb.BadValsizeError as ex:
@@ -1356,7 +1493,7 @@ class LMDBer(filing.Filer):
 
         result = False
         dups = set(self.getIoVals(db, key))  #get preexisting dups if any
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             idx = 0
             cursor = txn.cursor()
             try:
@@ -1416,7 +1553,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             vals = []
             try:
@@ -1447,7 +1584,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             vals = []
             try:
@@ -1471,7 +1608,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             val = None
             try:
@@ -1505,7 +1642,7 @@ class LMDBer(filing.Filer):
                     Othewise don't skip for first pass
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             items = []
             if cursor.set_range(key):  # moves to first_dup at key
@@ -1539,7 +1676,7 @@ class LMDBer(filing.Filer):
                     Othewise don't skip for first pass
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             if cursor.set_range(key):  # moves to first_dup at key
                 found = True
@@ -1560,7 +1697,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             count = 0
             try:
@@ -1582,7 +1719,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             try:
                 return (txn.delete(key))
             except lmdb.BadValsizeError as ex:
@@ -1619,7 +1756,7 @@ class LMDBer(filing.Filer):
             val is bytes of value to be deleted without intersion ordering proem
         """
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             cursor = txn.cursor()
             try:
                 if cursor.set_key(key):  # move to first_dup
@@ -1658,7 +1795,7 @@ class LMDBer(filing.Filer):
                 within sub db's keyspace
             on (int): ordinal number to begin iteration at
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             key = snKey(pre, cnt:=on)
             while cursor.set_key(key):  # moves to first_dup
@@ -1695,7 +1832,7 @@ class LMDBer(filing.Filer):
                 within sub db's keyspace
             on (int): is ordinal number to begin iteration
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             key = snKey(pre, cnt := on)
             # set_key returns True if exact key else false
@@ -1732,7 +1869,7 @@ class LMDBer(filing.Filer):
                 within sub db's keyspace
             on (int): ordinal number to being iteration
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             key = snKey(pre, cnt:=on)
             while cursor.set_key(key):  # moves to first_dup
@@ -1770,7 +1907,7 @@ class LMDBer(filing.Filer):
                 within sub db's keyspace
             on (int): beginning ordinal number to start iteration
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             key = snKey(pre, cnt:=on)
             while cursor.set_range(key):  #  moves to first dup of key >= key
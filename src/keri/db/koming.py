@@ -65,7 +65,7 @@ class KomerBase:
         """
         super(KomerBase, self).__init__()
         self.db = db
-        self.sdb = self.db.env.open_db(key=subkey.encode("utf-8"), dupsort=dupsort)
+        self.sdb = self.db.openDB(key=subkey.encode("utf-8"), dupsort=dupsort)
         self.schema = schema
         self.kind = kind
         self.serializer = self._serializer(kind)
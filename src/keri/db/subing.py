@@ -82,12 +82,35 @@ class SuberBase():
         """
         super(SuberBase, self).__init__()  # for multi inheritance
         self.db = db
-        self.sdb = self.db.env.open_db(key=subkey.encode("utf-8"), dupsort=dupsort)
+        self.sdb = self.db.openDB(key=subkey.encode("utf-8"), dupsort=dupsort)
         self.sep = sep if sep is not None else self.Sep
         self.verify = True if verify else False
 
 
 
+    def tokey(self, keys: Union[str, bytes, memoryview, Iterable],
+              top: bool=False):
+        """
+        Returns key bytes made from keys the same way as the methods of this
+        sub db do. For scans with a transaction from .db.readTrans.
+
+        Parameters:
+           keys (Union[str, bytes, Iterable]): str, bytes, or Iterable of str.
+           top (bool): True means partial key from top branch of key space
+        """
+        return self._tokey(keys, top=top)
+
+
+    def tokeys(self, key: Union[str, bytes, memoryview]):
+        """
+        Returns keys tuple of strs split from key bytes of this sub db.
+
+        Parameters:
+           key (Union[str, bytes]): str or bytes.
+        """
+        return self._tokeys(key)
+
+
     def _tokey(self, keys: Union[str, bytes, memoryview, Iterable],
                 top: bool=False):
         """
@@ -606,6 +606,41 @@ class OOBIEnd:
             rep.status = falcon.HTTP_NOT_FOUND
 
 
+class MetricsEnd:
+    """ REST API for metrics of message processing stages
+
+    Attributes:
+        .meter (Meter): metrics source
+
+    """
+
+    def __init__(self, meter=None):
+        """ End point for scraping metrics
+
+        Parameters:
+            meter (Meter | None): metrics source. None means help.meter
+
+        """
+        self.meter = meter if meter is not None else help.meter
+
+    def on_get(self, req, rep):
+        """ GET endpoint for metrics in Prometheus text exposition format
+
+        Parameters:
+            req: Falcon request object
+            rep: Falcon response object
+
+        """
+        if not self.meter.enabled or not hasattr(self.meter.sink, "render"):
+            rep.status = falcon.HTTP_NOT_FOUND
+            rep.text = "metrics not enabled"
+            return
+
+        rep.status = falcon.HTTP_200
+        rep.content_type = "text/plain; version=0.0.4"
+        rep.text = self.meter.sink.render()
+
+
 WEB_DIR_PATH = os.path.dirname(
     os.path.abspath(
         sys.modules.get(__name__).__file__))
@@ -645,6 +680,8 @@ def loadEnds(app, hby, *, tymth=None, default=None, static=False):
     app.add_route("/oobi/{aid}", end)
     app.add_route("/oobi/{aid}/{role}", end)
     app.add_route("/oobi/{aid}/{role}/{eid}", end)
+    # handles all requests to '/metrics' URL path, not found unless help.meter enabled
+    app.add_route("/metrics", MetricsEnd())
 
 
 def setup(name="who", temp=False, tymth=None, isith=None, count=1,
@@ -659,11 +696,11 @@ def setup(name="who", temp=False, tymth=None, isith=None, count=1,
     # make hab
     hab = hby.makeHab(name=name, isith=isith, icount=count)
 
-    # setup wirelog to create test vectors
+    # setup wirelog to create test vectors, in temporary dir when temp
     path = os.path.dirname(__file__)
     path = os.path.join(path, 'logs')
     wl = wiring.WireLog(samed=True, filed=True, name=name, prefix='keri',
-                        reopen=True, headDirPath=path)
+                        temp=temp, reopen=True, headDirPath=path)
     wireDoer = wiring.WireLogDoer(wl=wl)  # setup doer
 
     # client = tcp.Client(host='127.0.0.1', port=remotePort, wl=wl)
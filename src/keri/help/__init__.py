@@ -11,9 +11,10 @@ utility functions
 #  logggers via ogling.ogler.getLoggers(). May always change level and reopen log file
 #  if need be
 
-from hio.help import ogling
+from . import ogling  # facade over hio ogling
 
 #  want help.ogler always defined by default
 ogler = ogling.initOgler(prefix='keri', syslogged=False)  # inits once only on first import
 
 from .helping import nowIso8601, toIso8601, fromIso8601
+from .metering import meter  # disabled by default
@@ -0,0 +1,218 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.help.metering module
+
+Instrumentation of message processing stages. The package global help.meter
+is disabled by default so instrumented code pays only an attribute check.
+When enabled the meter forwards counts, latency observations and gauges to a
+pluggable sink. The default sink is Tally which aggregates in memory and
+renders the Prometheus text exposition format for a metrics endpoint.
+
+Usage:
+
+from keri import help
+
+help.meter.enable()  # aggregate into help.meter.sink Tally
+help.meter.count("keri_parser_msgs_total", "icp")
+print(help.meter.sink.render())
+help.meter.disable()
+
+"""
+import bisect
+import functools
+import threading
+import time
+
+# latency histogram bucket upper bounds in seconds
+Buckets = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+           0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def escape(label):
+    """ Returns label value escaped per the Prometheus text exposition format """
+    return str(label).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Histogram:
+    """
+    Histogram of observed values in cumulative buckets
+
+    Attributes:
+        bounds (tuple): of float bucket upper bounds in increasing order
+        counts (list): of int count per bucket with last for overflow
+        count (int): number of observed values
+        sum (float): sum of observed values
+    """
+    __slots__ = ("bounds", "counts", "count", "sum")
+
+    def __init__(self, bounds=Buckets):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, val):
+        """ Adds val to bucket of least bound not less than val """
+        self.counts[bisect.bisect_left(self.bounds, val)] += 1
+        self.count += 1
+        self.sum += val
+
+
+class Tally:
+    """
+    Tally is the default metrics sink that aggregates in memory. Any other
+    sink must provide the same .count, .observe and .gauge methods.
+
+    Attributes:
+        counters (dict): of number counters keyed by (name, label)
+        histograms (dict): of Histogram keyed by (name, label)
+        gauges (dict): of number last value keyed by (name, label)
+    """
+
+    def __init__(self, bounds=Buckets):
+        """
+        Parameters:
+            bounds (tuple): of float histogram bucket upper bounds
+        """
+        self.bounds = bounds
+        self.counters = dict()
+        self.histograms = dict()
+        self.gauges = dict()
+        self._lock = threading.Lock()  # verification may run in threads
+
+    def count(self, name, label, n):
+        """ Adds n to counter name with label """
+        key = (name, label)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + n
+
+    def observe(self, name, label, val):
+        """ Adds observed val to histogram name with label """
+        key = (name, label)
+        with self._lock:
+            if (histogram := self.histograms.get(key)) is None:
+                histogram = self.histograms[key] = Histogram(bounds=self.bounds)
+            histogram.observe(val)
+
+    def gauge(self, name, label, val):
+        """ Sets gauge name with label to val """
+        with self._lock:
+            self.gauges[(name, label)] = val
+
+    def clear(self):
+        """ Removes all aggregated metrics """
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+            self.gauges.clear()
+
+    def render(self):
+        """ Returns str of aggregated metrics in Prometheus text exposition
+        format with label rendered as kind
+        """
+        lines = []
+        with self._lock:
+            for kind, metrics in (("counter", self.counters), ("gauge", self.gauges)):
+                named = None
+                for (name, label), val in sorted(metrics.items()):
+                    if name != named:
+                        lines.append(f"# TYPE {name} {kind}")
+                        named = name
+                    lines.append(f'{name}{{kind="{escape(label)}"}} {val}')
+
+            named = None
+            for (name, label), histogram in sorted(self.histograms.items()):
+                if name != named:
+                    lines.append(f"# TYPE {name} histogram")
+                    named = name
+                label = escape(label)
+                total = 0
+                for bound, cnt in zip(histogram.bounds, histogram.counts):
+                    total += cnt
+                    lines.append(f'{name}_bucket{{kind="{label}",le="{bound}"}} {total}')
+                lines.append(f'{name}_bucket{{kind="{label}",le="+Inf"}} {histogram.count}')
+                lines.append(f'{name}_sum{{kind="{label}"}} {histogram.sum}')
+                lines.append(f'{name}_count{{kind="{label}"}} {histogram.count}')
+
+        lines.append("")
+        return "\n".join(lines)
+
+
+class Meter:
+    """
+    Meter forwards metrics to its sink when enabled. Hot paths check
+    .enabled before computing labels or reading the clock.
+
+    Attributes:
+        sink (Tally | None): metrics sink. None when disabled
+        enabled (bool): True means metrics are forwarded to .sink
+    """
+
+    def __init__(self, sink=None):
+        """
+        Parameters:
+            sink (Tally | None): metrics sink. None means disabled
+        """
+        self.sink = sink
+        self.enabled = sink is not None
+
+    def enable(self, sink=None):
+        """ Enables forwarding to sink. None means new Tally unless already has sink """
+        if sink is not None or self.sink is None:
+            self.sink = sink if sink is not None else Tally()
+        self.enabled = True
+
+    def disable(self):
+        """ Disables forwarding but keeps .sink """
+        self.enabled = False
+
+    def count(self, name, label="", n=1):
+        """ Adds n to counter name with label when enabled """
+        if self.enabled:
+            self.sink.count(name, label, n)
+
+    def observe(self, name, label, val):
+        """ Adds val to histogram name with label when enabled """
+        if self.enabled:
+            self.sink.observe(name, label, val)
+
+    def gauge(self, name, label, val):
+        """ Sets gauge name with label to val when enabled """
+        if self.enabled:
+            self.sink.gauge(name, label, val)
+
+
+meter = Meter()  # package global disabled until enabled
+
+
+def timed(name, label=None):
+    """ Returns decorator that, when meter is enabled, observes latency of
+    each call in histogram name_seconds and counts exceptions raised by
+    their class name in counter name_errors_total.
+
+    Parameters:
+        name (str): metric name prefix
+        label (Callable | None): returns label from the decorated call args
+    """
+    seconds = f"{name}_seconds"
+    errors = f"{name}_errors_total"
+
+    def decorator(f):
+        @functools.wraps(f)
+        def wrapper(*pa, **kwa):
+            if not meter.enabled:
+                return f(*pa, **kwa)
+            kind = label(*pa, **kwa) if label is not None else ""
+            start = time.perf_counter()
+            try:
+                return f(*pa, **kwa)
+            except Exception as ex:
+                meter.count(errors, ex.__class__.__name__)
+                raise
+            finally:
+                meter.observe(seconds, kind, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,113 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.help.ogling module
+
+Logging facade over hio ogling. Provides lazy renderings to pass as logger
+arguments so expensive renderings such as pretty serders, ked dumps and
+byte previews of message streams are only computed when a record is
+actually emitted, and a structured log mode that emits records as JSON
+lines.
+
+Usage:
+
+logger.info("Kevery process: accepted event=\\n%s\\n", ogling.pretty(serder))
+
+"""
+import json
+import logging
+
+from hio.help.ogling import Ogler, initOgler, openOgler  # re-exported
+
+
+class Lazy:
+    """
+    Lazy defers rendering of a logger argument until the record is
+    formatted for emission. Rendered once and then memoized.
+
+    Attributes:
+        func (Callable): returns rendering from .args
+        args (tuple): arguments of .func
+    """
+    __slots__ = ("func", "args", "_rendered")
+
+    def __init__(self, func, *args):
+        self.func = func
+        self.args = args
+        self._rendered = None
+
+    def __str__(self):
+        if self._rendered is None:
+            self._rendered = str(self.func(*self.args))
+        return self._rendered
+
+    __repr__ = __str__
+
+
+def _pretty(serder, size):
+    return serder.pretty(size=size)
+
+
+def pretty(serder, size=None):
+    """ Returns Lazy of serder.pretty(size=size) """
+    return Lazy(_pretty, serder, size)
+
+
+def _dumps(ked):
+    return json.dumps(ked, indent=1)
+
+
+def dumps(ked):
+    """ Returns Lazy of json.dumps(ked, indent=1) """
+    return Lazy(_dumps, ked)
+
+
+def _preview(ims, size):
+    return bytes(ims[:size])
+
+
+def preview(ims, size=1024):
+    """ Returns Lazy of bytes of first size bytes of stream ims """
+    return Lazy(_preview, ims, size)
+
+
+# LogRecord attributes that are not user supplied extra fields
+RecordAttributes = frozenset(logging.makeLogRecord({}).__dict__) | {"message", "asctime"}
+
+
+class StructuredFormatter(logging.Formatter):
+    """
+    StructuredFormatter formats each record as one JSON object line with
+    time, level, logger name and message plus any extra fields given to the
+    logger call with extra=dict(...). Lazy values render when emitted.
+    """
+
+    def format(self, record):
+        fields = dict(time=self.formatTime(record),
+                      level=record.levelname,
+                      name=record.name,
+                      msg=record.getMessage())
+        for key, val in record.__dict__.items():
+            if key not in RecordAttributes:
+                fields[key] = val
+        if record.exc_info:
+            fields["exc"] = self.formatException(record.exc_info)
+        return json.dumps(fields, default=str)
+
+
+def structure(ogler, structured=True):
+    """ Switches handlers of ogler to structured JSON lines or back to plain
+
+    Parameters:
+        ogler (Ogler): logger factory such as help.ogler
+        structured (bool): True means emit JSON lines. False means plain
+    """
+    if structured:
+        formatter = StructuredFormatter()
+    else:
+        formatter = logging.Formatter(f"{ogler.prefix}: %(message)s")  # hio Ogler base format
+
+    ogler.baseFormatter = formatter
+    for name in ("baseConsoleHandler", "baseSysLogHandler", "baseFileHandler"):
+        if (handler := getattr(ogler, name, None)) is not None:
+            handler.setFormatter(formatter)
@@ -200,7 +200,9 @@ def smell(raw):
     if len(raw) < SMELLSIZE:
         raise ShortageError(f"Need more raw bytes to smell full version string.")
 
-    match = Rever.search(raw)  # Rever regex takes bytes/bytearray not str
+    # only search front of raw since version string must start within
+    # MAXVSOFFSET so do not scan rest of stream when raw is a large stream
+    match = Rever.search(raw[:SMELLSIZE])  # Rever regex takes bytes/bytearray not str
     if not match or match.start() > MAXVSOFFSET:
         raise VersionError(f"Invalid version string from smelled raw = "
                            f"{raw[: SMELLSIZE]}.")
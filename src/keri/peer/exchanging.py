@@ -11,7 +11,7 @@ from hio.help import decking
 from .. import help, kering
 from ..app import habbing
 from ..core import eventing, coring, serdering
-from ..help import helping
+from ..help import helping, metering, ogling
 from ..kering import ValidationError, MissingSignatureError
 
 ExchangeMessageTimeWindow = timedelta(seconds=300)
@@ -54,6 +54,14 @@ class Exchanger:
 
         self.routes[handler.resource] = handler
 
+    def _resourceOf(self, serder):
+        """ Returns resource of registered handler of exn serder route or
+        unknown. Bounds metric labels since the route is sender controlled.
+        """
+        route = serder.ked.get("r")
+        return self.routes[route].resource if route in self.routes else "unknown"
+
+    @metering.timed("keri_exchanger_event", label=lambda self, serder, *pa, **kwa: self._resourceOf(serder))
     def processEvent(self, serder, tsgs=None, cigars=None, **kwargs):
         """ Process one serder event with attached indexed signatures representing a Peer to Peer exchange message.
 
@@ -87,7 +95,8 @@ class Exchanger:
 
                 # Verify the signatures are valid and that the signature threshold as of the signing event is met
                 tholder, verfers = self.hby.db.resolveVerifiers(pre=prefixer.qb64, sn=seqner.sn, dig=ssaider.qb64)
-                _, indices = eventing.verifySigs(serder.raw, sigers, verfers)
+                _, indices = eventing.verifySigs(serder.raw, sigers, verfers,
+                                                tholder=tholder)
 
                 if not tholder.satisfy(indices):  # We still don't have all the sigers, need to escrow
                     if self.escrowPSEvent(serder=serder, tsgs=tsgs, pathed=pathed):
@@ -121,11 +130,11 @@ class Exchanger:
         # Perform behavior specific verification, think IPEX chaining requirements
         try:
             if not behavior.verify(serder=serder, attachments=attachments):
-                logger.info(f"exn event for route {route} failed behavior verfication.  exn={serder.ked}")
+                logger.info("exn event for route %s failed behavior verfication.  exn=%s", route, serder.ked)
                 return
 
         except AttributeError:
-            logger.info(f"Behavior for {route} missing or does not have verify for exn={serder.ked}")
+            logger.info("Behavior for %s missing or does not have verify for exn=%s", route, serder.ked)
 
         # Always persis events
         self.logEvent(serder, pathed, tsgs, cigars)
@@ -135,7 +144,7 @@ class Exchanger:
         try:
             behavior.handle(serder=serder, attachments=attachments)
         except AttributeError:
-            logger.info(f"Behavior for {route} missing or does not have handle for exn={serder.ked}")
+            logger.info("Behavior for %s missing or does not have handle for exn=%s", route, serder.ked)
 
     def processEscrow(self):
         """ Process all escrows for `exn` messages
@@ -204,7 +213,7 @@ class Exchanger:
                 self.hby.db.epse.rem(dig)
                 self.hby.db.esigs.rem(dig)
                 logger.info("Exchanger unescrow succeeded in valid exchange: "
-                            "creder=\n%s\n", serder.pretty())
+                            "creder=\n%s\n", ogling.pretty(serder))
 
     def logEvent(self, serder, pathed=None, tsgs=None, cigars=None):
         dig = serder.said
@@ -476,7 +485,8 @@ def verify(hby, serder):
 
         # Verify the signatures are valid and that the signature threshold as of the signing event is met
         tholder, verfers = hby.db.resolveVerifiers(pre=prefixer.qb64, sn=seqner.sn, dig=ssaider.qb64)
-        _, indices = eventing.verifySigs(serder.raw, sigers, verfers)
+        _, indices = eventing.verifySigs(serder.raw, sigers, verfers,
+                                        tholder=tholder)
 
         if not tholder.satisfy(indices):  # We still don't have all the sigers, need to escrow
             raise MissingSignatureError(f"Not enough signatures in  {indices}"
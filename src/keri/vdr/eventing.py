@@ -6,7 +6,6 @@ keri.vdr.eventing module
 VC TEL  support
 """
 
-import json
 import logging
 from dataclasses import asdict
 from math import ceil
@@ -23,7 +22,7 @@ from ..core.coring import (MtrDex, Serials, versify, Prefixer,
 from ..core.eventing import SealEvent, ample, TraitDex, verifySigs
 from ..db import basing, dbing
 from ..db.dbing import dgKey, snKey
-from ..help import helping
+from ..help import helping, ogling
 from ..kering import (MissingWitnessSignatureError, Version,
                       MissingAnchorError, ValidationError, OutOfOrderError, LikelyDuplicitousError)
 from ..vdr import viring
@@ -1173,7 +1172,8 @@ class Tever:
             raise ValidationError("Unsupported ilk = {} for evt = {}.".format(ilk, ked))
 
     def vcState(self, vci):
-        """ Calculate state (issued/revoked) of VC from db.
+        """ Returns state (issued/revoked) of VC from materialized state in db
+        updated by .logEvent. Falls back to walking the TEL when not materialized.
 
         Returns None if never issued from this Registry
 
@@ -1181,7 +1181,23 @@ class Tever:
           vci (str):  qb64 VC identifier
 
         Returns:
-            status (Serder): transaction event state notification message
+            status (VcStateRecord): transaction event state notification record
+        """
+        if (state := self.reger.vcsts.get(keys=vci)) is not None:
+            return state if state.ri == self.prefixer.qb64 else None
+
+        return self.walkVcState(vci)
+
+    def walkVcState(self, vci):
+        """ Calculate state (issued/revoked) of VC from db by walking its TEL.
+
+        Returns None if never issued from this Registry
+
+        Parameters:
+          vci (str):  qb64 VC identifier
+
+        Returns:
+            status (VcStateRecord): transaction event state notification record
         """
         digs = []
         for _, dig in self.reger.getTelItemPreIter(pre=vci.encode("utf-8")):
@@ -1256,17 +1272,33 @@ class Tever:
         dig = serder.saidb
         key = dgKey(pre, dig)
         sealet = seqner.qb64b + saider.qb64b
-        self.reger.putAnc(key, sealet)
-        if bigers:
-            self.reger.putTibs(key, [biger.qb64b for biger in bigers])
-        if baks:
-            self.reger.delBaks(key)
-            self.reger.putBaks(key, [bak.encode("utf-8") for bak in baks])
-        self.reger.tets.pin(keys=(pre.decode("utf-8"), dig.decode("utf-8")), val=coring.Dater())
-        self.reger.putTvt(key, serder.raw)
-        self.reger.putTel(snKey(pre, sn), dig)
+        # commit event, its indexes and credential state atomically
+        with self.reger.trans():
+            self.reger.putAnc(key, sealet)
+            if bigers:
+                self.reger.putTibs(key, [biger.qb64b for biger in bigers])
+            if baks:
+                self.reger.delBaks(key)
+                self.reger.putBaks(key, [bak.encode("utf-8") for bak in baks])
+            self.reger.tets.pin(keys=(pre.decode("utf-8"), dig.decode("utf-8")), val=coring.Dater())
+            self.reger.putTvt(key, serder.raw)
+            self.reger.putTel(snKey(pre, sn), dig)
+            if serder.ilk in (Ilks.iss, Ilks.bis, Ilks.rev, Ilks.brv):  # credential status
+                self.reger.indexStatus(regk=self.prefixer.qb64, vci=serder.pre, ilk=serder.ilk)
+                state = self.reger.vcsts.get(keys=serder.pre)
+                if state is None or int(state.s, 16) <= sn:  # never regress state
+                    ra = dict() if self.noBackers else serder.ked["ra"]
+                    self.reger.vcsts.pin(keys=serder.pre,
+                                         val=vcstate(vcpre=serder.pre,
+                                                     said=serder.said,
+                                                     sn=sn,
+                                                     ri=self.prefixer.qb64,
+                                                     dts=serder.ked['dt'],
+                                                     eilk=serder.ilk,
+                                                     ra=ra,
+                                                     a=dict(s=seqner.sn, d=saider.qb64)))
         logger.info("Tever state: %s Added to TEL valid event=\n%s\n",
-                    pre, json.dumps(serder.ked, indent=1))
+                    pre, ogling.dumps(serder.ked))
 
     def valAnchorBigs(self, serder, seqner, saider, bigers, toad, baks):
         """ Validate anchor and backer signatures (bigers) when provided.
@@ -1661,7 +1693,7 @@ class Tevery:
                 self.cues.push(dict(kin="reply", route="/tsn/registry", data=asdict(tsn), dest=source))
 
                 if vcpre := qry["i"]:
-                    tsn = tever.vcState(vcpre=vcpre)
+                    tsn = tever.vcState(vci=vcpre)
                     self.cues.push(dict(kin="reply", route="/tsn/credential", data=asdict(tsn), dest=source))
 
         else:
@@ -2095,7 +2127,7 @@ class Tevery:
                 # valid event escrow.
                 self.reger.delOot(snKey(pre, sn))  # removes from escrow
                 logger.info("Tevery unescrow succeeded in valid event: "
-                            "event=\n%s\n", json.dumps(tserder.ked, indent=1))
+                            "event=\n%s\n", ogling.dumps(tserder.ked))
 
     def processEscrowAnchorless(self):
         """ Process escrow of TEL events received before the anchoring KEL event.
@@ -2162,4 +2194,4 @@ class Tevery:
                 # valid event escrow.
                 self.reger.delTae(snKey(pre, sn))  # removes from escrow
                 logger.info("Tevery unescrow succeeded in valid event: "
-                            "event=\n%s\n", json.dumps(tserder.ked, indent=1))
+                            "event=\n%s\n", ogling.dumps(tserder.ked))
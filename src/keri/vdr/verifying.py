@@ -127,13 +127,13 @@ class Verifier:
             # raise kering.InvalidCredentialStateError("..."))
 
         # Verify the credential against the schema
-        scraw = self.resolver.resolve(schema)
-        if not scraw:
+        schemer = self.resolver.schemer(schema)
+        if schemer is None:
             if self.escrowMSE(creder, prefixer, seqner, saider):
                 self.cues.append(dict(kin="query", q=dict(r="schema", said=schema)))
             raise kering.MissingSchemaError("schema {} not in cache".format(schema))
 
-        schemer = scheming.Schemer(raw=scraw)
+        schemer.typ.resolver = self.resolver  # compiled once per schema SAID
         try:
             schemer.verify(creder.raw)
         except kering.ValidationError as ex:
@@ -304,6 +304,8 @@ class Verifier:
             subject = creder.attrib["i"].encode("utf-8")
             self.reger.subjs.add(keys=subject, val=saider)
 
+        self.reger.indexCred(creder)
+
     def query(self, pre, regk, vcid, *, dt=None, dta=None, dtb=None, **kwa):
         """ Returns query message for querying registry
         """
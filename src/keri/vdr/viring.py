@@ -299,14 +299,14 @@ class Reger(dbing.LMDBer):
         # Names end with "." as sub DB name must include a non Base64 character
         # to avoid namespace collisions with Base64 identifier prefixes.
 
-        self.tvts = self.env.open_db(key=b'tvts.')
-        self.tels = self.env.open_db(key=b'tels.')
-        self.ancs = self.env.open_db(key=b'ancs.')
-        self.tibs = self.env.open_db(key=b'tibs.', dupsort=True)
-        self.baks = self.env.open_db(key=b'baks.', dupsort=True)
-        self.oots = self.env.open_db(key=b'oots.')
-        self.twes = self.env.open_db(key=b'twes.')
-        self.taes = self.env.open_db(key=b'taes.')
+        self.tvts = self.openDB(key=b'tvts.')
+        self.tels = self.openDB(key=b'tels.')
+        self.ancs = self.openDB(key=b'ancs.')
+        self.tibs = self.openDB(key=b'tibs.', dupsort=True)
+        self.baks = self.openDB(key=b'baks.', dupsort=True)
+        self.oots = self.openDB(key=b'oots.')
+        self.twes = self.openDB(key=b'twes.')
+        self.taes = self.openDB(key=b'taes.')
         self.tets = subing.CesrSuber(db=self, subkey='tets.', klas=coring.Dater)
 
         # Registry state made of RegStateRecord.
@@ -345,6 +345,24 @@ class Reger(dbing.LMDBer):
         # Index of credentials by schema
         self.schms = subing.CesrDupSuber(db=self, subkey='schms.', klas=coring.Saider)
 
+        # Composite query indexes of credentials. Credential SAID is last key
+        # part so prefix range scans give credentials in SAID order with the
+        # remainder of the key as pagination cursor
+        # (issuer, schema, said) to credential Saider
+        self.iscs = subing.CesrSuber(db=self, subkey='iscs.', klas=coring.Saider)
+        # (subject, schema, said) to credential Saider
+        self.sscs = subing.CesrSuber(db=self, subkey='sscs.', klas=coring.Saider)
+        # (registry, status, said) to credential Saider where status is iss or rev
+        self.rscs = subing.CesrSuber(db=self, subkey='rscs.', klas=coring.Saider)
+        # said to status iss or rev of credential for status filtering
+        self.vcss = subing.Suber(db=self, subkey='vcss.')
+
+        # Credential state made of VcStateRecord materialized on each TEL event
+        # of the credential keyed by credential SAID
+        self.vcsts = koming.Komer(db=self,
+                                  schema=VcStateRecord,
+                                  subkey='vcsts.')
+
         # Missing reegistry escrow
         self.mre = subing.CesrSuber(db=self, subkey='mre.', klas=coring.Dater)
         # Broken chain escrow
@@ -382,80 +400,284 @@ class Reger(dbing.LMDBer):
         # Completed Credentials
         self.ccrd = subing.SerderSuber(db=self, subkey="ccrd.", klas=serdering.SerderACDC)
 
+        if (not self.readonly and next(self.iscs.getItemIter(), None) is None
+                and next(self.saved.getItemIter(), None) is not None):
+            self.reindexCreds()
+
         return self.env
 
-    def cloneCreds(self, saids, db):
+    def cloneCreds(self, saids, db, memo=None):
         """ Returns fully expanded credential with chained credentials attached.
 
         Parameters:
            saids (list): of Saider objects:
            db (Baser): baser object to load schema
+           memo (dict | None): expanded credentials keyed by SAID shared
+               across calls. Default is new memo per call.
 
         Returns:
             list: fully hydrated credentials with full chains provided
 
         """
-        creds = []
+        return list(self.cloneCredIter(saids, db, memo=memo))
+
+    def cloneCredIter(self, saids, db, memo=None):
+        """ Generator of fully expanded credentials with chained credentials
+        attached. Each credential or schema shared by several chains is only
+        expanded once so expansion is linear in the number of distinct
+        credentials. Shared chain credentials are the same dict instance.
+
+        Parameters:
+           saids (Iterable): of Saider objects:
+           db (Baser): baser object to load schema
+           memo (dict | None): expanded credentials keyed by SAID shared
+               across calls. Default is new memo per call.
+
+        Yields:
+            dict: fully hydrated credential with full chains provided
+
+        """
+        memo = memo if memo is not None else dict()
+        schemas = dict()
         for saider in saids:
-            key = saider.qb64
-            creder, prefixer, seqner, asaider = self.cloneCred(said=key)
-            atc = bytearray(signing.serialize(creder, prefixer, seqner, saider))
-            del atc[0:creder.size]
+            yield self._expandCred(saider.qb64, db, memo, schemas)
 
-            iss = bytearray(self.cloneTvtAt(creder.said))
-            iserder = serdering.SerderKERI(raw=iss)
-            issatc = bytes(iss[iserder.size:])
+    def _expandCred(self, said, db, memo, schemas):
+        """ Returns fully expanded credential for said from memo or by
+        expanding it and its edge chains recursively into memo.
 
-            del iss[0:iserder.size]
+        Parameters:
+           said (str): qb64 SAID of credential
+           db (Baser): baser object to load schema
+           memo (dict): expanded credentials keyed by SAID
+           schemas (dict): schema seds keyed by schema SAID
 
-            chainSaids = []
-            for k, p in (creder.edge.items() if creder.edge is not None else {}):
-                if k == "d":
-                    continue
+        """
+        if (cred := memo.get(said)) is not None:
+            return cred
 
-                if not isinstance(p, dict):
-                    continue
+        creder, prefixer, seqner, asaider = self.cloneCred(said=said)
+        atc = bytearray(signing.serialize(creder, prefixer, seqner, coring.Saider(qb64=said)))
+        del atc[0:creder.size]
+
+        iss = bytearray(self.cloneTvtAt(creder.said))
+        iserder = serdering.SerderKERI(raw=iss)
+        issatc = bytes(iss[iserder.size:])
+
+        del iss[0:iserder.size]
 
-                chainSaids.append(coring.Saider(qb64=p["n"]))
-            chains = self.cloneCreds(chainSaids, db)
-
-            regk = creder.regi
-            status = self.tevers[regk].vcState(saider.qb64)
-            schemer = db.schema.get(creder.schema)
-
-            cred = dict(
-                sad=creder.sad,
-                atc=atc.decode("utf-8"),
-                iss=iserder.sad,
-                issatc=issatc.decode("utf-8"),
-                pre=creder.issuer,
-                schema=schemer.sed,
-                chains=chains,
-                status=asdict(status),
-                anchor=dict(
-                    pre=prefixer.qb64,
-                    sn=seqner.sn,
-                    d=asaider.qb64
-                )
+        chains = []
+        for k, p in (creder.edge.items() if creder.edge is not None else {}):
+            if k == "d":
+                continue
+
+            if not isinstance(p, dict):
+                continue
+
+            chains.append(self._expandCred(p["n"], db, memo, schemas))
+
+        regk = creder.regi
+        status = self.tevers[regk].vcState(said)
+        if (schema := schemas.get(creder.schema)) is None:
+            schema = schemas[creder.schema] = db.schema.get(creder.schema).sed
+
+        cred = dict(
+            sad=creder.sad,
+            atc=atc.decode("utf-8"),
+            iss=iserder.sad,
+            issatc=issatc.decode("utf-8"),
+            pre=creder.issuer,
+            schema=schema,
+            chains=chains,
+            status=asdict(status),
+            anchor=dict(
+                pre=prefixer.qb64,
+                sn=seqner.sn,
+                d=asaider.qb64
             )
+        )
 
+        ctr = coring.Counter(qb64b=iss, strip=True)
+        if ctr.code == coring.CtrDex.AttachmentGroup:
             ctr = coring.Counter(qb64b=iss, strip=True)
-            if ctr.code == coring.CtrDex.AttachmentGroup:
-                ctr = coring.Counter(qb64b=iss, strip=True)
 
-            if ctr.code == coring.CtrDex.SealSourceCouples:
-                coring.Seqner(qb64b=iss, strip=True)
-                saider = coring.Saider(qb64b=iss)
+        if ctr.code == coring.CtrDex.SealSourceCouples:
+            coring.Seqner(qb64b=iss, strip=True)
+            saider = coring.Saider(qb64b=iss)
 
-                anc = db.cloneEvtMsg(pre=creder.issuer, fn=0, dig=saider.qb64b)
-                aserder = serdering.SerderKERI(raw=anc)
-                ancatc = bytes(anc[aserder.size:])
-                cred['anc'] = aserder.sad
-                cred['ancatc'] = ancatc.decode("utf-8"),
+            anc = db.cloneEvtMsg(pre=creder.issuer, fn=0, dig=saider.qb64b)
+            aserder = serdering.SerderKERI(raw=anc)
+            ancatc = bytes(anc[aserder.size:])
+            cred['anc'] = aserder.sad
+            cred['ancatc'] = ancatc.decode("utf-8"),
+
+        memo[said] = cred
+        return cred
+
+    def indexCred(self, creder):
+        """ Add credential to composite query indexes by issuer and schema and
+        by subject and schema
+
+        Parameters:
+            creder (SerderACDC): credential to index
+
+        """
+        saider = coring.Saider(qb64=creder.said)
+        self.iscs.pin(keys=(creder.issuer, creder.schema, creder.said), val=saider)
+        if not isinstance(creder.attrib, str) and 'i' in creder.attrib:
+            self.sscs.pin(keys=(creder.attrib["i"], creder.schema, creder.said), val=saider)
+
+    def indexStatus(self, regk, vci, ilk):
+        """ Update composite registry status query index for credential vci
+        given ilk of its latest TEL event
+
+        Parameters:
+            regk (str): qb64 registry identifier
+            vci (str): qb64 SAID of credential
+            ilk (str): TEL event ilk one of iss, bis, rev, brv
+
+        """
+        status = coring.Ilks.rev if ilk in (coring.Ilks.rev, coring.Ilks.brv) else coring.Ilks.iss
+        if (prior := self.vcss.get(keys=vci)) is not None and prior != status:
+            self.rscs.rem(keys=(regk, prior, vci))
+        self.rscs.pin(keys=(regk, status, vci), val=coring.Saider(qb64=vci))
+        self.vcss.pin(keys=vci, val=status)
 
-            creds.append(cred)
+    def rebuildVcStates(self):
+        """ Rebuilds materialized credential states .vcsts by walking the TEL of
+        every saved credential. Used to populate states of database created
+        before states were materialized.
 
-        return creds
+        """
+        for (said,), _ in self.saved.getItemIter():
+            if (creder := self.creds.get(keys=said)) is None:
+                continue
+            if (regk := creder.regi) is None or regk not in self.tevers:
+                continue
+            if (state := self.tevers[regk].walkVcState(said)) is not None:
+                self.vcsts.pin(keys=said, val=state)
+
+    def _scanIdx(self, suber, keys, last=""):
+        """ Returns iterator of (cursor, said) over branch of index suber given
+        by keys starting after cursor last. Cursor is remainder of index key
+        after branch keys.
+
+        Parameters:
+            suber (Suber): index sub db whose key ends with credential SAID
+            keys (tuple): of str top branch keys
+            last (str): cursor of last item seen. Empty means start of branch
+
+        """
+        top = suber.tokey(keys + ("",))
+        start = top + last.encode("utf-8")
+        with self.readTrans(db=suber.sdb) as txn:
+            cursor = txn.cursor()
+            if not cursor.set_range(start):
+                return
+            for ckey in cursor.iternext(keys=True, values=False):
+                ckey = bytes(ckey)
+                if not ckey.startswith(top):
+                    break
+                if last and ckey == start:
+                    continue
+                yield (ckey[len(top):].decode("utf-8"),
+                       ckey.rsplit(suber.sep.encode("utf-8"), 1)[-1].decode("utf-8"))
+
+    def getCredSaidIter(self, *, issuer=None, subject=None, schema=None,
+                        regk=None, status=None, last=""):
+        """ Returns iterator of (cursor, Saider) of credentials matching all
+        the provided query terms without loading the credentials. Items are
+        ordered by index key so pass cursor of last item seen as last to
+        resume with the next page.
+
+        Scans the issuer, subject or registry index in that order of
+        preference. Remaining terms are checked with point lookups.
+
+        Parameters:
+            issuer (str | None): qb64 AID of issuer
+            subject (str | None): qb64 AID of subject (issuee)
+            schema (str | None): qb64 SAID of schema
+            regk (str | None): qb64 registry identifier
+            status (str | None): iss for issued or rev for revoked
+            last (str): cursor of last item seen. Empty means from start
+
+        """
+        if issuer is not None:
+            suber = self.iscs
+            keys = (issuer,) if schema is None else (issuer, schema)
+        elif subject is not None:
+            suber = self.sscs
+            keys = (subject,) if schema is None else (subject, schema)
+        elif regk is not None:
+            suber = self.rscs
+            keys = (regk,) if status is None else (regk, status)
+        else:
+            raise ValueError("Credential query requires issuer, subject or regk.")
+
+        for cursor, said in self._scanIdx(suber, keys, last=last):
+            if not self._matchCred(said, suber, issuer=issuer, subject=subject,
+                                   schema=schema, regk=regk, status=status):
+                continue
+            yield cursor, coring.Saider(qb64=said)
+
+    def _matchCred(self, said, suber, *, issuer, subject, schema, regk, status):
+        """ Returns True if credential said matches query terms not already
+        satisfied by scan of index suber
+        """
+        if status is not None and (suber is not self.rscs or regk is None):
+            if self.vcss.get(keys=said) != status:
+                return False
+
+        if suber is self.iscs:
+            if subject is not None or regk is not None:
+                creder = self.creds.get(keys=said)
+                if subject is not None and (isinstance(creder.attrib, str) or
+                                            creder.attrib.get("i") != subject):
+                    return False
+                if regk is not None and creder.regi != regk:
+                    return False
+
+        elif suber is self.sscs:
+            if regk is not None:
+                creder = self.creds.get(keys=said)
+                if creder.regi != regk:
+                    return False
+
+        elif schema is not None:  # registry scan
+            creder = self.creds.get(keys=said)
+            if creder.schema != schema:
+                return False
+
+        return True
+
+    def cntCreds(self, **kwa):
+        """ Returns count of credentials matching query terms
+
+        Parameters:
+            kwa (dict): query terms of .getCredSaidIter
+
+        """
+        return sum(1 for _ in self.getCredSaidIter(**kwa))
+
+    def reindexCreds(self):
+        """ Rebuilds composite credential query indexes from saved credentials
+        and their TELs. Used to populate indexes of database created before
+        indexes existed. Called by .reopen when .iscs is empty but .saved is
+        not so existing wallets answer queries without running migrate first.
+
+        """
+        saids = [said for (said,), _ in self.saved.getItemIter()]
+        with self.trans():
+            for said in saids:
+                if (creder := self.creds.get(keys=said)) is None:
+                    continue
+                self.indexCred(creder)
+                digs = [dig for _, dig in self.getTelItemPreIter(pre=said.encode("utf-8"))]
+                if not digs:
+                    continue
+                raw = self.getTvt(key=dbing.dgKey(said, bytes(digs[-1])))
+                serder = serdering.SerderKERI(raw=bytes(raw))
+                self.indexStatus(regk=creder.regi, vci=said, ilk=serder.ilk)
 
     def logCred(self, creder, prefixer, seqner, saider):
         """ Save the base credential and seals (est evt+sigs quad) with no indices.
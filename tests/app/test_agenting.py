@@ -5,6 +5,7 @@ tests.app.agenting module
 """
 import time
 
+import pytest
 from hio.base import doing, tyming
 
 from keri import kering
@@ -239,3 +240,126 @@ def test_witness_inquisitor(mockHelpingNowUTC, seeder):
 
         assert palHab.pre in qinHab.kevers
         assert qinHab.pre in palHab.kevers
+
+
+def test_receiptor_client_pool():
+    class Connector:
+        cutoff = False
+
+    class Client:
+        connector = Connector()
+
+    with habbing.openHby(name="pal", salt=coring.Salter(raw=b'0123456789abcdef').qb64) as palHby:
+        receiptor = agenting.Receiptor(hby=palHby)
+        wit = "BBilc4-L3tFUnfM_wJr4S4OJanAv_VmF_dJNN6vkf2Ha"
+        client, clientDoer = Client(), doing.Doer()
+
+        receiptor.release(wit, client, clientDoer)
+        assert receiptor.clients[wit] == (client, clientDoer)
+
+        # idle client reused while connected
+        assert receiptor.acquire(hab=None, wit=wit) == (client, clientDoer)
+        assert wit not in receiptor.clients
+
+        # only one idle client kept per witness
+        receiptor.release(wit, client, clientDoer)
+        receiptor.release(wit, Client(), doing.Doer())
+        assert receiptor.clients[wit] == (client, clientDoer)
+
+
+class WitnessConnector:
+    cutoff = False
+
+
+class WitnessResponse:
+    def __init__(self, body=b'', status=200):
+        self.status = status
+        self.body = body
+
+
+class WitnessClient:
+    """ Stands in for hio http Client of a witness. Queued responses are
+    consumed as requests complete
+    """
+
+    def __init__(self):
+        self.connector = WitnessConnector()
+        self.requests = []
+        self.responses = []
+
+    def request(self, method, path, headers, body):
+        self.requests.append(path)
+
+    def respond(self):
+        return self.responses.pop(0)
+
+
+def test_receiptor_fan_out():
+    with habbing.openHby(name="wit", salt=coring.Salter(raw=b'0123456789ghijkl').qb64) as witHby, \
+            habbing.openHby(name="pal", salt=coring.Salter(raw=b'0123456789abcdef').qb64) as palHby:
+        witHabs = [witHby.makeHab(name=name, transferable=False) for name in ("wan", "wil", "wes")]
+        wan, wil, wes = [witHab.pre for witHab in witHabs]
+        palHab = palHby.makeHab(name="pal", wits=[wan, wil, wes], toad=2)
+
+        receiptor = agenting.Receiptor(hby=palHby)
+        clients = dict()
+        for witHab in witHabs:
+            clients[witHab.pre] = WitnessClient()
+            receiptor.release(witHab.pre, clients[witHab.pre], doing.Doer())
+
+        doist = doing.Doist(limit=1.0, tock=0.03125, real=False)
+        deeds = doist.enter(doers=[receiptor])
+
+        def respond(witHab, serder):
+            client = clients[witHab.pre]
+            client.responses.append(WitnessResponse(body=witHab.receipt(serder)))
+            client.responses.append(WitnessResponse())  # ack of propagated receipts
+
+        # submits to all witnesses at once
+        serder = palHab.kever.serder
+        receipting = receiptor.receipt(palHab.pre, sn=0)
+        next(receipting)
+        assert [clients[wit].requests for wit in (wan, wil, wes)] == [["/receipts"]] * 3
+
+        # returns once toad receipts are gathered and propagated
+        respond(witHabs[0], serder)
+        respond(witHabs[1], serder)
+        with pytest.raises(StopIteration) as ex:
+            while True:
+                next(receipting)
+        assert set(ex.value.value) == {wan, wil}
+        assert clients[wan].requests == ["/receipts", "/"]
+        assert clients[wil].requests == ["/receipts", "/"]
+        assert clients[wes].requests == ["/receipts"]
+        assert receiptor.straggling == 1
+
+        # late witness finished in background and waited on with settle
+        settling = receiptor.settle()
+        next(settling)
+        respond(witHabs[2], serder)
+        respond(witHabs[0], serder)  # acks of late receipt shared with others
+        respond(witHabs[1], serder)
+        for _ in range(4):
+            doist.recur(deeds=deeds)
+
+        assert receiptor.straggling == 0
+        with pytest.raises(StopIteration):
+            next(settling)
+        assert clients[wes].requests == ["/receipts", "/"]
+        assert clients[wan].requests == ["/receipts", "/", "/"]
+        assert set(receiptor.clients) == {wan, wil, wes}  # released for reuse
+
+        # each witness times out on its own
+        receiptor.Timeout = 0.0
+        palHab.interact()
+        serder = palHab.kever.serder
+        clients[wan].responses.append(WitnessResponse(body=witHabs[0].receipt(serder)))
+        receipting = receiptor.receipt(palHab.pre, sn=1)
+        with pytest.raises(StopIteration) as ex:
+            while True:
+                next(receipting)
+        assert list(ex.value.value) == [wan]
+        assert receiptor.straggling == 0
+        assert set(receiptor.clients) == {wan}  # timed out clients closed
+
+        doist.exit(deeds=deeds)
@@ -155,6 +155,48 @@ def test_organizer():
             org.find(field="company", val="GLEIF")
 
 
+def test_organizer_search():
+    """ Test indexed substring search of contact fields """
+    joe = "EtyPSuUjLyLdXAtGMrsTt0-ELyWeU8fJcymHiGOfuaSA"
+    bob = "EuEQX8At31X96iDVpigv-rTdOKvFiWFunbJ1aDfq89IQ"
+    ken = "EFC7f_MEPE5dboc_E4yG15fnpMD34YaU3ue6vnDLodJU"
+
+    with habbing.openHby(name="test", temp=True) as hby:
+        org = connecting.Organizer(hby=hby)
+
+        org.replace(pre=joe, data=dict(alias="joe", address="9934 Glen Creek St.", company="HCF"))
+        org.replace(pre=bob, data=dict(alias="bob", address="37 East Shadow Brook St.", company="HCF"))
+        org.replace(pre=ken, data=dict(alias="ken", address="28 Williams Ave.", company="GLEIF"))
+
+        assert [d["id"] for d in org.find(field="address", val="creek")] == [joe]
+        assert [d["id"] for d in org.find(field="address", val="REEK")] == [joe]  # infix of token
+        assert [d["id"] for d in org.find(field="address", val="n creek")] == [joe]  # spans tokens
+        assert {d["id"] for d in org.find(field="address", val="St.")} == {joe, bob}  # regex scan
+        assert {d["id"] for d in org.find(field="address", val="b.*st")} == {bob}
+        assert org.find(field="alias", val="creek") == []
+        assert org.find(field="address", val="brook east") == []
+
+        assert org.values(field="company") == ["GLEIF", "HCF"]
+        assert org.values(field="company", val="hc") == ["HCF"]
+
+        # indexes follow updates, unsets and removals
+        org.set(pre=joe, field="address", val="1 Main St.")
+        assert org.find(field="address", val="creek") == []
+        assert [d["id"] for d in org.find(field="address", val="main")] == [joe]
+        org.unset(pre=bob, field="company")
+        assert [d["id"] for d in org.find(field="company", val="hcf")] == [joe]
+        org.rem(pre=ken)
+        assert org.values(field="company") == ["HCF"]
+        assert org.find(field="alias", val="ken") == []
+
+        # indexes rebuilt from contact fields when missing
+        hby.db.cfvs.trim()
+        hby.db.ctks.trim()
+        org = connecting.Organizer(hby=hby)
+        assert [d["id"] for d in org.find(field="address", val="shadow")] == [bob]
+        assert org.values(field="alias") == ["bob", "joe"]
+
+
 def test_organizer_imgs():
 
     with habbing.openHab(name="test", transferable=True, temp=True) as (hby, hab):
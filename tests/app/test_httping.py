@@ -8,8 +8,9 @@ import falcon
 import pytest
 from falcon.testing import helpers
 
+from keri import kering
 from keri.app import habbing, httping
-from keri.core import coring, serdering
+from keri.core import coring, eventing, serdering
 from keri.vdr import credentialing, verifying
 
 
@@ -195,5 +196,32 @@ def test_stream_cesr_request(mockHelpingNowUTC):
                                               b'jIu5ZwJILbL2bcID')
 
 
+def test_frame_cesr_stream():
+    """ Test framing of messages of mixed serialization kinds and attachments """
+    keys = [coring.Signer(transferable=True).verfer.qb64]
+    jser = eventing.incept(keys=keys, kind=coring.Serials.json)
+    cser = eventing.incept(keys=keys, kind=coring.Serials.cbor)
+    mser = eventing.incept(keys=keys, kind=coring.Serials.mgpk)
+
+    sigs = coring.Counter(code=coring.CtrDex.ControllerIdxSigs, count=1).qb64b
+    sigs += coring.Siger(raw=b'\x00' * 64, code=coring.IdrDex.Ed25519_Sig, index=0).qb64b
+    group = coring.Counter(code=coring.CtrDex.AttachmentGroup, count=len(sigs) // 4).qb64b + sigs
+
+    ims = bytearray(jser.raw + group + cser.raw + sigs + mser.raw)
+    frames = list(httping.frameCESRStream(ims))
+    assert frames == [(jser.raw, group), (cser.raw, sigs), (mser.raw, b'')]
+    assert ims == bytearray()
+
+    # truncated message keeps unconsumed bytes for error flush
+    ims = bytearray(jser.raw + group + cser.raw[:-10])
+    with pytest.raises(kering.ExtractionError):
+        for _ in httping.frameCESRStream(ims):
+            pass
+    assert ims == bytearray(cser.raw[:-10])
+
+    with pytest.raises(kering.ColdStartError):
+        next(httping.frameCESRStream(bytearray(sigs)))
+
+
 if __name__ == '__main__':
     test_parse_cesr_request()
@@ -6,13 +6,14 @@ tests.app.indirecting module
 import json
 
 import falcon
+from falcon import testing
 import hio
 import pytest
 from hio.core import tcp, http
 from hio.help import decking
 
-from keri.app import indirecting, storing, habbing
-from keri.core import coring, serdering
+from keri.app import indirecting, storing, habbing, httping
+from keri.core import coring, eventing, parsing, serdering
 
 
 def test_mailbox_iter():
@@ -100,6 +101,52 @@ def test_mailbox_multiple_iter():
         next(mbi)
 
 
+def test_mailbox_iter_wakeup():
+    pre = "EA3mbE6upuYnFlx68GmLYCQd7cCcwG_AtHM6dW_GT068"
+    msg = dict(i=pre, t="rct")
+    mbx = storing.Mailboxer(temp=True)
+    mb = indirecting.MailboxIterable(mbx=mbx, pre=pre, topics={"/receipt": 0, "/challenge": 0},
+                                     retry=1000)
+    assert mb.waiter in mbx.waiters[f"{pre}/receipt".encode("utf-8")]
+    mbi = iter(mb)
+    assert next(mbi) == b'retry: 1000\n\n'
+    assert next(mbi) == b''  # initial catch up read
+
+    reads = []
+    clone = mbx.cloneTopicIter
+
+    def cloneTopicIter(topic, fn=0):
+        reads.append(topic)
+        return clone(topic, fn)
+
+    mbx.cloneTopicIter = cloneTopicIter
+
+    # idle stream does not read mailbox
+    assert next(mbi) == b''
+    assert reads == []
+
+    # store only wakes and reads the topic stored into
+    mbx.storeMsg(topic=f"{pre}/challenge", msg=json.dumps(msg).encode("utf-8"))
+    mbx.storeMsg(topic=f"{pre}/challenge", msg=json.dumps(msg).encode("utf-8"))
+    assert mbx.marks[f"{pre}/challenge".encode("utf-8")] == 2
+    assert mb.waiter.woken == {f"{pre}/challenge".encode("utf-8")}
+    val = next(mbi)
+    assert val.count(b"event: /challenge") == 2
+    assert reads == [f"{pre}/challenge"]
+    assert not mb.waiter.woken
+    assert mb.topics == {"/receipt": 0, "/challenge": 2}
+
+    # refresh rereads all topics to pick up messages stored by other processes
+    mb.refreshed -= mb.RefreshMBX
+    assert next(mbi) == b''
+    assert reads == [f"{pre}/challenge", f"{pre}/receipt", f"{pre}/challenge"]
+
+    mb.TimeoutMBX = 0  # Force the iter to timeout
+    with pytest.raises(StopIteration):
+        next(mbi)
+    assert f"{pre}/receipt".encode("utf-8") not in mbx.waiters
+
+
 def test_qrymailbox_iter():
     with habbing.openHab(name="test", transferable=True, temp=True, salt=b'0123456789abcdef') as (hby, hab):
         assert hab.pre == 'EIaGMMWJFPmtXznY1IIiKDIrg-vIyge6mBl2QV8dDjI3'
@@ -152,6 +199,50 @@ def test_qrymailbox_iter():
             next(mbi)
 
 
+def test_qrymailbox_trim():
+    """ Test mailbox query signed by recipient trims acknowledged topic entries """
+    with habbing.openHby(name="wit", salt=coring.Salter(raw=b'0123456789abcdef').qb64) as witHby, \
+            habbing.openHby(name="ctl", salt=coring.Salter(raw=b'0123456789ghijkl').qb64) as ctlHby, \
+            habbing.openHby(name="oth", salt=coring.Salter(raw=b'0123456789mnopqr').qb64) as othHby:
+        witHab = witHby.makeHab(name="wit", transferable=False)
+        ctlHab = ctlHby.makeHab(name="ctl")
+        othHab = othHby.makeHab(name="oth")
+
+        kvy = eventing.Kevery(db=witHby.db, lax=True, local=False)
+        parser = parsing.Parser(kvy=kvy)
+        parser.parse(ims=ctlHab.makeOwnInception())
+        parser.parse(ims=othHab.makeOwnInception())
+        assert ctlHab.pre in kvy.kevers and othHab.pre in kvy.kevers
+        kvy.cues.clear()  # receipt cues of inceptions
+
+        mbx = storing.Mailboxer(temp=True)
+        for i in range(4):
+            mbx.storeMsg(topic=f"{ctlHab.pre}/receipt", msg=f"receipt {i}")
+
+        # query for mailbox of ctl signed by other does not trim
+        query = dict(pre=ctlHab.pre, topics={"/receipt": 2})
+        qry = othHab.query(pre=ctlHab.pre, src=witHab.pre, route="mbx", query=query)
+        parser.parse(ims=qry)
+        cue = kvy.cues.popleft()
+        assert cue["kin"] == "stream" and cue["trim"] is False
+        mb = iter(indirecting.QryRpyMailboxIterable(mbx=mbx, cues=decking.Deck([cue]),
+                                                    said=cue["serder"].said))
+        assert next(mb) == b''
+        assert [fn for fn, _, _ in mbx.cloneTopicIter(f"{ctlHab.pre}/receipt")] == [0, 1, 2, 3]
+
+        # query signed by recipient acknowledges messages before its index
+        qry = ctlHab.query(pre=ctlHab.pre, src=witHab.pre, route="mbx", query=query)
+        parser.parse(ims=qry)
+        cue = kvy.cues.popleft()
+        assert cue["kin"] == "stream" and cue["trim"] is True
+        mb = iter(indirecting.QryRpyMailboxIterable(mbx=mbx, cues=decking.Deck([cue]),
+                                                    said=cue["serder"].said))
+        assert next(mb) == b''
+        assert [fn for fn, _, _ in mbx.cloneTopicIter(f"{ctlHab.pre}/receipt")] == [2, 3]
+        assert mbx.stats["trimmed"] == 2
+        mbx.close(clear=True)
+
+
 class MockServerTls:
     def __init__(self,  certify, keypath, certpath, cafilepath, port):
         pass
@@ -178,7 +269,72 @@ def test_createHttpServer(monkeypatch):
 
 
 
+def test_http_end():
+    """ Test HttpEnd appends raw CESR bodies to parser stream without reparsing """
+    with habbing.openHab(name="test", transferable=True, temp=True, salt=b'0123456789abcdef') as (hby, hab):
+        icp = hab.makeOwnInception()
+        ixn = hab.interact()
+        qry = hab.query(pre=hab.pre, src=hab.pre, route="mbx", query=dict(topics={"/receipt": 0}))
+
+        mbx = storing.Mailboxer(temp=True)
+        httpEnd = indirecting.HttpEnd(mbx=mbx)
+        app = falcon.App()
+        app.add_route("/", httpEnd)
+        client = testing.TestClient(app)
+
+        # one message per request with attachments in header
+        serder = serdering.SerderKERI(raw=bytes(icp))
+        atc = bytes(icp[serder.size:]).decode("utf-8")
+        rep = client.simulate_post("/", body=serder.raw,
+                                   headers={"Content-Type": httping.CESR_CONTENT_TYPE,
+                                            httping.CESR_ATTACHMENT_HEADER: atc})
+        assert rep.status == falcon.HTTP_204
+        assert "connection" not in rep.headers  # keep-alive left to client and server
+        assert httpEnd.rxbs == icp
+
+        rep = client.simulate_post("/", body=serder.raw[:-1],
+                                   headers={"Content-Type": httping.CESR_CONTENT_TYPE,
+                                            httping.CESR_ATTACHMENT_HEADER: atc})
+        assert rep.status == falcon.HTTP_400
+        rep = client.simulate_post("/", body=serder.raw,
+                                   headers={"Content-Type": httping.CESR_CONTENT_TYPE})
+        assert rep.status == falcon.HTTP_412
+        rep = client.simulate_post("/", body=serder.raw, headers={"Content-Type": "application/json"})
+        assert rep.status == falcon.HTTP_406
+        assert httpEnd.rxbs == icp
+
+        # multiple messages in one CESR stream body
+        httpEnd.rxbs.clear()
+        stream = icp + ixn
+        rep = client.simulate_post("/", body=bytes(stream),
+                                   headers={"Content-Type": httping.CESR_STREAM_CONTENT_TYPE})
+        assert rep.status == falcon.HTTP_204
+        assert httpEnd.rxbs == stream
+
+        rep = client.simulate_post("/", body=b"-AAB" + bytes(stream),
+                                   headers={"Content-Type": httping.CESR_STREAM_CONTENT_TYPE})
+        assert rep.status == falcon.HTTP_400
+
+        # mailbox query in stream is answered with event stream
+        httpEnd.rxbs.clear()
+        serder = serdering.SerderKERI(raw=bytes(qry))
+        httpEnd.qrycues.append(dict(serder=serder, kin="stream", pre=hab.pre, topics={"/receipt": 0}))
+        req = testing.create_req(method="POST", body=bytes(ixn + qry),
+                                 headers={"Content-Type": httping.CESR_STREAM_CONTENT_TYPE})
+        rep = falcon.Response()
+        httpEnd.on_post(req, rep)
+        assert rep.status == falcon.HTTP_200
+        assert rep.headers["content-type"] == "text/event-stream"
+        assert isinstance(rep.stream, indirecting.QryRpyMailboxIterable)
+        assert rep.stream.said == serder.said
+        assert httpEnd.rxbs == ixn + qry
+        assert next(rep.stream) == b''
+        assert not httpEnd.qrycues
+
+
+
 
 if __name__ == "__main__":
     test_mailbox_iter()
+    test_http_end()
     test_qrymailbox_iter()
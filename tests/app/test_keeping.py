@@ -1992,5 +1992,53 @@ def test_manager_sign_dual_indices():
     assert not manager.ks.opened
     """End Test"""
 
+def test_manager_signer_cache():
+    """
+    test Manager unlocked signer cache used by .sign
+    """
+    raw = b'0123456789abcdef'
+    salt = coring.Salter(raw=raw).qb64
+    ser = b"See ya later Alligator. In a while Crocodile."
+
+    with keeping.openKS() as keeper:
+        manager = keeping.Manager(ks=keeper, salt=salt, signerSize=2)
+        assert manager.signerTTL == keeping.Manager.SignerTTL
+        assert manager.signerSize == 2
+        assert not manager.signers
+
+        verfers, digers = manager.incept(icount=3, ncount=3, salt=salt, temp=True)
+        pubs = [verfer.qb64 for verfer in verfers]
+
+        sigers = manager.sign(ser=ser, pubs=pubs[:2])
+        assert manager.misses == 2 and manager.hits == 0
+        assert list(manager.signers) == pubs[:2]
+
+        cached = manager.sign(ser=ser, verfers=verfers[:2])
+        assert manager.misses == 2 and manager.hits == 2
+        assert [siger.qb64 for siger in cached] == [siger.qb64 for siger in sigers]
+
+        manager.sign(ser=ser, pubs=pubs)  # third pub evicts least recently used
+        assert manager.evictions == 1
+        assert list(manager.signers) == pubs[1:]
+
+        # expired signer is refetched
+        signer, expiry = manager.signers[pubs[2]]
+        manager.signers[pubs[2]] = (signer, expiry - manager.signerTTL - 1.0)
+        manager.sign(ser=ser, pubs=[pubs[2]])
+        assert manager.evictions == 2
+        assert manager.misses == 4
+
+        # rotation wipes cache
+        pre = pubs[0]
+        manager.rotate(pre=pre, ncount=3, temp=True)
+        assert not manager.signers
+
+        # disabled
+        manager.signerTTL = 0.0
+        manager.sign(ser=ser, verfers=verfers)
+        assert not manager.signers
+
+    """End Test"""
+
 if __name__ == "__main__":
     test_manager_sign_dual_indices()
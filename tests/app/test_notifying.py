@@ -169,6 +169,70 @@ def test_noter():
     assert cnt == 13
 
 
+def test_noter_pages():
+    """ Test cursor pages, read and route indexes and counts of Noter """
+    noter = notifying.Noter(temp=True)
+    cig = coring.Cigar(qb64="AABr1EJXI1sTuI51TXo4F1JjxIJzwPeCxa-Cfbboi7F4Y4GatPEvK629M7G_5c86_Ssvwg8POZWNMV-WreVqBECw")
+
+    routes = ["/exn/ipex/grant", "/exn/ipex/admit", "/multisig/icp"]
+    rids = []
+    for i in range(9):
+        dt = helping.fromIso8601(f"2022-07-08T15:01:0{i}.453632")
+        note = notifying.notice(attrs=dict(r=routes[i % 3], i=i), dt=dt)
+        assert noter.add(note, cig) is True
+        rids.append(note.rid)
+    note = notifying.notice(attrs=dict(a=1), dt=helping.fromIso8601("2022-07-08T15:01:09.453632"))
+    assert noter.add(note, cig) is True  # no route
+
+    # pages resume from cursor in datetime order
+    seen = []
+    notes, cursor = noter.getNotePage(limit=4)
+    while notes:
+        assert all(c.qb64 == cig.qb64 for _, c in notes)
+        seen.extend(note.rid for note, _ in notes)
+        notes, cursor = noter.getNotePage(last=cursor, limit=4)
+        if not cursor:
+            seen.extend(note.rid for note, _ in notes)
+            break
+    assert seen == rids + [note.rid]
+
+    assert [n.rid for n, _ in noter.getNotes(start=8, end=-1)] == [rids[8], note.rid]
+    assert noter.getNotes(start=20) == []
+
+    # route index matches route and subroutes only
+    assert noter.cntNotes(route="/exn/ipex/grant") == 3
+    assert noter.cntNotes(route="/exn/ipex") == 6
+    assert noter.cntNotes(route="/exn/ip") == 0
+    ipex = [n.attrs["i"] for _, n, _ in noter.getNoteIter(route="/exn/ipex/admit")]
+    assert ipex == [1, 4, 7]
+
+    # read index moves on update and rem
+    assert noter.cntNotes(read=False) == 10
+    marked, _ = noter.get(rids[1])
+    marked.read = True
+    assert noter.update(marked, cig) is True
+    assert noter.cntNotes(read=False) == 9
+    assert noter.cntNotes(read=True) == 1
+    assert noter.cntNotes(read=True, route="/exn/ipex/admit") == 1
+    assert noter.cntNotes(read=False, route="/exn/ipex") == 5
+    assert [n.rid for _, n, _ in noter.getNoteIter(read=True)] == [rids[1]]
+
+    assert noter.rem(rids[1]) is True
+    assert noter.cntNotes(read=True) == 0
+    assert noter.cntNotes(route="/exn/ipex/admit") == 2
+    assert noter.getNoteCnt() == 9
+
+    # indexes rebuilt from notes when missing
+    noter.nrds.trim()
+    noter.nrts.trim()
+    assert noter.cntNotes(read=False) == 0
+    noter.reindexNotes()
+    assert noter.cntNotes(read=False) == 9
+    assert noter.cntNotes(route="/multisig") == 3
+
+    noter.close(clear=True)
+
+
 def test_notifier():
     with habbing.openHby(name="test") as hby:
         notifier = notifying.Notifier(hby=hby)
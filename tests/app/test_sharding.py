@@ -0,0 +1,163 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.app.test_sharding module
+
+"""
+import multiprocessing
+import time
+
+from hio.base import doing
+
+from keri.app import habbing, sharding, storing
+from keri.core import coring, eventing
+from keri.vdr import viring
+
+
+def test_shard_of():
+    """ Test prefix to shard mapping is stable and spread """
+    pre = "EA3mbE6upuYnFlx68GmLYCQd7cCcwG_AtHM6dW_GT068"
+    assert sharding.shardOf(pre, 1) == 0
+    assert sharding.shardOf("", 4) == 0
+    assert sharding.shardOf(pre, 4) == sharding.shardOf(pre.encode("utf-8"), 4)
+    assert 0 <= sharding.shardOf(pre, 4) < 4
+
+    counts = [0] * 4
+    for i in range(400):
+        counts[sharding.shardOf(f"E{i:043d}", 4)] += 1
+    assert all(count > 50 for count in counts)
+
+    assert sharding.routeShard(b"not a message", 4) == 0
+
+    owned = eventing.OwnedPrefixes(owns=lambda pre: pre.startswith(b"E"), pres={b"Eabc", b"Babc"})
+    assert b"Eabc" in owned
+    assert b"Babc" not in owned  # woken but not owned
+    assert b"Exyz" not in owned  # owned but not woken
+    assert b"Exyz" in eventing.OwnedPrefixes(owns=lambda pre: pre.startswith(b"E"))
+
+
+def test_sharder():
+    """ Test Sharder routes messages to owning Shard which accepts them """
+    with habbing.openHby(name="wit", salt=coring.Salter(raw=b"0123456789abcdef").qb64) as witHby, \
+            habbing.openHby(name="ctl", salt=coring.Salter(raw=b"0123456789ghijkl").qb64) as ctlHby:
+        witHab = witHby.makeHab(name="wit", transferable=False)
+        ctlHab = ctlHby.makeHab(name="ctl", wits=[witHab.pre])
+        reger = viring.Reger(name="wit", temp=True)
+        mbx = storing.Mailboxer(name="wit", temp=True)  # front-end
+        shardMbx = storing.Mailboxer(name="shard", temp=True)
+
+        count = 2
+        fronts = []
+        shards = []
+        for index in range(count):
+            front, back = multiprocessing.Pipe()
+            fronts.append(front)
+            shards.append(sharding.Shard(hby=witHby, index=index, count=count,
+                                         conn=back, mbx=shardMbx, reger=reger))
+        sharder = sharding.Sharder(hby=witHby, conns=fronts, mbx=mbx)
+
+        index = sharding.shardOf(ctlHab.pre, count)
+        assert shards[index].owns(ctlHab.pre)
+        assert not shards[1 - index].owns(ctlHab.pre.encode("utf-8"))
+
+        sharder.ims.extend(ctlHab.makeOwnInception())
+        doist = doing.Doist(limit=1.0, tock=0.03125, real=False)
+        deeds = doist.enter(doers=[sharder, *shards])
+        for _ in range(4):
+            doist.recur(deeds=deeds)
+
+        assert sharder.routed[index] == 1
+        assert sharder.routed[1 - index] == 0
+        assert ctlHab.pre in witHby.db.kevers
+        assert len(sharder.responses) == 1  # receipt cue from witnessed inception
+        assert sharder.responses[0]["kin"] == "receipt"
+
+        # kevers of prefixes owned by other shards are reloaded from db
+        witHby.db.kevers.flush(keep=shards[1 - index].owns)
+        assert ctlHab.pre not in dict.keys(witHby.db.kevers)
+        assert witHab.pre in dict.keys(witHby.db.kevers)  # own pinned
+        assert witHby.db.kevers.get(ctlHab.pre).sn == 0  # reads through
+
+        # wakes from one shard are broadcast to the others
+        shards[index].conn.send(("wake", [b"Eabc"]))
+        sharder.recur(tyme=0.0)
+        other = shards[1 - index].conn
+        assert other.poll()
+        assert other.recv() == ("wake", [b"Eabc"])
+        assert not shards[index].conn.poll()
+
+        # mailbox stores of a shard wake front-end mailbox streams
+        topic = ctlHab.pre.encode("utf-8") + b"/credential"
+        waiter = mbx.register(topics=[topic])
+        shardMbx.storeMsg(topic=topic, msg=b"forwarded")
+        shardMbx.storeMsg(topic=topic, msg=b"forwarded again")
+        for _ in range(2):  # shard sends then sharder dispatches
+            doist.recur(deeds=deeds)
+        assert waiter.woken == {topic}
+        assert mbx.marks[topic] == 2
+        assert not shardMbx.marks
+        mbx.notify(topic=topic, mark=1)  # stale mark never rewinds
+        assert mbx.marks[topic] == 2
+
+        doist.exit(deeds=deeds)
+        shardMbx.close(clear=True)
+        mbx.close(clear=True)
+        reger.close()
+
+
+def test_spawned_shards():
+    """ Test spawned shard processes over the shared LMDB accept and receipt an inception """
+    alias = "wit-spawned-shards"
+    witHby = habbing.Habery(name="wit", base="test-spawned-shards", temp=False,
+                            salt=coring.Salter(raw=b"0123456789abcdef").qb64)
+    try:
+        witHab = witHby.makeHab(name=alias, transferable=False)
+        with habbing.openHby(name="ctl", salt=coring.Salter(raw=b"0123456789ghijkl").qb64) as ctlHby:
+            ctlHab = ctlHby.makeHab(name="ctl", wits=[witHab.pre])
+
+            sharder = sharding.Sharder(hby=witHby, count=2, alias=alias)
+            sharder.enter()
+            try:
+                assert len(sharder.procs) == 2
+                assert all(proc.is_alive() for proc in sharder.procs)
+
+                sharder.ims.extend(ctlHab.makeOwnInception())
+                deadline = time.monotonic() + 60.0  # spawned processes import keri first
+                while not sharder.responses and time.monotonic() < deadline:
+                    sharder.recur(tyme=0.0)
+                    time.sleep(0.03125)
+
+                assert sharder.routed[sharding.shardOf(ctlHab.pre, 2)] == 1
+                assert len(sharder.responses) == 1
+                cue = sharder.responses[0]
+                assert cue["kin"] == "receipt"
+                assert cue["serder"].pre == ctlHab.pre
+                assert witHby.db.kevers.get(ctlHab.pre).sn == 0  # accepted by shard
+            finally:
+                sharder.exit()
+
+            assert not any(proc.is_alive() for proc in sharder.procs)
+    finally:
+        viring.Reger(name=alias, db=witHby.db, temp=False).close(clear=True)
+        storing.Mailboxer(name=alias, temp=False).close(clear=True)
+        witHby.close(clear=True)
+        witHby.cf.close(clear=True)
+
+
+def test_sharder_route_malformed():
+    """ Test Sharder drops only a malformed frame and routes the messages after it """
+    with habbing.openHby(name="ctl", salt=coring.Salter(raw=b"0123456789ghijkl").qb64) as ctlHby:
+        ctlHab = ctlHby.makeHab(name="ctl", transferable=True)
+        icp = ctlHab.makeOwnInception()
+        ixn = ctlHab.interact()
+
+        fronts, backs = zip(*(multiprocessing.Pipe() for _ in range(2)))
+        sharder = sharding.Sharder(hby=ctlHby, conns=list(fronts))
+        sharder.ims.extend(icp + b'{"v":"KERI10JSON00ffff_","t":"icp"}' + ixn)
+        sharder.route()
+
+        assert not sharder.ims
+        assert sum(sharder.routed) == 2
+        back = backs[sharding.shardOf(ctlHab.pre, 2)]
+        assert back.recv() == ("msg", bytes(icp))
+        assert back.recv() == ("msg", bytes(ixn))
+        assert not backs[0].poll() and not backs[1].poll()
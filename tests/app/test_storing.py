@@ -3,6 +3,7 @@
 tests.peer.mailboxing
 
 """
+import datetime
 import os
 
 import lmdb
@@ -10,8 +11,9 @@ import lmdb
 from keri.app import keeping
 from keri.core import coring, serdering
 from keri.db import dbing, basing
+from keri.help import helping
 from keri.peer import exchanging
-from keri.app.storing import Mailboxer
+from keri.app.storing import Mailboxer, MailboxCompactor
 
 
 def test_mailboxing():
@@ -109,6 +111,99 @@ def test_mailboxing():
         assert msgs[0][0] == 4
 
 
+def test_mailbox_retention():
+    """
+    Test Mailboxer retention, trimming and compaction
+    """
+    pre = "EA3mbE6upuYnFlx68GmLYCQd7cCcwG_AtHM6dW_GT068"
+    other = "EBiBiBiBiBiBiBiBiBiBiBiBiBiBiBiBiBiBiBiBiBi"
+
+    with dbing.openLMDB(cls=Mailboxer) as mber:
+        assert mber.topicQuota is None and mber.recipientQuota is None and mber.maxAge is None
+        for i in range(5):
+            mber.storeMsg(topic=f"{pre}/receipt", msg=f"receipt {i}")
+        for i in range(3):
+            mber.storeMsg(topic=f"{pre}/challenge", msg=f"challenge {i}")
+        mber.storeMsg(topic=f"{other}/receipt", msg="other 0")
+
+        # nothing to remove without retention limits
+        stats = mber.compact()
+        assert stats == dict(expired=0, trimmed=0, collected=0, topics=3, msgs=9)
+
+        # acknowledged trimming keeps fn of later messages
+        assert mber.trimTopic(topic=f"{pre}/receipt", fn=2) == 2
+        assert [fn for fn, _, _ in mber.cloneTopicIter(f"{pre}/receipt")] == [2, 3, 4]
+        # latest message always kept
+        assert mber.trimTopic(topic=f"{pre}/challenge", fn=10) == 2
+        assert [fn for fn, _, _ in mber.cloneTopicIter(f"{pre}/challenge")] == [2]
+        mber.storeMsg(topic=f"{pre}/challenge", msg="challenge 3")
+        assert [fn for fn, _, _ in mber.cloneTopicIter(f"{pre}/challenge")] == [2, 3]
+
+        # orphaned bodies collected
+        stats = mber.compact()
+        assert stats["collected"] == 4
+        assert stats["msgs"] == 6
+        assert mber.msgs.get(keys=coring.Diger(ser=b"receipt 0").qb64) is None
+
+        # per topic quota
+        mber.topicQuota = 2
+        stats = mber.compact()
+        assert stats["trimmed"] == 1
+        assert [fn for fn, _, _ in mber.cloneTopicIter(f"{pre}/receipt")] == [3, 4]
+
+        # per recipient quota trims oldest across topics of recipient only
+        mber.recipientQuota = 3
+        stats = mber.compact()
+        assert stats["trimmed"] == 1
+        assert [fn for fn, _, _ in mber.cloneTopicIter(f"{pre}/receipt")] == [4]
+        assert [fn for fn, _, _ in mber.cloneTopicIter(f"{pre}/challenge")] == [2, 3]
+        assert [fn for fn, _, _ in mber.cloneTopicIter(f"{other}/receipt")] == [0]
+
+        # age expiry
+        mber.maxAge = 60.0
+        stats = mber.compact(now=helping.nowUTC() + datetime.timedelta(seconds=120))
+        assert stats["expired"] == 1
+        assert [fn for fn, _, _ in mber.cloneTopicIter(f"{pre}/challenge")] == [3]
+        assert mber.stats == dict(expired=1, trimmed=6, collected=7, compactions=5)
+
+        compactor = MailboxCompactor(mbx=mber, period=10.0)
+        assert compactor.recur(tyme=0.0) is False
+        assert compactor.stats["topics"] == 3
+        compactor.recur(tyme=5.0)
+        assert mber.stats["compactions"] == 6
+        compactor.recur(tyme=10.0)
+        assert mber.stats["compactions"] == 7
+
+        # without retention limits only compacts after trimming
+        mber.topicQuota = mber.recipientQuota = mber.maxAge = None
+        assert not mber.limited
+        compactor.recur(tyme=20.0)
+        assert mber.stats["compactions"] == 7
+        mber.storeMsg(topic=f"{other}/receipt", msg="other 1")
+        assert mber.trimTopic(topic=f"{other}/receipt", fn=1) == 1
+        compactor.recur(tyme=30.0)
+        assert mber.stats["compactions"] == 8
+        assert compactor.stats["collected"] == 1
+        compactor.recur(tyme=40.0)
+        assert mber.stats["compactions"] == 8
+
+    with dbing.openLMDB(cls=Mailboxer) as mber:
+        # shared body dated by its latest store so expiry never removes early
+        mber.storeMsg(topic=f"{pre}/receipt", msg="shared")
+        mber.storeMsg(topic=f"{pre}/receipt", msg="receipt 1")
+        dig = coring.Diger(ser=b"shared").qb64
+        first = mber.mdts.get(keys=dig).datetime
+        mber.storeMsg(topic=f"{other}/receipt", msg="shared")
+        mber.storeMsg(topic=f"{other}/receipt", msg="other 1")
+        assert mber.mdts.get(keys=dig).datetime > first
+
+        # removals and collection run in bounded batches
+        mber.CompactBatch = 1
+        mber.topicQuota = 1
+        stats = mber.compact()
+        assert stats == dict(expired=0, trimmed=2, collected=1, topics=2, msgs=2)
+        assert mber.msgs.get(keys=dig) is None
+
 
 if __name__ == '__main__':
     test_mailboxing()
@@ -1463,6 +1463,19 @@ def test_matter():
     assert matter.digestive == False
     assert matter.prefixive == False
 
+    # encodings cached and source kept so not recomputed
+    matter = Matter(qb64b=bytearray(qb64b))
+    assert matter._qb64b == qb64b and isinstance(matter._qb64b, bytes)
+    assert matter._qb2 is None
+    assert matter.qb64 is matter.qb64
+    assert matter.qb2 is matter.qb2 and matter.qb2 == qb2
+    matter = Matter(qb2=qb2)
+    assert matter._qb2 == qb2 and matter._qb64b is None
+    assert matter.qb64b is matter.qb64b and matter.qb64b == qb64b
+    assert not hasattr(matter, "__dict__")  # slotted
+    with pytest.raises(AttributeError):
+        matter.foo = 1
+
     """ Done Test """
 
 
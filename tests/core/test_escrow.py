@@ -10,7 +10,7 @@ import datetime
 from keri import help
 from keri.help import helping
 from keri.db import dbing, basing
-from keri.app import keeping
+from keri.app import habbing, keeping
 from keri.core import coring, eventing, parsing
 
 logger = help.ogler.getLogger()
@@ -1414,6 +1414,144 @@ def test_unverified_trans_receipt_escrow():
     """End Test"""
 
 
+def test_escrow_wakeup():
+    """
+    Test escrow reprocessing only reattempts woken identifier prefixes
+
+    """
+    salt = coring.Salter(raw=b'0123456789abcdef').qb64
+    psr = parsing.Parser()
+
+    with basing.openDB(name="edy") as db, keeping.openKS(name="edy") as ks:
+        # waiters are woken along with their dependency then cleared
+        db.waitEscrows(pre="EA", dep=b"EB")
+        db.wakeEscrows("EB")
+        assert db.woken == {b"EB", b"EA"}
+        assert db.waiters == {}
+        db.woken = set()
+
+        mgr = keeping.Manager(ks=ks, salt=salt)
+        kvy = eventing.Kevery(db=db)
+
+        verfers, digers = mgr.incept(icount=1, ncount=1, stem='wes', temp=True)
+        srdr = eventing.incept(keys=[verfer.qb64 for verfer in verfers],
+                               ndigs=[diger.qb64 for diger in digers],
+                               code=coring.MtrDex.Blake3_256)
+        pre = srdr.pre
+        mgr.move(old=verfers[0].qb64, new=pre)
+        icpmsg = bytearray(srdr.raw)
+        sigers = mgr.sign(ser=srdr.raw, verfers=verfers)
+        icpmsg.extend(coring.Counter(code=coring.CtrDex.ControllerIdxSigs,
+                                     count=len(sigers)).qb64b)
+        for siger in sigers:
+            icpmsg.extend(siger.qb64b)
+
+        srdr = eventing.interact(pre=pre, dig=srdr.said, sn=1, data=[])
+        ixnmsg = bytearray(srdr.raw)
+        sigers = mgr.sign(ser=srdr.raw, verfers=verfers)
+        ixnmsg.extend(coring.Counter(code=coring.CtrDex.ControllerIdxSigs,
+                                     count=len(sigers)).qb64b)
+        for siger in sigers:
+            ixnmsg.extend(siger.qb64b)
+
+        # ixn out of order so escrowed and first pass reattempts everything
+        psr.parse(ims=bytearray(ixnmsg), kvy=kvy)
+        assert len(db.getOoes(dbing.snKey(pre, 1))) == 1
+        assert db.woken == {pre.encode("utf-8")}
+        assert kvy.swept is None
+        kvy.processEscrows()
+        assert kvy.swept is not None
+        assert db.woken == set()
+        assert pre not in kvy.kevers
+
+        # accept icp but drop wakeup so pass skips escrowed ixn
+        psr.parse(ims=bytearray(icpmsg), kvy=kvy)
+        assert kvy.kevers[pre].sn == 0
+        db.woken = set()
+        kvy.processEscrows()
+        assert len(db.getOoes(dbing.snKey(pre, 1))) == 1
+        assert kvy.kevers[pre].sn == 0
+
+        # waking pre reattempts its escrowed ixn
+        db.wakeEscrows(pre)
+        kvy.processEscrows()
+        assert len(db.getOoes(dbing.snKey(pre, 1))) == 0
+        assert kvy.kevers[pre].sn == 1
+        assert db.woken == {pre.encode("utf-8")}  # accepted ixn wakes again
+
+        # forced sweep reattempts everything regardless of wakeups
+        db.woken = set()
+        kvy.swept -= datetime.timedelta(seconds=kvy.SweepPeriod + 1)
+        kvy.processEscrows()
+        assert not kvy.reprocessing
+
+    assert not os.path.exists(ks.path)
+    assert not os.path.exists(db.path)
+
+    """End Test"""
+
+
+def test_escrow_wakeup_chain():
+    """
+    Test escrowed item that is reattempted too early waits again on its
+    dependency and is accepted once the dependency is satisfied
+
+    """
+    with habbing.openHby(name="val", salt=coring.Salter(raw=b'0123456789abcdef').qb64) as valHby, \
+            habbing.openHby(name="ctl", salt=coring.Salter(raw=b'0123456789ghijkl').qb64) as ctlHby, \
+            basing.openDB(name="edy") as db:
+        valHab = valHby.makeHab(name="val")
+        valIcp = valHab.makeOwnInception()
+        valRot = valHab.rotate()  # receipts from key state at sn=1
+        ctlHab = ctlHby.makeHab(name="ctl")
+        ctlIcp = ctlHab.makeOwnInception()
+        parsing.Parser().parse(ims=bytearray(ctlIcp), kvy=valHab.kvy)
+        rct = valHab.receipt(ctlHab.kever.serder)
+
+        kvy = eventing.Kevery(db=db, lax=False, local=False)
+        psr = parsing.Parser()
+        psr.parse(ims=bytearray(ctlIcp), kvy=kvy)
+        kvy.processEscrows()  # first pass
+        dgkey = dbing.dgKey(ctlHab.pre, ctlHab.kever.serder.said)
+
+        # receipt escrowed waiting on validator KEL
+        psr.parse(ims=bytearray(rct), kvy=kvy)
+        assert len(db.getVres(dbing.snKey(ctlHab.pre, 0))) == 1
+        assert ctlHab.pre.encode("utf-8") in db.waiters[valHab.pre.encode("utf-8")]
+
+        # validator inception wakes receipt too early so it waits again
+        psr.parse(ims=bytearray(valIcp), kvy=kvy)
+        kvy.processEscrows()
+        assert len(db.getVres(dbing.snKey(ctlHab.pre, 0))) == 1
+        assert ctlHab.pre.encode("utf-8") in db.waiters[valHab.pre.encode("utf-8")]
+
+        # validator rotation wakes receipt again which is now accepted
+        psr.parse(ims=bytearray(valRot), kvy=kvy)
+        assert kvy.kevers[valHab.pre].sn == 1
+        kvy.processEscrows()
+        assert len(db.getVres(dbing.snKey(ctlHab.pre, 0))) == 0
+        assert len(db.getVrcs(dgkey)) == 1
+
+        # wakes of a pass that raises are kept for the next pass
+        db.wakeEscrows(ctlHab.pre)
+        process = kvy.processEscrowOutOfOrders
+
+        def fail(pres=None, sweep=False):
+            raise ValueError("failed")
+
+        kvy.processEscrowOutOfOrders = fail
+        try:
+            kvy.processEscrows()
+        except ValueError:
+            pass
+        assert db.woken == {ctlHab.pre.encode("utf-8")}
+        kvy.processEscrowOutOfOrders = process
+        kvy.processEscrows()
+        assert db.woken == set()
+
+    """End Test"""
+
+
 if __name__ == "__main__":
     test_unverified_receipt_escrow()
 
@@ -587,6 +587,57 @@ def test_dequintuple():
     """end test"""
 
 
+def test_verifysigs():
+    """
+    Test verifySigs dedup, index checks, batch and short circuit verification
+    """
+    raw = b"ABCDEFGH01234567"
+    signers = Salter(raw=raw).signers(count=10, path='vsig', temp=True)
+    verfers = [signer.verfer for signer in signers]
+    ser = b'abcdefghijklmnopqrstuvwxyz0123456789'
+    sigers = [signer.sign(ser, index=i) for i, signer in enumerate(signers)]
+
+    # duplicates removed and verfers assigned without reparsing
+    vsigers, vindices = eventing.verifySigs(raw=ser,
+                                            sigers=sigers[:3] + sigers[:2],
+                                            verfers=verfers)
+    assert vindices == [0, 1, 2]
+    assert vsigers == sigers[:3]
+    assert [siger.verfer.qb64 for siger in vsigers] == [verfer.qb64 for verfer in verfers[:3]]
+
+    # index out of range of verfers is skipped
+    vsigers, vindices = eventing.verifySigs(raw=ser, sigers=sigers[:4],
+                                            verfers=verfers[:2])
+    assert vindices == [0, 1]
+
+    # bad sig not verified
+    bad = signers[0].sign(b'not the ser', index=1)
+    vsigers, vindices = eventing.verifySigs(raw=ser, sigers=[sigers[0], bad],
+                                            verfers=verfers)
+    assert vindices == [0]
+
+    # batch verified in parallel when at least BatchVerifySize sigs
+    assert len(sigers) >= eventing.BatchVerifySize
+    vsigers, vindices = eventing.verifySigs(raw=ser, sigers=sigers + [bad],
+                                            verfers=verfers)
+    assert vindices == list(range(10))
+    assert eventing._verifyPool is not None
+
+    # short circuit once threshold satisfied
+    tholder = coring.Tholder(sith="3")
+    vsigers, vindices = eventing.verifySigs(raw=ser, sigers=sigers,
+                                            verfers=verfers, tholder=tholder)
+    assert vindices == [0, 1, 2]
+    assert tholder.satisfy(vindices)
+
+    tholder = coring.Tholder(sith=[["1/2", "1/2"], ["1"] * 8])
+    vsigers, vindices = eventing.verifySigs(raw=ser, sigers=[bad] + sigers,
+                                            verfers=verfers, tholder=tholder)
+    assert vindices == [0, 1, 2]
+
+    """End Test """
+
+
 def test_lastestloc():
     """
     Test LastEstLoc namedtuple
@@ -251,7 +251,89 @@ def test_parser():
     """ Done Test """
 
 
+def test_cursor():
+    """
+    Test Cursor offset walking of incoming message stream
+    """
+    ims = bytearray(b'-AABAAApXLez5eVIs6YyR')
+    cursor = parsing.Cursor(ims)
+    assert len(cursor) == len(ims)
+    assert cursor
+    assert cursor[0] == ims[0]
+    assert cursor[-1] == ims[-1]
+    assert cursor[:2] == bytearray(b'-A')
+
+    counter = Counter(qb64b=cursor, strip=True)  # strip advances offset only
+    assert counter.code == CtrDex.ControllerIdxSigs
+    assert counter.count == 1
+    assert cursor.offset == cursor.consumed == 4
+    assert ims == bytearray(b'-AABAAApXLez5eVIs6YyR')  # not yet compacted
+    assert cursor[:4] == bytearray(b'AAAp')
+    assert len(cursor) == len(ims) - 4
+
+    with pytest.raises(TypeError):
+        del cursor[2:4]  # only front deletions supported
+
+    cursor.compact()  # consumed less than unconsumed so not compacted
+    assert cursor.offset == 4
+    cursor.compact(force=True)
+    assert cursor.offset == 0
+    assert ims == bytearray(b'AAApXLez5eVIs6YyR')
+
+    del cursor[:]
+    assert not cursor
+    assert len(cursor) == 0
+    assert ims  # still holds consumed bytes until compacted
+    cursor.compact()
+    assert not ims
+    assert cursor.offset == 0
+
+    ims.extend(b'-AAB')  # stream may be extended while wrapped
+    assert cursor[:] == bytearray(b'-AAB')
+
+    """ Done Test """
+
+
+def test_parser_cursor():
+    """
+    Test Parser with and without Cursor parse the same stream
+    """
+    raw = b"ABCDEFGH01234567"
+    signers = Salter(raw=raw).signers(count=2, path='psr', temp=True)
+
+    msgs = bytearray()
+    serder = incept(keys=[signers[0].verfer.qb64],
+                    ndigs=[coring.Diger(ser=signers[1].verfer.qb64b).qb64])
+    siger = signers[0].sign(serder.raw, index=0)
+    for i in range(3):  # same event repeated so duplicates after first
+        msgs.extend(serder.raw)
+        msgs.extend(Counter(CtrDex.ControllerIdxSigs).qb64b)
+        msgs.extend(siger.qb64b)
+
+    for cursor in (True, False):
+        with openDB(name="validator") as valDB:
+            kevery = Kevery(db=valDB)
+            ims = bytearray(msgs)
+            parser = parsing.Parser(kvy=kevery, cursor=cursor)
+            assert parser.cursor == cursor
+            parser.parse(ims=ims)
+            assert ims == bytearray(b'')
+            assert serder.pre in kevery.kevers
+            assert kevery.kevers[serder.pre].sn == 0
+
+    # parseOne leaves remaining messages in stream
+    with openDB(name="validator") as valDB:
+        kevery = Kevery(db=valDB)
+        ims = bytearray(msgs)
+        parser = parsing.Parser(kvy=kevery)
+        parser.parseOne(ims=ims)
+        assert ims == msgs[len(msgs) // 3:]
+        assert serder.pre in kevery.kevers
+
+    """ Done Test """
 
 
 if __name__ == "__main__":
     test_parser()
+    test_cursor()
+    test_parser_cursor()
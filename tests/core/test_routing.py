@@ -0,0 +1,98 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.core.test_routing module
+
+"""
+import pytest
+
+from keri import kering
+from keri.core import routing
+
+
+class Resource:
+    def __init__(self):
+        self.calls = []
+
+    def processReply(self, *, serder, saider, route, cigars=None, tsgs=None, **kwargs):
+        self.calls.append((None, route, kwargs))
+
+    def processReplyAid(self, *, serder, saider, route, cigars=None, tsgs=None, **kwargs):
+        self.calls.append(("Aid", route, kwargs))
+
+
+class Serder:
+    def __init__(self, r):
+        self.ked = dict(r=r)
+
+
+def test_router_find():
+    """ Test trie route resolution matches first registered regex route """
+    rtr = routing.Router()
+    res = Resource()
+    rtr.addRoute("/end/role/{action}", res)
+    rtr.addRoute("/loc/scheme", res)
+    rtr.addRoute("/ksn/{aid}", res, suffix="Aid")
+    rtr.addRoute("/ksn/special", res)  # shadowed by earlier /ksn/{aid}
+    rtr.addRoute("/tsn/{aid}.json", res)  # partial segment falls back to regex
+    rtr.addRoute("/", res)
+
+    assert len(rtr.routes) == 6
+    assert [route.template for route in rtr.fallbacks] == ["/tsn/{aid}.json"]
+
+    route, fields = rtr._find("/end/role/add")
+    assert route is rtr.routes[0]
+    assert fields == dict(action="add")
+
+    route, fields = rtr._find("/LOC/Scheme")  # case insensitive static segments
+    assert route is rtr.routes[1]
+    assert fields == dict()
+
+    route, fields = rtr._find("/ksn/special")
+    assert route is rtr.routes[2]
+    assert fields == dict(aid="special")
+
+    route, fields = rtr._find("/tsn/EAbc.json")
+    assert route is rtr.routes[4]
+    assert fields == dict(aid="EAbc")
+
+    assert rtr._find("/")[0] is rtr.routes[5]
+
+    for r in ("/end/role", "/end/role/add/more", "/ksn/", "/loc/scheme/", "loc/scheme", "/nope"):
+        assert rtr._find(r) == (None, None)
+        for route in rtr.routes:  # same as regex search
+            assert not route.regex.search(r)
+
+    assert "/ksn/special" in rtr.cache
+    rtr.addRoute("/other", res)
+    assert not rtr.cache
+
+    # preregistered routes are indexed
+    nrtr = routing.Router(routes=list(rtr.routes))
+    assert nrtr._find("/ksn/EAbc") == (rtr.routes[2], dict(aid="EAbc"))
+    assert nrtr._find("/tsn/EAbc.json") == (rtr.routes[4], dict(aid="EAbc"))
+
+
+def test_router_dispatch():
+    """ Test dispatch to resource with counters """
+    rtr = routing.Router()
+    res = Resource()
+    rtr.addRoute("/ksn/{aid}", res, suffix="Aid")
+    rtr.addRoute("/loc/scheme", res)
+
+    rtr.dispatch(Serder(r="/ksn/EAbc"), saider=None, cigars=None, tsgs=None)
+    rtr.dispatch(Serder(r="/ksn/EAbc"), saider=None, cigars=None, tsgs=None)
+    rtr.dispatch(Serder(r="/loc/scheme"), saider=None, cigars=None, tsgs=None)
+    assert res.calls == [("Aid", "/ksn/EAbc", dict(aid="EAbc")),
+                         ("Aid", "/ksn/EAbc", dict(aid="EAbc")),
+                         (None, "/loc/scheme", dict())]
+    assert rtr.routes[0].hits == 2
+    assert rtr.routes[1].hits == 1
+    assert rtr.routes[0].elapsed > 0.0
+
+    with pytest.raises(kering.ValidationError):
+        rtr.dispatch(Serder(r="/end/role/add"), saider=None, cigars=None, tsgs=None)
+
+
+if __name__ == "__main__":
+    test_router_find()
+    test_router_dispatch()
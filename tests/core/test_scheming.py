@@ -294,7 +294,49 @@ def test_resolution():
             schemer.verify(badload)
 
 
+
+def test_validator_cache():
+    """
+    Test compiled validators cached by schema SAID
+    """
+    sed = dict()
+    sed["$id"] = ""
+    sed["$schema"] = "http://json-schema.org/draft-07/schema#"
+    sed.update(dict(type="object", properties=dict(a=dict(type="string"))))
+
+    sce = Schemer(sed=sed, code=MtrDex.Blake3_256)
+    JSONSchema.Validators.pop(sce.said, None)
+    assert not JSONSchema.compiled(sce.said)
+    assert sce.verify(raw=b'{"a": "test"}')
+    assert JSONSchema.compiled(sce.said)
+    resolver, validator = JSONSchema.Validators[sce.said]
+    assert resolver is None
+
+    # reparsed schemer reuses compiled validator
+    sce = Schemer(raw=sce.raw)
+    assert sce.typ.validator(schema=sce.sed, said=sce.said) is validator
+    with pytest.raises(ValidationError):
+        sce.verify(raw=b'{"a": 123}')
+
+    # different resolver recompiles
+    sce.typ = JSONSchema(resolver=CacheResolver(db=None))
+    assert sce.typ.validator(schema=sce.sed, said=sce.said) is not validator
+    assert JSONSchema.Validators[sce.said][0] is sce.typ.resolver
+
+    # bounded least recently used
+    size = JSONSchema.ValidatorCacheSize
+    try:
+        JSONSchema.ValidatorCacheSize = 1
+        other = Schemer(sed=dict(sed, type="array"), code=MtrDex.Blake3_256)
+        assert other.verify(raw=b'[]')
+        assert JSONSchema.compiled(other.said)
+        assert not JSONSchema.compiled(sce.said)
+    finally:
+        JSONSchema.ValidatorCacheSize = size
+
+
 if __name__ == '__main__':
     test_json_schema()
     test_json_schema_dict()
     test_resolution()
+    test_validator_cache()
@@ -2690,6 +2690,70 @@ def test_serdery_noversion():
     """End Test"""
 
 
+def test_serder_verify_dummy():
+    """Test said verification splices dummies into raw instead of redumping"""
+    for kind in (kering.Serials.json, kering.Serials.mgpk, kering.Serials.cbor):
+        serder = SerderKERI(makify=True, ilk=kering.Ilks.icp, kind=kind,
+                            sad=dict(a=[dict(i="", d="")]))
+        sad = serder.sad
+        sad["d"] = sad["i"] = serder.Dummy * len(serder.said)
+        assert serder._dummy(["d", "i"]) == serder.dumps(sad, kind=kind)
+
+        serder = SerderKERI(raw=serder.raw)  # verifies
+        assert serder.kind == kind
+
+        raw = bytearray(serder.raw)  # tamper with said
+        index = raw.find(serder.saidb)
+        raw[index] = ord("F") if raw[index] != ord("F") else ord("E")
+        with pytest.raises(kering.ValidationError):
+            SerderKERI(raw=raw)
+
+    """End Test"""
+
+
+def test_serderkeri_derived_cache():
+    """Test derived views of SerderKERI are computed once and not shared"""
+    keys = [coring.Signer(transferable=True).verfer.qb64 for _ in range(3)]
+    ndigs = [coring.Diger(ser=key.encode("utf-8")).qb64 for key in keys]
+    sad = dict(k=keys, kt=["1/2", "1/2", "1/2"], n=ndigs, nt="2", s="3", bt="0")
+    serder = SerderKERI(makify=True, ilk=kering.Ilks.icp, sad=sad)
+
+    verfers = serder.verfers
+    assert [verfer.qb64 for verfer in verfers] == keys
+    assert verfers is not serder.verfers  # fresh list
+    assert verfers[0] is serder.verfers[0]  # cached instances
+    verfers.append(verfers[0])  # mutating returned list does not alter cache
+    assert len(serder.verfers) == 3
+
+    assert serder.tholder is serder.tholder
+    assert serder.tholder.weighted
+    assert serder.tholder.satisfy([0, 1])
+    assert serder.ntholder is serder.ntholder
+    assert serder.ntholder.num == 2
+    assert [diger.qb64 for diger in serder.ndigers] == ndigs
+    assert serder.ndigers[0] is serder.ndigers[0]
+    assert serder.sner is serder.sner
+    assert serder.sn == 3
+    assert serder.bner is serder.bner
+    assert serder.berfers == []
+
+    sad = serder.sad
+    sad["k"] = []  # mutating copy of sad does not alter serder
+    assert len(serder.verfers) == 3
+
+    sad = serder.sad
+    serder = SerderKERI(sad=sad)
+    sad["kt"] = "1"  # serder owns its sad
+    assert serder.tholder.weighted
+
+    serder = SerderKERI(makify=True, ilk=kering.Ilks.ixn, sad=dict(i=serder.pre, p=serder.said))
+    assert serder.verfers is None
+    assert serder.tholder is None
+    assert serder.berfers is None
+
+    """End Test"""
+
+
 if __name__ == "__main__":
     test_fielddom()
     test_spans()
@@ -2711,3 +2775,5 @@ if __name__ == "__main__":
     test_serder_v2()
     test_serdery()
     test_serdery_noversion()
+    test_serder_verify_dummy()
+    test_serderkeri_derived_cache()
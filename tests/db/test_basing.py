@@ -14,6 +14,7 @@ from hio.base import doing
 from tests.app import openMultiSig
 from keri.kering import Versionage
 from keri.app import habbing
+from keri.app.cli.commands import migrate
 from keri.core import coring, eventing, serdering
 from keri.core.coring import MtrDex
 from keri.core.coring import Serials, versify
@@ -2215,6 +2216,30 @@ def test_dbdict():
         del dbd[pre]
         assert pre not in dbd  # not in memory or db so read through cache misses
 
+        # bounded lru cache evicts least recently used unpinned kevers
+        db.states.pin(keys=pre, val=state)
+        lru = basing.dbdict(size=2)
+        lru.db = db
+        lru['a'] = 1
+        lru['b'] = 2
+        assert lru['a'] == 1  # a now most recently used
+        assert lru.hits == 1
+        lru['c'] = 3
+        assert list(lru.keys()) == ['a', 'c']  # b evicted
+        assert lru.evictions == 1
+
+        db.prefixes.add('a')  # pin a as locally owned
+        lru['d'] = 4
+        assert list(lru.keys()) == ['a', 'd']  # c evicted but not a
+        assert lru.evictions == 2
+
+        assert lru.get(pre).state() == state  # rehydrated from key state on miss
+        assert lru.misses == 1
+        assert list(lru.keys()) == ['a', pre]
+        assert lru.get('b') is None  # evicted and not in db
+        assert lru.misses == 2
+        db.prefixes.clear()
+
 
     assert not os.path.exists(db.path)
 
@@ -2331,6 +2356,55 @@ def test_group_members():
     """End Test"""
 
 
+def test_anchoring_seals():
+    """
+    Test .seals index of anchored seals used by findAnchoringSeal
+    """
+    with habbing.openHab(name="test", transferable=True, temp=True) as (hby, hab):
+        db = hby.db
+        said = coring.Diger(ser=b"anchored").qb64
+        seal = dict(i=hab.pre, s="0", d=said)
+        hab.interact(data=[seal])
+        hab.rotate()
+        hab.interact(data=[dict(d=said)])
+
+        assert [(seqner.sn, saider.qb64) for seqner, saider in
+                db.seals.get(keys=(hab.pre, said))] == [
+                   (1, bytes(db.getKeLast(key=snKey(hab.pre, 1))).decode()),
+                   (3, bytes(db.getKeLast(key=snKey(hab.pre, 3))).decode())]
+
+        srdr = db.findAnchoringSealEvent(hab.pre, seal=seal)
+        assert srdr.sn == 1
+        assert db.findAnchoringSealEvent(hab.pre, seal=seal, sn=2) is None
+        assert db.findAnchoringSealEvent(hab.pre, seal=dict(seal, s="1")) is None
+
+        srdr = db.findAnchoringSeal(hab.pre, seal=dict(d=said))
+        assert srdr.sn == 3
+        assert db.findAnchoringSeal(hab.pre, seal=seal).sn == 1
+        assert db.findAnchoringSeal(hab.pre, seal=dict(i=hab.pre)) is None
+
+        # fresh database is marked indexed but unmigrated one scans its KELs
+        assert db.sealsIndexed
+        db.seals.trim()
+        assert db.findAnchoringSealEvent(hab.pre, seal=seal) is None
+        db.migs.rem(keys="seals")
+        assert not db.sealsIndexed
+        assert db.findAnchoringSealEvent(hab.pre, seal=seal).sn == 1
+        assert db.findAnchoringSeal(hab.pre, seal=dict(d=said)).sn == 3
+        db.reopen(reuse=True)  # existing events so not marked on reopen
+        assert not db.sealsIndexed
+
+        # backfill migration is idempotent and marks .seals complete
+        migrate.migrateSeals(db)
+        assert db.sealsIndexed
+        assert db.findAnchoringSealEvent(hab.pre, seal=seal).sn == 1
+        assert len(db.seals.get(keys=(hab.pre, said))) == 2
+        migrate.migrateSeals(db)
+        assert len(db.seals.get(keys=(hab.pre, said))) == 2
+
+    """End Test"""
+
+
 if __name__ == "__main__":
     test_baser()
     test_clean_baser()
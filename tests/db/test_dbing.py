@@ -14,7 +14,7 @@ from  ordered_set import OrderedSet as oset
 
 from hio.base import doing
 
-from keri.db import dbing
+from keri.db import dbing, subing
 from keri.db.dbing import clearDatabaserDir, openLMDB
 from keri.db.dbing import (dgKey, onKey, fnKey, snKey, dtKey, splitKey,
                            splitKeyON, splitKeyFN, splitKeySN, splitKeyDT)
@@ -851,6 +851,79 @@ def test_lmdber():
     """ End Test """
 
 
+def test_lmdber_trans():
+    """
+    Test LMDBer unit of work transaction
+    """
+    with openLMDB() as dber:
+        db = dber.env.open_db(key=b'beta.')
+        dupdb = dber.env.open_db(key=b'gamma.', dupsort=True)
+        key = b'A'
+
+        with dber.trans():
+            assert dber.putVal(db, key, b'whatever')
+            assert dber.addIoSetVal(db, b'B', b'z')
+            assert dber.putVals(dupdb, key, [b'a', b'b'])
+            # reads inside unit of work see its uncommitted writes
+            assert bytes(dber.getVal(db, key)) == b'whatever'
+            assert [bytes(v) for v in dber.getVals(dupdb, key)] == [b'a', b'b']
+            with dber.trans():  # nested joins outer unit of work
+                assert dber.setVal(db, key, b'again')
+            assert bytes(dber.getVal(db, key)) == b'again'
+            # not committed yet so not visible to other transactions
+            with dber.env.begin(db=db) as txn:
+                assert txn.get(key) is None
+
+        assert dber._txn is None
+        assert bytes(dber.getVal(db, key)) == b'again'
+        assert dber.getIoSetVals(db, b'B') == [b'z']
+        assert [bytes(v) for v in dber.getVals(dupdb, key)] == [b'a', b'b']
+
+        # error aborts whole unit of work
+        with pytest.raises(ValueError):
+            with dber.trans():
+                assert dber.setVal(db, key, b'aborted')
+                assert dber.addIoSetVal(db, b'B', b'y')
+                raise ValueError("abort")
+
+        assert dber._txn is None
+        assert bytes(dber.getVal(db, key)) == b'again'
+        assert dber.getIoSetVals(db, b'B') == [b'z']
+
+        # interleaved and abandoned iterators inside unit of work
+        suber = subing.Suber(db=dber, subkey='delta.')
+        for k in ("a", "b", "c"):
+            assert suber.put(keys=(k,), val=k)
+
+        with dber.trans():
+            first = suber.getItemIter()
+            second = suber.getItemIter()
+            assert next(first) == (("a",), "a")
+            assert next(second) == (("a",), "a")
+            assert [val for keys, val in first] == ["b", "c"]  # exhausted
+            assert [val for keys, val in second] == ["b", "c"]  # still valid
+
+            abandoned = suber.getItemIter()
+            assert next(abandoned) == (("a",), "a")
+            assert suber.put(keys=("d",), val="d")  # write while suspended
+            assert suber.get(keys=("d",)) == "d"
+
+        del abandoned
+        assert suber.get(keys=("d",)) == "d"  # committed with unit of work
+
+        # read transaction across sub dbs
+        with dber.readTrans(db=suber.sdb) as txn:
+            assert bytes(txn.get(suber.tokey(("a",)))) == b"a"
+            assert bytes(txn.get(key, db=db)) == b'again'
+        with dber.trans():
+            assert suber.put(keys=("e",), val="e")
+            with dber.readTrans(db=suber.sdb) as txn:  # sees uncommitted writes
+                assert bytes(txn.get(suber.tokey(("e",)))) == b"e"
+
+    """ End Test """
+
+
 if __name__ == "__main__":
     test_key_funcs()
     test_lmdber()
+    test_lmdber_trans()
@@ -16,6 +16,7 @@ from keri import help, kering
 from keri.app import habbing
 from keri.core import coring, serdering
 from keri.end import ending
+from keri.help import metering
 
 logger = help.ogler.getLogger()
 
@@ -400,6 +401,30 @@ def test_get_admin():
     """Done Test"""
 
 
+def test_get_metrics():
+    """
+    Uses falcon TestClient
+    """
+    myapp = falcon.App()
+    ending.loadEnds(myapp, hby=None)
+    client = testing.TestClient(app=myapp)
+
+    rep = client.simulate_get('/metrics')
+    assert rep.status == falcon.HTTP_NOT_FOUND
+
+    help.meter.enable(sink=metering.Tally())
+    try:
+        help.meter.count("keri_parser_msgs_total", "icp")
+        rep = client.simulate_get('/metrics')
+        assert rep.status == falcon.HTTP_OK
+        assert rep.headers["Content-Type"] == "text/plain; version=0.0.4"
+        assert rep.text == ('# TYPE keri_parser_msgs_total counter\n'
+                            'keri_parser_msgs_total{kind="icp"} 1\n')
+    finally:
+        help.meter.disable()
+    """Done Test"""
+
+
 def test_get_oobi():
     """
     Uses falcon TestClient
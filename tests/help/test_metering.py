@@ -0,0 +1,123 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.help.test_metering module
+
+"""
+import pytest
+
+from keri import help, kering
+from keri.app import habbing
+from keri.core import coring, eventing, parsing
+from keri.help import metering
+
+
+def test_tally():
+    """ Test Tally aggregation and rendering """
+    tally = metering.Tally(bounds=(0.1, 1.0))
+    tally.count("keri_test_total", "icp", 1)
+    tally.count("keri_test_total", "icp", 2)
+    tally.gauge("keri_test_size", "ooes", 5)
+    tally.observe("keri_test_seconds", "icp", 0.05)
+    tally.observe("keri_test_seconds", "icp", 0.5)
+    tally.observe("keri_test_seconds", "icp", 5.0)
+
+    assert tally.counters == {("keri_test_total", "icp"): 3}
+    histogram = tally.histograms[("keri_test_seconds", "icp")]
+    assert histogram.counts == [1, 1, 1]
+    assert histogram.count == 3
+    assert histogram.sum == pytest.approx(5.55)
+
+    assert tally.render() == ('# TYPE keri_test_total counter\n'
+                              'keri_test_total{kind="icp"} 3\n'
+                              '# TYPE keri_test_size gauge\n'
+                              'keri_test_size{kind="ooes"} 5\n'
+                              '# TYPE keri_test_seconds histogram\n'
+                              'keri_test_seconds_bucket{kind="icp",le="0.1"} 1\n'
+                              'keri_test_seconds_bucket{kind="icp",le="1.0"} 2\n'
+                              'keri_test_seconds_bucket{kind="icp",le="+Inf"} 3\n'
+                              'keri_test_seconds_sum{kind="icp"} 5.55\n'
+                              'keri_test_seconds_count{kind="icp"} 3\n')
+
+    tally.clear()
+    assert tally.render() == ""
+
+    tally.count("keri_test_total", 'a"b\\c\nd', 1)  # escaped label value
+    assert tally.render() == ('# TYPE keri_test_total counter\n'
+                              'keri_test_total{kind="a\\"b\\\\c\\nd"} 1\n')
+
+
+def test_meter():
+    """ Test Meter forwarding and timed decorator """
+    meter = metering.Meter()
+    assert not meter.enabled
+    meter.count("keri_test_total")  # disabled so dropped
+    assert meter.sink is None
+
+    meter.enable()
+    tally = meter.sink
+    meter.count("keri_test_total")
+    meter.disable()
+    meter.count("keri_test_total")
+    meter.enable()
+    assert meter.sink is tally
+    assert tally.counters == {("keri_test_total", ""): 1}
+
+    @metering.timed("keri_test", label=lambda val: str(val))
+    def check(val):
+        if not val:
+            raise kering.ValidationError("bad")
+        return val
+
+    assert check(1) == 1  # help.meter disabled
+    assert not help.meter.enabled
+
+    help.meter.enable(sink=metering.Tally())
+    try:
+        assert check(1) == 1
+        with pytest.raises(kering.ValidationError):
+            check(0)
+        tally = help.meter.sink
+        assert tally.histograms[("keri_test_seconds", "1")].count == 1
+        assert tally.histograms[("keri_test_seconds", "0")].count == 1
+        assert tally.counters[("keri_test_errors_total", "ValidationError")] == 1
+    finally:
+        help.meter.disable()
+
+
+def test_metered_stages():
+    """ Test stages are metered when processing a key event """
+    with habbing.openHby(name="ctl", salt=coring.Salter(raw=b'0123456789abcdef').qb64) as ctlHby, \
+            habbing.openHby(name="val", salt=coring.Salter(raw=b'0123456789ghijkl').qb64) as valHby:
+        ctlHab = ctlHby.makeHab(name="ctl")
+        icp = ctlHab.makeOwnInception()
+        ixn = ctlHab.interact()
+
+        help.meter.enable(sink=metering.Tally())
+        try:
+            kvy = eventing.Kevery(db=valHby.db, lax=False, local=False)
+            parsing.Parser(kvy=kvy).parse(ims=bytearray(ixn))  # out of order
+            parsing.Parser(kvy=kvy).parse(ims=bytearray(icp))
+            kvy.processEscrows()
+            assert ctlHab.pre in kvy.kevers
+            assert kvy.kevers[ctlHab.pre].sn == 1
+
+            tally = help.meter.sink
+            assert tally.counters[("keri_parser_msgs_total", "icp")] == 1
+            assert tally.counters[("keri_parser_errors_total", "OutOfOrderError")] == 1
+            assert tally.histograms[("keri_parser_dispatch_seconds", "icp")].count == 1
+            assert tally.histograms[("keri_kevery_event_seconds", "ixn")].count == 2
+            assert tally.counters[("keri_kevery_event_errors_total", "OutOfOrderError")] == 1
+            assert tally.histograms[("keri_verfer_verify_seconds", coring.MtrDex.Ed25519)].count >= 2
+            assert tally.counters[("keri_escrow_attempts_total", "ooes")] == 1
+            assert tally.counters[("keri_escrow_successes_total", "ooes")] == 1
+            assert tally.gauges[("keri_escrow_size", "ooes")] == 1
+            assert tally.counters[("keri_db_writes_total", "evts")] >= 2
+            assert tally.counters[("keri_db_read_bytes_total", "evts")] > 0
+        finally:
+            help.meter.disable()
+
+
+if __name__ == "__main__":
+    test_tally()
+    test_meter()
+    test_metered_stages()
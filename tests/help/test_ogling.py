@@ -5,12 +5,14 @@ tests.help.test_ogling module
 """
 import pytest
 
+import json
 import os
 import logging
 
 from hio.help import ogling
 
 from keri import help
+from keri.help import ogling as kogling
 
 
 def test_openogler():
@@ -398,9 +400,56 @@ def test_reset_levels():
     """End Test"""
 
 
+class Serder:
+    def __init__(self):
+        self.ked = dict(t="icp", s="0")
+        self.calls = 0
+
+    def pretty(self, *, size=None):
+        self.calls += 1
+        return "pretty"
+
+
+def test_lazy_args():
+    """
+    Test lazy renderings are only computed when record is emitted
+    """
+    with ogling.openOgler(prefix='keri', level=logging.WARNING) as ogler:
+        logger = ogler.getLogger()
+        serder = Serder()
+        logger.info("accepted event=\n%s\n", kogling.pretty(serder))
+        assert serder.calls == 0  # not emitted so not rendered
+
+        lazy = kogling.pretty(serder)
+        logger.warning("accepted event=\n%s\n", lazy)
+        assert serder.calls == 1
+        assert str(lazy) == "pretty"
+        assert serder.calls == 1  # memoized
+
+        assert str(kogling.dumps(serder.ked)) == '{\n "t": "icp",\n "s": "0"\n}'
+        ims = bytearray(b"abcdef")
+        assert str(kogling.preview(ims, size=3)) == "b'abc'"
+
+        kogling.structure(ogler)
+        record = logging.makeLogRecord(dict(name="keri", levelno=logging.INFO,
+                                            levelname="INFO", msg="event=%s",
+                                            args=(kogling.pretty(serder),),
+                                            pre="EAbc"))
+        line = ogler.baseConsoleHandler.format(record)
+        fields = json.loads(line)
+        assert fields["msg"] == "event=pretty"
+        assert fields["level"] == "INFO"
+        assert fields["pre"] == "EAbc"
+
+        kogling.structure(ogler, structured=False)
+        assert ogler.baseConsoleHandler.format(record) == "keri: event=pretty"
+    """End Test"""
+
+
 if __name__ == "__main__":
     test_openogler()
     test_ogler()
     test_init_ogler()
     test_reset_levels()
+    test_lazy_args()
 
@@ -74,6 +74,11 @@ def test_exchanger():
         msgs = forwarder.mbx.getTopicMsgs(topic="EBCAFG/delegation")
         assert len(msgs) == 0  # No pathed argument, so nothing to forward.
 
+        # metric labels are bounded by registered handlers not sender routes
+        assert exc._resourceOf(fwd) == forwarder.resource
+        bad, _ = exchanging.exchange(route='/"x"\n', sender=hab.pre, payload={})
+        assert exc._resourceOf(bad) == "unknown"
+
 
 def test_hab_exchange(mockHelpingNowUTC):
     with habbing.openHby(salt=coring.Salter(raw=b'0123456789abcdef').qb64) as hby:
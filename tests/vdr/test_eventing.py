@@ -596,6 +596,24 @@ def test_tever_no_backers(mockHelpingNowUTC, mockCoringRandomNonce):
                             b'6dNMMdJxrRLovbJSCS","dt":"2021-01-01T00:00:00.000000+00:00"}')
         # assert reg.getAnc(dgkey) == b'0AAAAAAAAAAAAAAAAAAAAABAECgc6yHeTRhsKh1M7k65feWZGCf_MG0dWoei5Q6SwgqU'
 
+        # registry status index moved from issued to revoked
+        vcid = vcdig.decode("utf-8")
+        assert reg.vcss.get(vcid) == "rev"
+        assert reg.cntCreds(regk=regk, status="iss") == 0
+        assert [saider.qb64 for _, saider in reg.getCredSaidIter(regk=regk, status="rev")] == [vcid]
+
+        # credential state materialized on update matches walk of TEL
+        state = reg.vcsts.get(vcid)
+        assert state.et == Ilks.rev
+        assert state.s == "1"
+        assert state.d == rev.said
+        assert state.a == dict(s=seqner.sn, d=saider.qb64)
+        assert tev.vcState(vcid) == state
+        assert tev.walkVcState(vcid) == state
+        reg.vcsts.rem(vcid)
+        assert tev.vcState(vcid) == state  # falls back to walk
+        reg.rebuildVcStates()  # no saved credentials to rebuild from
+
 
 def test_tever_backers(mockHelpingNowUTC, mockCoringRandomNonce):
     # registry with backer and receipt
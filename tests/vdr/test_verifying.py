@@ -115,6 +115,32 @@ def test_verifier(seeder):
         for idx, cred in enumerate(creds):
             assert dcre.sad == cred["sad"]
 
+        # composite query indexes
+        schema = "EMQWEcCnVRk1hatTNyK3sIykYSrrFvafX3bHQ9Gkk1kC"
+        items = list(regery.reger.getCredSaidIter(issuer=hab.pre, schema=schema))
+        assert [saider.qb64 for _, saider in items] == [creder.said]
+        assert items[0][0] == creder.said
+        items = list(regery.reger.getCredSaidIter(issuer=hab.pre))
+        assert items[0][0] == f"{schema}.{creder.said}"
+        assert list(regery.reger.getCredSaidIter(issuer=hab.pre, last=items[0][0])) == []
+        assert regery.reger.cntCreds(subject=recp.pre, schema=schema) == 1
+        assert regery.reger.cntCreds(subject=recp.pre, schema=creder.said) == 0
+        assert regery.reger.cntCreds(issuer=hab.pre, subject=recp.pre) == 1
+        assert regery.reger.cntCreds(issuer=hab.pre, subject=hab.pre) == 0
+        assert regery.reger.cntCreds(issuer=hab.pre, status="iss") == 1
+
+        # indexes missing from database made before them are rebuilt on reopen
+        for suber in (regery.reger.iscs, regery.reger.sscs, regery.reger.rscs, regery.reger.vcss):
+            suber.trim()
+        assert regery.reger.cntCreds(issuer=hab.pre) == 0
+        regery.reger.reopen(reuse=True)
+        assert regery.reger.cntCreds(issuer=hab.pre, schema=schema) == 1
+        assert regery.reger.cntCreds(subject=recp.pre, schema=schema) == 1
+        assert regery.reger.cntCreds(issuer=hab.pre, status="iss") == 1
+        assert regery.reger.cntCreds(issuer=hab.pre, status="rev") == 0
+        assert regery.reger.cntCreds(regk=creder.regi, status="iss", schema=schema) == 1
+        assert regery.reger.vcss.get(creder.said) == "iss"
+
     """End Test"""
 
 
@@ -492,6 +518,16 @@ def test_verifier_chained_credential(seeder):
         saider = ianreg.reger.schms.get(vLeiSchema)
         assert saider[0].qb64 == vLeiCreder.said
 
+        # expand chained credential, shared chain expanded once via memo
+        memo = dict()
+        creds = ianreg.reger.cloneCreds(saids=saider + saider, db=ian.db, memo=memo)
+        assert len(creds) == 2
+        assert creds[0] is creds[1]
+        assert creds[0]["sad"] == vLeiCreder.sad
+        assert creds[0]["chains"][0]["sad"] == creder.sad
+        assert creds[0]["chains"][0] is memo[creder.said]
+        assert set(memo) == {vLeiCreder.said, creder.said}
+
         # test operators
 
         untargetedSubject = dict(